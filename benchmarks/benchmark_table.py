@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) The ttkwidgets authors 2026
+# For license see LICENSE
+"""
+Benchmarks for the Table widget
+
+Run as a stand alone script with the repository root on the PYTHONPATH:
+
+    python benchmarks/benchmark_table.py
+"""
+import time
+import tkinter as tk
+from ttkwidgets import Table, CheckboxTreeview
+
+COLUMNS = ("A", "B", "C", "D")
+
+
+def generate_rows(amount):
+    """Generate rows of values for the columns"""
+    return [(index, "b{}".format(index), index / 3, "row {}".format(index)) for index in range(amount)]
+
+
+def measure(window, widget, amount, bulk):
+    """Time the insertion of amount rows in a new widget"""
+    rows = generate_rows(amount)
+    tree = widget(window, columns=COLUMNS)
+    begin = time.perf_counter()
+    if bulk:
+        tree.insert_many("", rows)
+    else:
+        for row in rows:
+            tree.insert("", "end", values=row)
+    window.update()
+    duration = time.perf_counter() - begin
+    tree.destroy()
+    return duration
+
+
+def benchmark_insert_many(window):
+    print("insert versus insert_many")
+    for widget in (Table, CheckboxTreeview):
+        for amount in (10000, 100000, 500000):
+            single = measure(window, widget, amount, False)
+            bulk = measure(window, widget, amount, True)
+            print("  {:<16} {:>6} rows: insert {:7.2f} s, insert_many {:7.2f} s".format(
+                widget.__name__, amount, single, bulk))
+
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    root.withdraw()
+    benchmark_insert_many(root)
+    root.destroy()
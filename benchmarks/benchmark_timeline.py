@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) The ttkwidgets authors 2026
+# For license see LICENSE
+"""
+Benchmarks for the TimeLine widget
+
+Run as a stand alone script with the repository root on the PYTHONPATH:
+
+    python benchmarks/benchmark_timeline.py
+"""
+import random
+import time
+import tkinter as tk
+from ttkwidgets import TimeLine
+
+CATEGORIES = tuple("Category {}".format(index) for index in range(10))
+
+
+def generate_markers(amount, finish):
+    """Generate marker dictionaries spread evenly over the categories"""
+    random.seed(0)
+    markers = []
+    for index in range(amount):
+        start = random.uniform(0.0, finish - 10.0)
+        markers.append({
+            "category": CATEGORIES[index % len(CATEGORIES)],
+            "start": start,
+            "finish": start + random.uniform(0.5, 10.0),
+            "text": "Marker {}".format(index)
+        })
+    return markers
+
+
+def measure(window, amount, bulk, **kwargs):
+    """Time the creation of amount markers in a new TimeLine"""
+    finish = float(amount)
+    markers = generate_markers(amount, finish)
+    timeline = TimeLine(window, categories=CATEGORIES, finish=finish, **kwargs)
+    begin = time.perf_counter()
+    if bulk:
+        timeline.create_markers(markers)
+    else:
+        for marker in markers:
+            timeline.create_marker(marker.pop("category"), marker.pop("start"), marker.pop("finish"), **marker)
+    window.update()
+    duration = time.perf_counter() - begin
+    timeline.destroy()
+    return duration
+
+
+def benchmark_create_markers(window):
+    print("TimeLine.create_marker versus TimeLine.create_markers")
+    for virtual in (False, True):
+        for amount in (10000, 100000):
+            single = measure(window, amount, False, virtual=virtual)
+            bulk = measure(window, amount, True, virtual=virtual)
+            print("  {:>6} markers, virtual={!s:<5}: create_marker {:7.2f} s, create_markers {:7.2f} s".format(
+                amount, virtual, single, bulk))
+
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    root.withdraw()
+    benchmark_create_markers(root)
+    root.destroy()
@@ -91,3 +91,15 @@ class TestCheckboxTreeview(BaseWidgetTest):
         tree._check_descendant("1")
         self.assertEqual(tree.get_checked(), ["111", "112"])
         self.window.update()
+
+    def test_checkboxtreeview_insert_many(self):
+        tree = CheckboxTreeview(self.window)
+        tree.pack()
+        tree.insert("", "end", "1", text="1", tags=("checked",))
+        iids = tree.insert_many("1", [("a",), ("b",)])
+        self.window.update()
+        self.assertEqual(tree.get_children("1"), iids)
+        self.assertTrue(tree.tag_has("checked", iids[0]))
+        iids = tree.insert_many("", [("c",)], tags=("item",))
+        self.assertTrue(tree.tag_has("unchecked", iids[0]))
+        self.assertTrue(tree.tag_has("item", iids[0]))
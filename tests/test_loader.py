@@ -0,0 +1,64 @@
+# Copyright (c) The ttkwidgets authors 2026
+# For license see LICENSE
+from ttkwidgets.loader import Loader, count_lines, count_records, read_csv, read_csv_rows, read_json_lines
+from tests import BaseWidgetTest
+import os
+import tempfile
+
+
+class TestLoader(BaseWidgetTest):
+    def run_loader(self, loader):
+        loader.start()
+        while loader.running:
+            self.window.update()
+        return loader
+
+    def test_loader(self):
+        items, progress = [], []
+        loader = Loader(self.window, lambda: range(2500), items.extend, chunk_size=100, total=2500,
+                        progress_callback=lambda *args: progress.append(args))
+        self.run_loader(loader)
+        self.assertEqual(items, list(range(2500)))
+        self.assertEqual(loader.processed, 2500)
+        self.assertEqual(progress[-1], (2500, 2500))
+        self.assertIsNone(loader.error)
+        self.assertRaises(RuntimeError, loader.start)
+
+    def test_loader_error(self):
+        def source():
+            yield 1
+            raise ValueError("invalid item")
+
+        finished = []
+        loader = self.run_loader(Loader(self.window, source, lambda items: None, finish_callback=finished.append))
+        self.assertIsInstance(loader.error, ValueError)
+        self.assertEqual(finished, [loader])
+
+    def test_loader_cancel(self):
+        def process(items):
+            if loader.processed > 10:
+                loader.cancel()
+
+        loader = self.run_loader(Loader(self.window, lambda: range(100000), process))
+        self.assertTrue(loader.cancelled)
+        self.assertLess(loader.processed, 100000)
+
+    def test_readers(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "data.csv")
+        with open(path, "w") as fo:
+            fo.write("a,b\n1,2\n3,4\n")
+        self.assertEqual(count_lines(path), 3)
+        self.assertEqual(count_records(path), 3)
+        with open(path, "w") as fo:
+            fo.write('a,b\n"1\n2",3\n4,""""')
+        self.assertEqual(count_records(path), 3)
+        self.assertEqual(len(list(read_csv_rows(path))), 3)
+        with open(path, "w") as fo:
+            fo.write("a,b\n1,2\n3,4\n")
+        self.assertEqual(list(read_csv(path)), [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}])
+        self.assertEqual(list(read_csv_rows(path)), [["a", "b"], ["1", "2"], ["3", "4"]])
+        path = os.path.join(directory, "data.jsonl")
+        with open(path, "w") as fo:
+            fo.write('{"a": 1}\n\n[2]\n')
+        self.assertEqual(list(read_json_lines(path)), [{"a": 1}, [2]])
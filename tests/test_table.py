@@ -4,6 +4,8 @@
 # For license see LICENSE
 
 from ttkwidgets import Table
+import os
+import tempfile
 from tests import BaseWidgetTest
 
 
@@ -226,3 +228,251 @@ class TestTable(BaseWidgetTest):
         table.event_generate('<ButtonRelease-1>')
         self.assertFalse(table._visual_drag.winfo_ismapped())
         self.assertEqual(table.get_children(''), tuple(str(i) for i in range(10)))
+
+    def test_table_lazy_preview(self):
+        table = Table(self.window, columns=list('ABC'), lazy_preview=True)
+        table.pack()
+        for i in range(10):
+            table.insert('', 'end', str(i), values=tuple(a + str(i) for a in 'ABC'))
+        table.set('3', 'B', 'b')
+        self.window.update()
+        self.assertTrue(table['lazy_preview'])
+        self.assertEqual(table._visual_drag.get_children(''), ())
+
+        bbox = table.bbox('2')
+        table.event_generate('<ButtonPress-1>', x=bbox[0] + 5, y=bbox[1] + 5)
+        self.window.update()
+        self.assertEqual(table._visual_drag.get_children(''), ('2',))
+        table.event_generate('<Motion>', x=bbox[0] + 5, y=bbox[1] + 5 + bbox[3])
+        table.event_generate('<Motion>', x=bbox[0] + 5, y=bbox[1] + 5 + 2 * bbox[3])
+        table.event_generate('<ButtonRelease-1>')
+        self.assertEqual(table.get_children(''), ('0', '1', '3', '4', '2') + tuple(str(i) for i in range(5, 10)))
+        self.assertEqual(table._visual_drag.get_children(''), ())
+
+        table.event_generate('<ButtonPress-1>', x=10, y=5)
+        self.window.update()
+        self.assertTrue(table._visual_drag.winfo_ismapped())
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children('')[:len(table._visible_rows())])
+        self.assertEqual(table._visual_drag.set('3', 'B'), 'b')
+        table.event_generate('<ButtonRelease-1>')
+
+        table.configure(lazy_preview=False)
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+
+    def test_table_virtual(self):
+        table = Table(self.window, columns=list('AB'), height=10)
+        table.column('A', type=int)
+        table.pack()
+        rows = [(i, 'b{}'.format(i)) for i in range(100000)]
+        table.set_data(rows)
+        self.window.update()
+        children = table.get_children('')
+        self.assertLess(len(children), 100)
+        self.assertEqual(table.data_index(children[0]), 0)
+        self.assertEqual(table.set(children[1], 'B'), 'b1')
+
+        table.yview_moveto(0.5)
+        self.window.update()
+        first = table.identify_row(table.bbox(table._virtual_pool[table._virtual_top - table._virtual_base])[1] + 1)
+        self.assertEqual(table.data_index(first), 50000)
+        self.assertAlmostEqual(table.yview()[0], 0.5, places=2)
+        self.assertEqual(len(table.get_children('')), len(children))
+
+        table._sort_column('A', True)
+        table.yview_moveto(0)
+        self.window.update()
+        self.assertEqual(table.data_index(table.get_children('')[0]), 99999)
+        self.assertEqual(table.set(table.get_children('')[0], 'A'), '99999')
+        self.assertEqual(len(rows), 100000)
+
+        table.set_data(lambda i: (i, i), size=20)
+        self.window.update()
+        self.assertEqual(table.set(table.get_children('')[-1], 'B'), '19')
+        rows = rows[:30]
+        table.set_data(rows)
+        rows.extend([(i, 'c') for i in range(30, 40)])
+        table.refresh_data()
+        self.window.update()
+        self.assertEqual(table._virtual_size, 40)
+        item = table.get_children('')[0]
+        for mutator in (lambda: table.insert('', 'end', values=(1, 2)), lambda: table.insert_many('', [(1, 2)]),
+                        lambda: table.delete(item), lambda: table.detach(item), lambda: table.move(item, '', 0),
+                        lambda: table.set(item, 'A', 1), lambda: table.item(item, values=(1, 2)),
+                        lambda: table.set_children('')):
+            self.assertRaises(RuntimeError, mutator)
+        self.assertTrue(table['lazy_preview'])
+        table.set_data(None)
+        self.assertEqual(table.get_children(''), ())
+        self.assertFalse(table['lazy_preview'])
+        with self.assertRaises(ValueError):
+            table.set_data(lambda i: (i, i))
+
+    def test_table_virtual_yscrollcommand(self):
+        before, after = [], []
+        table = Table(self.window, columns=list('AB'))
+        self.assertEqual(table['style'], 'Table')
+        table.configure(yscrollcommand=lambda *args: before.append(args))
+        table.pack()
+        table.set_data([(i, i) for i in range(1000)])
+        self.window.update()
+        self.assertNotEqual(before, [])
+        table.configure(yscrollcommand=lambda *args: after.append(args))
+        table.yview_moveto(0.5)
+        self.window.update()
+        self.assertNotEqual(after, [])
+        self.assertAlmostEqual(float(after[-1][0]), 0.5, places=2)
+        table.set_data(None)
+        self.assertEqual(table.get_children(''), ())
+
+    def test_table_insert_many(self):
+        table = Table(self.window, columns=list('AB'))
+        table.pack()
+        table.insert('', 'end', 'first', values=('a', 'b'))
+        iids = table.insert_many('', [(i, 'b {}'.format(i)) for i in range(100)], tags=('new',))
+        self.window.update()
+        self.assertEqual(len(iids), 100)
+        self.assertEqual(table.get_children(''), ('first',) + iids)
+        self.assertEqual(table.set(iids[1], 'B'), 'b 1')
+        self.assertTrue(table.tag_has('new', iids[0]))
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+        iids = table.insert_many('', [('x', 'y'), ('z', 'w')], index=0)
+        self.assertEqual(table.get_children('')[:2], iids)
+        iids = table.insert_many('', [('u', 'v'), ('s', 't')], iids=('u', 's'))
+        self.assertEqual(iids, ('u', 's'))
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+
+    def test_table_sort_cache(self):
+        table = Table(self.window, columns=list('AB'))
+        table.column('A', type=int)
+        table.pack()
+        table.insert_many('', [(i % 3, i) for i in range(9)])
+        children = table.get_children('')
+        table._sort_column('A', False)
+        ascending = table.get_children('')
+        self.assertEqual([int(table.set(item, 'A')) for item in ascending], [0, 0, 0, 1, 1, 1, 2, 2, 2])
+        self.assertEqual(ascending[:3], children[::3])
+        table._sort_column('A', True)
+        # stable: equal values keep their order
+        self.assertEqual(table.get_children(''), ascending[6:] + ascending[3:6] + ascending[:3])
+        table.set(ascending[0], 'A', 5)
+        table._sort_column('A', False)
+        self.assertEqual(table.get_children('')[-1], ascending[0])
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+
+    def test_table_multi_sort(self):
+        table = Table(self.window, columns=list('AB'))
+        table.column('B', type=int)
+        table.pack()
+        for a, b in [('x', 2), ('y', 1), ('x', 1), ('y', 3)]:
+            table.insert('', 'end', a + str(b), values=(a, b))
+        table._sort_column('A', True)
+        table._add_sort_column('B')
+        self.assertEqual(table.sort_columns, [('A', True), ('B', False)])
+        self.assertEqual(table.get_children(''), ('y1', 'y3', 'x1', 'x2'))
+        table._add_sort_column('B')
+        self.assertEqual(table.get_children(''), ('y3', 'y1', 'x2', 'x1'))
+
+        table.sort_by('A', 'B')
+        table.insert('', 0, 'x0', values=('x', 0))
+        table.insert_many('', [('y', 2), ('a', 5)])
+        children = table.get_children('')
+        self.assertEqual(children[:4], (children[0], 'x0', 'x1', 'x2'))
+        self.assertEqual(table.set(children[0], 'A'), 'a')
+        self.assertEqual(str(table.set(children[5], 'B')), '2')
+        table.set('x0', 'B', 4)
+        self.assertEqual(table.get_children('')[3], 'x0')
+        table.set('x0', 'A', 'z')
+        self.assertEqual(table.get_children('')[-1], 'x0')
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+        for item in ('x1', 'y3'):
+            table.delete(item)
+            self.assertNotIn(item, table._rows)
+        table.insert('', 'end', 'x1', values=('x', 1))
+        self.assertEqual(list(table.get_children('')), table._rows)
+
+        table.move('x0', '', 0)
+        self.assertEqual(table.sort_columns, [])
+        table.insert('', 0, 'b', values=('b', 0))
+        self.assertEqual(table.get_children('')[0], 'b')
+
+    def test_table_filter(self):
+        table = Table(self.window, columns=list('AB'))
+        table.column('B', type=int)
+        table.pack()
+        words = ['apple', 'Apricot', 'banana', 'cherry', 'grape', 'pineapple']
+        for i, word in enumerate(words):
+            table.insert('', 'end', word, values=(word, i))
+        table.filter('ap')
+        self.assertEqual(table.get_children(''), ('apple', 'Apricot', 'grape', 'pineapple'))
+        table.filter('app')
+        self.assertEqual(table.get_children(''), ('apple', 'pineapple'))
+        table.filter('ap', column='A', match='prefix')
+        self.assertEqual(table.get_children(''), ('apple', 'Apricot'))
+        table.filter('3', match='exact')
+        self.assertEqual(table.get_children(''), ('cherry',))
+        table.filter(lambda item: int(table.set(item, 'B')) % 2 == 0)
+        self.assertEqual(table.get_children(''), ('apple', 'banana', 'grape'))
+
+        # sorting and inserting keep the hidden rows in place
+        table.filter('ap')
+        table._sort_column('B', True)
+        self.assertEqual(table.get_children(''), ('pineapple', 'grape', 'Apricot', 'apple'))
+        table.insert('', 'end', 'papaya', values=('papaya', 10))
+        table.insert('', 'end', 'kiwi', values=('kiwi', 11))
+        self.assertEqual(table.get_children('')[0], 'papaya')
+        table.set('kiwi', 'A', 'kiwap')
+        self.assertEqual(table.get_children('')[0], 'kiwi')
+        table.set('apple', 'A', 'pear')
+        self.assertNotIn('apple', table.get_children(''))
+        self.assertEqual(table._visual_drag.get_children(''), table.get_children(''))
+
+        # dragging a row keeps the filter
+        table.move('grape', '', 0)
+        self.assertEqual(table.sort_columns, [])
+        self.assertEqual(table.get_children('')[0], 'grape')
+        table.filter(None)
+        self.assertEqual(len(table.get_children('')), 8)
+        self.assertEqual(table.get_children('')[:3], ('grape', 'kiwi', 'papaya'))
+        with self.assertRaises(ValueError):
+            table.filter('a', match='regex')
+
+    def test_table_load(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "table.csv")
+        with open(path, "w") as fo:
+            fo.write("name,amount,price\n")
+            for i in range(2999):
+                fo.write("row {},{},{}\n".format(i, i, i / 2))
+            # beyond the rows used to detect the types, and without a line break at the end
+            fo.write("row 2999,n/a,1499.5")
+        progress = []
+        table = Table(self.window)
+        table.pack()
+        loader = table.load_csv(path, progress_callback=lambda *args: progress.append(args))
+        while loader.running:
+            self.window.update()
+        self.assertIsNone(loader.error)
+        self.assertEqual(table['columns'], ('name', 'amount', 'price'))
+        self.assertEqual(len(table.get_children('')), 3000)
+        self.assertEqual(progress[-1], (3000, 3000))
+        self.assertIs(table.column('amount', 'type'), int)
+        self.assertIs(table.column('price', 'type'), float)
+        self.assertIs(table.column('name', 'type'), str)
+        table._sort_column('amount', False)
+        self.assertEqual(table.set(table.get_children('')[-1], 'amount'), 'n/a')
+
+        table = Table(self.window, columns=('price', 'name'))
+        loader = table.load_csv(path)
+        while loader.running:
+            self.window.update()
+        item = table.get_children('')[1]
+        self.assertEqual([str(table.set(item, column)) for column in ('price', 'name')], ['0.5', 'row 1'])
+
+        finished = []
+        table = Table(self.window, columns=('A',))
+        loader = table.load_iter(((i,) for i in range(1000000)), finish_callback=finished.append)
+        self.window.update()
+        loader.cancel()
+        self.assertTrue(loader.cancelled)
+        self.assertEqual(finished, [loader])
+        self.assertLess(len(table.get_children('')), 1000000)
@@ -3,6 +3,8 @@
 from ttkwidgets import TimeLine
 from tests import BaseWidgetTest
 import tkinter as tk
+import os
+import tempfile
 
 
 class TestTimeLine(BaseWidgetTest):
@@ -63,12 +65,12 @@ class TestTimeLine(BaseWidgetTest):
     def test_timeline_zoom_in(self):
         timeline = TimeLine(self.window, categories=("category",))
         zoom_factor = timeline.zoom_factor
-        amount_ticks = len(timeline._ticks)
-        amount_items = len(timeline._canvas_ticks.find_all())
+        amount_ticks = timeline._tick_count
         timeline._button_zoom_in.invoke()
         self.assertGreater(timeline.zoom_factor, zoom_factor)
-        self.assertGreater(len(timeline._ticks), amount_ticks)
-        self.assertGreater(len(timeline._canvas_ticks.find_all()), amount_items)
+        self.assertGreater(timeline._tick_count, amount_ticks)
+        # Only the ticks in the visible range have Canvas items
+        self.assertLess(len(timeline._canvas_ticks.find_withtag("tick")), 2 * timeline._tick_count)
 
     def test_timeline_zoom_reset(self):
         timeline = TimeLine(self.window, zoom_factors=(1.0, 2.0, 5.0, 10.0), zoom_default=5.0)
@@ -133,6 +135,11 @@ class TestTimeLine(BaseWidgetTest):
         text_id = timeline.markers[iid]["text_id"]
         text = timeline._timeline.itemcget(text_id, "text")
         self.assertEqual(text, "New Text")
+        timeline.update_marker(iid, background="red", foreground="blue")
+        self.assertEqual(timeline.markers[iid]["text_id"], text_id)
+        self.assertEqual(timeline._timeline.itemcget(timeline.markers[iid]["rectangle_id"], "fill"), "red")
+        self.assertEqual(timeline._timeline.itemcget(text_id, "fill"), "blue")
+        self.assertEqual(timeline._timeline.itemcget(text_id, "text"), "New Text")
 
     def test_delete_marker(self):
         timeline = TimeLine(self.window, categories=("category",))
@@ -142,6 +149,23 @@ class TestTimeLine(BaseWidgetTest):
         self.assertTrue(iid not in timeline.markers)
         self.assertTrue(rectangle_id not in timeline._timeline.find_all())
 
+    def test_delete_markers(self):
+        timeline = TimeLine(self.window, categories=("category",), lod_threshold=5)
+        iids = timeline.create_markers({"category": "category", "start": index * 0.5, "finish": index * 0.5 + 0.2}
+                                       for index in range(10))
+        timeline.create_marker("category", 6.0, 6.001)
+        timeline.delete_markers(iids[:5])
+        self.assertEqual(len(timeline.markers), 6)
+        self.assertEqual(timeline.find_markers("category", 0.0, 2.4), [])
+        self.assertRaises(ValueError, lambda: timeline.delete_markers(iids[:1]))
+        timeline.delete_marker(tk.ALL)
+        self.assertEqual(len(timeline.markers), 0)
+        self.assertEqual(timeline._timeline.find_withtag("marker"), ())
+        self.assertEqual(timeline._timeline.find_withtag("summary"), ())
+        timeline.create_marker("category", 1.0, 2.0)
+        timeline.clear_markers()
+        self.assertEqual(len(timeline.markers), 0)
+
     def test_marker_tags(self):
         timeline = TimeLine(self.window, categories=("category",))
         self.assertRaises(ValueError, lambda: timeline.create_marker("category", 1.0, 2.0, tags=("tag",)))
@@ -172,6 +196,319 @@ class TestTimeLine(BaseWidgetTest):
         self.assertEqual(timeline.time, 2.0)
 
 
+    def test_virtual_markers(self):
+        timeline = TimeLine(self.window, categories=("category",), finish=1000.0, virtual=True)
+        near = timeline.create_marker("category", 1.0, 2.0, text="Near")
+        far = timeline.create_marker("category", 990.0, 995.0, text="Far")
+        self.assertIsNotNone(timeline.markers[near]["rectangle_id"])
+        self.assertIsNone(timeline.markers[far]["rectangle_id"])
+        timeline._set_scroll("moveto", 1.0)
+        self.assertIsNotNone(timeline.markers[far]["rectangle_id"])
+        self.assertIsNone(timeline.markers[near]["rectangle_id"])
+        timeline.delete_marker(far)
+        self.assertTrue(far not in timeline.markers)
+
+    def test_find_markers(self):
+        timeline = TimeLine(self.window, categories=("a", "b"))
+        first = timeline.create_marker("a", 1.0, 2.0)
+        second = timeline.create_marker("a", 3.0, 5.0)
+        other = timeline.create_marker("b", 1.0, 2.0)
+        self.assertEqual(timeline.find_markers("a", 0.0, 10.0), [first, second])
+        self.assertEqual(timeline.find_markers("a", 2.5, 3.5), [second])
+        self.assertEqual(timeline.find_markers("b", 1.5, 1.5), [other])
+        timeline.delete_marker(second)
+        self.assertEqual(timeline.find_markers("a", 2.5, 3.5), [])
+        self.assertRaises(ValueError, lambda: timeline.find_markers("c", 0.0, 1.0))
+        long = timeline.create_marker("a", 0.0, 90.0, iid="long")
+        self.assertEqual(timeline.find_markers("a", 50.0, 60.0), [long])
+        self.assertRaises(ValueError, lambda: timeline.create_marker("b", 4.0, 5.0, iid="long"))
+        self.assertRaises(ValueError, lambda: timeline.create_markers(
+            [{"category": "b", "start": 4.0, "finish": 5.0, "iid": "new"}] * 2))
+        self.assertEqual(timeline.find_markers("b", 0.0, 10.0), [other])
+
+    def test_zoom_rescale(self):
+        timeline = TimeLine(self.window, categories=("category",), zoom_factors=(1.0, 2.0))
+        iid = timeline.create_marker("category", 1.0, 2.0, text="This is a very long sentence.")
+        rectangle_id, text_id = timeline.markers[iid]["rectangle_id"], timeline.markers[iid]["text_id"]
+        x1, _, x2, _ = timeline._timeline.coords(rectangle_id)
+        text = timeline._timeline.itemcget(text_id, "text")
+        timeline.zoom_in()
+        self.assertEqual(timeline.markers[iid]["rectangle_id"], rectangle_id)
+        self.assertEqual(timeline._timeline.coords(rectangle_id)[0], x1 * 2)
+        self.assertEqual(timeline._timeline.coords(rectangle_id)[2], x2 * 2)
+        self.assertGreater(len(timeline._timeline.itemcget(text_id, "text")), len(text))
+        timeline.zoom_out()
+        self.assertEqual(timeline._timeline.coords(rectangle_id)[0], x1)
+        self.assertEqual(timeline._timeline.itemcget(text_id, "text"), text)
+
+    def test_fit_text(self):
+        timeline = TimeLine(self.window)
+        font = ("default", 10)
+        text = "This is a very long sentence."
+        fitted = timeline._fit_text(text, font, 60)
+        self.assertTrue(fitted.endswith("..."))
+        self.assertTrue(text.startswith(fitted[:-3]))
+        self.assertLess(timeline._measure_text(font, fitted), 60)
+        self.assertIn((font, text, 60), timeline._text_fits)
+        self.assertEqual(timeline._fit_text(text, font, 1000), text)
+
+    def test_create_markers(self):
+        timeline = TimeLine(self.window, categories=("a", "b"))
+        iids = timeline.create_markers([
+            {"category": "a", "start": 1.0, "finish": 2.0, "text": "First"},
+            {"category": "b", "start": 2.0, "finish": 3.0, "iid": "second"},
+        ])
+        self.assertEqual(len(iids), 2)
+        self.assertEqual(iids[1], "second")
+        for iid in iids:
+            self.assertTrue(iid in timeline.markers)
+            self.assertIsNotNone(timeline.markers[iid]["rectangle_id"])
+        self.assertEqual(timeline.markers[iids[0]]["text"], "First")
+        # Nothing is created if one of the markers is invalid
+        self.assertRaises(ValueError, lambda: timeline.create_markers([
+            {"category": "a", "start": 3.0, "finish": 4.0},
+            {"category": "c", "start": 1.0, "finish": 2.0}]))
+        self.assertEqual(len(timeline.markers), 2)
+        # Generated iids do not take the iids of later markers
+        timeline = TimeLine(self.window, categories=("a",))
+        iids = timeline.create_markers([
+            {"category": "a", "start": 1.0, "finish": 2.0},
+            {"category": "a", "start": 2.0, "finish": 3.0, "iid": str(timeline._iid)}])
+        self.assertEqual(len(set(iids)), 2)
+        self.assertEqual(len(timeline.markers), 2)
+
+    def test_level_of_detail(self):
+        timeline = TimeLine(self.window, categories=("category",), zoom_factors=(1.0, 10.0), lod_threshold=5)
+        iids = timeline.create_markers(
+            {"category": "category", "start": 1.0 + i * 0.02, "finish": 1.01 + i * 0.02} for i in range(10))
+        wide = timeline.create_marker("category", 5.0, 6.0)
+        for iid in iids:
+            self.assertIsNone(timeline.markers[iid]["rectangle_id"])
+        self.assertIsNotNone(timeline.markers[wide]["rectangle_id"])
+        self.assertEqual(len(timeline._timeline.find_withtag("summary")), 1)
+        timeline.zoom_in()
+        for iid in iids:
+            self.assertIsNotNone(timeline.markers[iid]["rectangle_id"])
+        self.assertEqual(len(timeline._timeline.find_withtag("summary")), 0)
+        timeline.zoom_out()
+        self.assertIsNone(timeline.markers[iids[0]]["rectangle_id"])
+        self.assertEqual(len(timeline._timeline.find_withtag("summary")), 1)
+        # Changes only redraw the summary bars close to the marker
+        far = timeline.create_marker("category", 3.0, 3.01)
+        self.assertEqual(len(timeline._timeline.find_withtag("summary")), 2)
+        close = timeline.create_marker("category", 1.21, 1.22)
+        self.assertEqual([bar[:2] for bar in timeline._summaries["category"]], [[1.0, 1.22], [3.0, 3.01]])
+        timeline.update_marker(close, start=3.02, finish=3.03)
+        self.assertEqual([bar[:2] for bar in timeline._summaries["category"]], [[1.0, 1.19], [3.0, 3.03]])
+        timeline.delete_marker(far)
+        self.assertEqual([bar[:2] for bar in timeline._summaries["category"]], [[1.0, 1.19], [3.02, 3.03]])
+        self.assertEqual(len(timeline._timeline.find_withtag("summary")), 2)
+
+    def test_nearest_lookups(self):
+        self.assertEqual(TimeLine._nearest([0.0, 100.0, 200.0], 40.0), 0.0)
+        self.assertEqual(TimeLine._nearest([0.0, 100.0, 200.0], 160.0), 200.0)
+        self.assertEqual(TimeLine._nearest([0.0, 100.0, 200.0], 500.0), 200.0)
+        self.assertIsNone(TimeLine._nearest([], 1.0))
+        timeline = TimeLine(self.window, categories=("a", "b"))
+        self.assertEqual(timeline._tick_count, 11)
+        self.assertEqual(timeline._nearest_tick(40.0), 0.0)
+        self.assertEqual(timeline._nearest_tick(60.0), 100.0)
+        self.assertEqual(timeline._nearest_tick(5000.0), 1000.0)
+        self.assertEqual(timeline._tick_indices(50.0, 250.0), (1, 3))
+        self.assertEqual(timeline._nearest_row(0), "a")
+        self.assertEqual(timeline._nearest_row(timeline._rows["b"][0] + 1), "b")
+
+    def test_append_marker(self):
+        timeline = TimeLine(self.window, categories=("category",), finish=10.0, follow=True, retention=5.0)
+        first = timeline.append_marker("category", 1.0, 2.0)
+        self.assertEqual(timeline["finish"], 10.0)
+        second = timeline.append_marker("category", 11.0, 12.0)
+        self.assertGreaterEqual(timeline["finish"], 12.0)
+        self.assertTrue(first not in timeline.markers)
+        self.assertTrue(second in timeline.markers)
+        self.assertGreater(timeline._canvas_scroll.canvasx(0), 0)
+
+    def test_compact_markers(self):
+        timeline = TimeLine(self.window, categories=("category",))
+        plain = timeline.create_marker("category", 1.0, 2.0)
+        styled = timeline.create_marker("category", 3.0, 4.0, background="red", hover_background="red",
+                                        active_background="blue")
+        self.assertIsNone(timeline._markers[plain].options)
+        self.assertEqual(timeline._markers[styled].options, {"background": "red", "active_background": "blue"})
+        markers = timeline.markers
+        self.assertEqual(markers[plain]["background"], "default")
+        self.assertEqual(markers[styled]["hover_background"], "red")
+        self.assertEqual(markers[styled]["active_background"], "blue")
+        markers[plain]["start"] = 5.0
+        self.assertEqual(timeline.markers[plain]["start"], 1.0)
+
+    def test_drag_coalescing(self):
+        moves = []
+        timeline = TimeLine(self.window, categories=("category",), max_update_rate=20)
+        timeline.tag_configure("tag", move_callback=lambda *args: moves.append(args))
+        iid = timeline.create_marker("category", 1.0, 2.0, tags=("tag",))
+        timeline.grid()
+        self.window.update()
+        timeline._drag_iid = iid
+        for x in (40, 60, 80):
+            timeline._left_motion(MockEvent(x, 5))
+        self.assertIsNotNone(timeline._motion_after_id)
+        self.assertIs(timeline._motion_event.x, 80)
+        timeline._left_release(MockEvent(80, 5))
+        self.assertIsNone(timeline._motion_after_id)
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0][1], (1.0, 2.0))
+        self.assertIsNone(timeline._drag_iid)
+
+    def test_tag_restyle(self):
+        clicks = []
+        timeline = TimeLine(self.window, categories=("category",))
+        timeline.tag_configure("tag", background="cyan", left_callback=lambda *args: clicks.append(args))
+        tagged = timeline.create_marker("category", 1.0, 2.0, tags=("tag",))
+        specific = timeline.create_marker("category", 3.0, 4.0, tags=("tag",), background="red")
+        self.assertEqual(timeline._tag_markers["tag"], {tagged, specific})
+        timeline.tag_configure("tag", background="yellow")
+        rectangle_id = timeline.markers[tagged]["rectangle_id"]
+        self.assertEqual(timeline._timeline.itemcget(rectangle_id, "fill"), "yellow")
+        rectangle_id = timeline.markers[specific]["rectangle_id"]
+        self.assertEqual(timeline._timeline.itemcget(rectangle_id, "fill"), "red")
+        self.assertEqual(timeline.call_callbacks(tagged, "left_callback", (tagged, 0, 0)), 0)
+        timeline.tag_configure("tag", left_callback=lambda *args: clicks.append(args))
+        self.assertEqual(timeline.call_callbacks(tagged, "left_callback", (tagged, 0, 0)), 1)
+        timeline.tag_configure("tag", text="Tag", foreground="blue")
+        self.assertEqual(timeline.markers[tagged]["text"], "Tag")
+        text_id = timeline.markers[tagged]["text_id"]
+        self.assertEqual(timeline._timeline.itemcget(text_id, "text"), "Tag")
+        self.assertEqual(timeline._timeline.itemcget(text_id, "fill"), "blue")
+        timeline.update_marker(specific, text="Specific")
+        timeline.tag_configure("tag", text="Other")
+        self.assertEqual(timeline.markers[tagged]["text"], "Other")
+        self.assertEqual(timeline.markers[specific]["text"], "Specific")
+        timeline.delete_marker(tagged)
+        self.assertEqual(timeline._tag_markers["tag"], {specific})
+
+    def test_tag_restyle_callback_only(self):
+        timeline = TimeLine(self.window, categories=("category",))
+        timeline.tag_configure("tag", left_callback=lambda *args: None)
+        iid = timeline.create_marker("category", 1.0, 2.0, tags=("tag",))
+        timeline.tag_configure("tag", background="cyan", text="Tag")
+        self.assertEqual(timeline.markers[iid]["background"], "cyan")
+        self.assertEqual(timeline.markers[iid]["text"], "Tag")
+        text_id = timeline.markers[iid]["text_id"]
+        self.assertEqual(timeline._timeline.itemcget(text_id, "text"), "Tag")
+
+    def test_visible_ticks(self):
+        timeline = TimeLine(self.window, categories=("category",), finish=1000.0)
+        first, last = timeline._tick_range
+        self.assertEqual(first, 0)
+        self.assertEqual(len(timeline._canvas_ticks.find_withtag("tick")), 2 * last)
+        self.assertLess(last, timeline._tick_count)
+        timeline._set_scroll("moveto", 0.5)
+        first, last = timeline._tick_range
+        self.assertGreater(first, 0)
+        self.assertEqual(len(timeline._canvas_ticks.find_withtag("tick")), 2 * (last - first))
+        self.assertIs(timeline._time_string(1.5), timeline._time_string(1.5))
+
+    def test_canvas_labels(self):
+        categories = ["category {}".format(index) for index in range(1000)]
+        timeline = TimeLine(self.window, categories=categories, canvas_labels=True)
+        self.assertEqual(len(timeline._category_labels), 0)
+        self.assertEqual(len(timeline._rows), 1000)
+        first, last = timeline._category_range
+        self.assertEqual(first, 0)
+        self.assertLess(last, 1000)
+        self.assertEqual(len(timeline._canvas_categories.find_withtag("category")), last)
+        timeline._set_scroll_v("moveto", 0.5)
+        self.assertGreater(timeline._category_range[0], 0)
+        timeline.configure(canvas_labels=False)
+        self.assertEqual(len(timeline._category_labels), 1000)
+        self.assertEqual(len(timeline._canvas_categories.find_withtag("category")), 0)
+
+    def test_load_markers(self):
+        path = os.path.join(tempfile.mkdtemp(), "markers.csv")
+        with open(path, "w") as fo:
+            fo.write("category,start,finish,text,move\n")
+            for index in range(100):
+                fo.write("{},{},{},Marker {},false\n".format(index % 2, index * 0.1, index * 0.1 + 0.05, index))
+        timeline = TimeLine(self.window, categories=(0, 1))
+        loader = timeline.load_markers(path, chunk_size=10)
+        while loader.running:
+            self.window.update()
+        self.assertIsNone(loader.error)
+        self.assertEqual(loader.total, 100)
+        self.assertEqual(len(timeline.markers), 100)
+        marker = timeline.markers[timeline.find_markers(1, 0.1, 0.1)[0]]
+        self.assertEqual(marker["text"], "Marker 1")
+        self.assertIs(marker["move"], False)
+        path = os.path.join(tempfile.mkdtemp(), "markers.jsonl")
+        with open(path, "w") as fo:
+            fo.write('{"category": 0, "start": 1.0, "finish": 2.0}\n{"category": 2, "start": 1.0, "finish": 2.0}\n')
+        loader = timeline.load_markers(path)
+        while loader.running:
+            self.window.update()
+        self.assertIsInstance(loader.error, ValueError)
+        self.assertRaises(ValueError, lambda: timeline.load_markers(path, file_format="xml"))
+
+    def test_overview(self):
+        timeline = TimeLine(self.window, categories=("a", "b"), finish=100.0, overview=True)
+        timeline.grid()
+        iid = timeline.create_marker("a", 10.0, 20.0)
+        timeline.create_marker("b", 50.0, 60.0)
+        self.window.update()
+        self.assertIsNotNone(timeline._overview_image)
+        index = timeline._overview_bin(15.0)
+        self.assertEqual([counts[index] for counts in timeline._overview_counts], [1, 0])
+        image = timeline._overview_image
+        timeline.delete_marker(iid)
+        self.window.update()
+        self.assertEqual(sum(timeline._overview_counts[0]), 0)
+        # Only the bins of the deleted marker are drawn again
+        self.assertIs(timeline._overview_image, image)
+        timeline._overview_scroll(MockEvent(timeline._width - 1, 5))
+        self.assertGreater(timeline._canvas_scroll.canvasx(0), 0)
+
+    def test_playback(self):
+        events = []
+        timeline = TimeLine(self.window, categories=("a", "b"), playback_speed=2.0)
+        timeline.tag_configure("tag", enter_callback=lambda iid, time: events.append(("enter", iid)),
+                               exit_callback=lambda iid, time: events.append(("exit", iid)))
+        passed = timeline.create_marker("a", 0.5, 0.7, tags=("tag",))
+        current = timeline.create_marker("b", 0.9, 3.0, tags=("tag",))
+        timeline.play()
+        self.assertTrue(timeline.playing)
+        clock, start = timeline._play_origin
+        timeline._play_origin = (clock - 0.5, start)
+        timeline._play_step()
+        self.assertGreaterEqual(timeline.time, 1.0)
+        self.assertEqual(events, [("enter", passed), ("enter", current), ("exit", passed)])
+        timeline.set_time(5.0)
+        self.assertEqual(events[-1], ("exit", current))
+        timeline.pause()
+        self.assertFalse(timeline.playing)
+        self.assertRaises(ValueError, lambda: timeline.play(-1.0))
+
+    def test_update_in_place(self):
+        timeline = TimeLine(self.window, categories=("one", "two"))
+        iid = timeline.create_marker("one", 1.0, 2.0, text="Text")
+        rectangle_id, text_id = timeline._markers[iid].rectangle_id, timeline._markers[iid].text_id
+        timeline.update_marker(iid, background="red")
+        self.assertEqual(timeline._timeline.itemcget(rectangle_id, "fill"), "red")
+        timeline.update_marker(iid, category="two", start=3.0, finish=4.0)
+        self.assertEqual(timeline._markers[iid].rectangle_id, rectangle_id)
+        self.assertEqual(timeline._markers[iid].text_id, text_id)
+        self.assertEqual(timeline.find_markers("two", 3.0, 4.0), [iid])
+        self.assertEqual(timeline.find_markers("one", 0.0, 10.0), [])
+        timeline.update_marker(iid, text=None)
+        self.assertIsNone(timeline._markers[iid].text_id)
+        other = timeline.create_marker("one", 5.0, 6.0)
+        timeline.update_markers({iid: {"text": "New"}, other: {"finish": 7.0, "background": "blue"}})
+        self.assertEqual(timeline._timeline.itemcget(timeline._markers[iid].text_id, "text"), "New")
+        self.assertEqual(timeline.markers[other]["finish"], 7.0)
+        self.assertRaises(ValueError, lambda: timeline.update_markers({iid: {"category": "three"}}))
+        self.assertEqual(timeline._markers[iid].category, "two")
+        self.assertEqual(timeline._timeline.itemcget(rectangle_id, "fill"), "red")
+
+
 class MockEvent(object):
     def __init__(self, x, y):
         self.x = x
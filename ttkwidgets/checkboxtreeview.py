@@ -11,7 +11,7 @@ from tkinter import ttk
 
 import os
 from PIL import Image, ImageTk
-from ttkwidgets.utilities import get_assets_directory
+from ttkwidgets.utilities import get_assets_directory, treeview_insert_many
 
 IM_CHECKED = os.path.join(get_assets_directory(), "checked.png")      # These three checkbox icons were isolated from
 IM_UNCHECKED = os.path.join(get_assets_directory(), "unchecked.png")  # Checkbox States.svg (https://commons.wikimedia.org/wiki/File:Checkbox_States.svg?uselang=en)
@@ -178,6 +178,11 @@ class CheckboxTreeview(ttk.Treeview):
                   state if no tag among 
                   ('checked', 'unchecked', 'tristate') is given.
         """
+        self._add_state_tag(parent, kw)
+        return ttk.Treeview.insert(self, parent, index, iid, **kw)
+
+    def _add_state_tag(self, parent, kw):
+        """Add the box state tag of parent to the tags in kw if they do not contain a box state tag."""
         if self.tag_has("checked", parent):
             tag = "checked"
         else:
@@ -188,7 +193,28 @@ class CheckboxTreeview(ttk.Treeview):
                   "tristate" in kw["tags"]):
             kw["tags"] += (tag,)
 
-        return ttk.Treeview.insert(self, parent, index, iid, **kw)
+    def insert_many(self, parent, rows, index="end", iids=None, **kw):
+        """
+        Creates many new items at once and return their item identifiers.
+
+        :param parent: identifier of the parent item
+        :type parent: str
+        :param rows: values of the new items
+        :type rows: iterable[sequence]
+        :param index: where in the list of parent's children to insert the first item
+        :type index: int or "end"
+        :param iids: item identifiers of the new items, generated if None
+        :type iids: None or sequence[str]
+        :param kw: options of all new items, passed on to the :meth:`ttk.Treeview.insert` method
+
+        :return: the item identifiers of the new items
+        :rtype: tuple[str]
+
+        .. note:: The items are inserted with a single Tcl call and get the
+                  same box state tag as with :meth:`~CheckboxTreeview.insert`.
+        """
+        self._add_state_tag(parent, kw)
+        return treeview_insert_many(self, parent, rows, index, iids, **kw)
 
     def get_checked(self):
         """Return the list of checked items that do not have any child."""
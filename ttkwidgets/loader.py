@@ -0,0 +1,282 @@
+"""
+Author: The ttkwidgets authors
+License: GNU GPLv3
+Source: This repository
+
+Loading of large amounts of data into widgets without blocking the Tk
+main loop.
+"""
+import csv
+import json
+import threading
+import time
+from queue import Queue, Empty, Full
+
+
+class Loader(object):
+    """
+    Load items in a worker thread and process them on the Tk thread
+
+    The items are read from the source in a worker thread, so reading,
+    parsing and validating them does not block the Tk main loop. They
+    are handed to the Tk thread in chunks and processed there in
+    ``after`` callbacks that each take about ``interval`` milliseconds,
+    so the main loop handles events in between.
+
+    Tk may only be used from the Tk thread, so the source must not call
+    any widget methods, while the process callable may.
+    """
+
+    _DONE = object()  # Sentinel put in the queue by the worker thread when done
+
+    def __init__(self, widget, source, process, chunk_size=1000, interval=8, total=None,
+                 progress_callback=None, finish_callback=None):
+        """
+        Create a Loader, call :meth:`start` to start loading
+
+        :param widget: Widget to schedule the ``after`` callbacks with
+        :type widget: tk.Widget
+        :param source: Callable returning an iterable of items, called
+            in the worker thread
+        :type source: callable
+        :param process: Callable processing a list of items, called on
+            the Tk thread
+        :type process: callable
+        :param chunk_size: Amount of items handed to the Tk thread at once
+        :type chunk_size: int
+        :param interval: Amount of milliseconds of processing per
+            ``after`` callback
+        :type interval: int
+        :param total: Total amount of items, for progress reporting. May
+            be a callable returning the total, called in the worker
+            thread before the source.
+        :type total: int or callable
+        :param progress_callback: Callback called on the Tk thread after
+            every ``after`` callback. Arguments to callback:
+            ``(processed: int, total: int or None)``
+        :type progress_callback: callable
+        :param finish_callback: Callback called on the Tk thread when
+            loading is done, has failed or has been cancelled. Arguments
+            to callback: ``(loader: Loader)``
+        :type finish_callback: callable
+        """
+        if not isinstance(chunk_size, int) or not chunk_size > 0:
+            raise ValueError("chunk_size argument is not an int larger than zero")
+        if not isinstance(interval, int) or not interval > 0:
+            raise ValueError("interval argument is not an int larger than zero")
+        self._widget = widget
+        self._source = source
+        self._process = process
+        self._chunk_size = chunk_size
+        self._interval = interval
+        self._progress_callback = progress_callback
+        self._finish_callback = finish_callback
+        self._queue = Queue(maxsize=16)  # Bounded, so the worker does not read much further than processed
+        self._cancel = threading.Event()
+        self._thread = None
+        self._after_id = None
+        self._pending = []  # Items of the current chunk that have not been processed yet
+        self._batch = 1  # Amount of items processed at once, adapted to the interval
+        self.total = total
+        self.processed = 0
+        self.error = None
+        self.cancelled = False
+        self.finished = False
+
+    @property
+    def running(self):
+        """Whether the Loader has been started and has not finished yet"""
+        return self._thread is not None and not self.finished
+
+    def start(self):
+        """
+        Start loading in the background
+
+        :return: the Loader itself
+        :rtype: Loader
+        """
+        if self._thread is not None:
+            raise RuntimeError("Loader has already been started")
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+        self._after_id = self._widget.after(self._interval, self._poll)
+        return self
+
+    def cancel(self):
+        """Stop loading, the items processed so far are kept"""
+        if self.finished:
+            return
+        self.cancelled = True
+        self._finish()
+
+    def _work(self):
+        """Read the source in chunks, runs in the worker thread"""
+        try:
+            if callable(self.total):
+                self.total = self.total()
+            chunk = []
+            for item in self._source():
+                if self._cancel.is_set():
+                    return
+                chunk.append(item)
+                if len(chunk) == self._chunk_size:
+                    self._put(chunk)
+                    chunk = []
+            if len(chunk) != 0:
+                self._put(chunk)
+        except Exception as error:
+            self.error = error
+        finally:
+            self._put(Loader._DONE)
+
+    def _put(self, item):
+        """Put an item in the queue unless cancelled, runs in the worker thread"""
+        while not self._cancel.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _poll(self):
+        """Process the available items for one interval, runs on the Tk thread"""
+        self._after_id = None
+        deadline = time.perf_counter() + self._interval / 1000
+        busy = False
+        while time.perf_counter() < deadline:
+            if len(self._pending) == 0:
+                try:
+                    chunk = self._queue.get_nowait()
+                except Empty:
+                    break
+                if chunk is Loader._DONE:
+                    self._finish()
+                    return
+                self._pending = chunk
+            busy = True
+            items, self._pending = self._pending[:self._batch], self._pending[self._batch:]
+            started = time.perf_counter()
+            try:
+                self._process(items)
+            except Exception as error:
+                self.error = error
+                self._finish()
+                return
+            self.processed += len(items)
+            if self.finished:
+                # Cancelled by the process callable
+                return
+            # Process as many items at once as fit in the rest of the interval
+            duration = (time.perf_counter() - started) / len(items)
+            remaining = deadline - time.perf_counter()
+            self._batch = max(int(remaining / duration) if duration > 0 else len(self._pending), 1)
+        if self._progress_callback is not None and busy:
+            self._progress_callback(self.processed, self.total if not callable(self.total) else None)
+        self._after_id = self._widget.after(1 if busy else self._interval, self._poll)
+
+    def _finish(self):
+        """Stop the worker thread and call the finish callback"""
+        self.finished = True
+        self._cancel.set()
+        self._pending = []
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+        if self._progress_callback is not None and not self.cancelled and self.error is None:
+            self._progress_callback(self.processed, self.total if not callable(self.total) else None)
+        if self._finish_callback is not None:
+            self._finish_callback(self)
+
+
+def count_lines(path):
+    """
+    Count the lines in a file quickly, without decoding it
+
+    :param path: Path to the file
+    :type path: str
+    :rtype: int
+    """
+    amount = 0
+    with open(path, "rb") as fi:
+        for block in iter(lambda: fi.read(1 << 20), b""):
+            amount += block.count(b"\n")
+    return amount
+
+
+def count_records(path, encoding="utf-8", quotechar='"'):
+    """
+    Count the records in a CSV file quickly, without parsing it
+
+    Line breaks inside quoted fields do not start a record, and the last
+    record is counted even if the file does not end with a line break.
+    The encoding must encode line breaks and the quote character like
+    ASCII, as UTF-8 and the Latin encodings do.
+
+    :param path: Path to the file
+    :type path: str
+    :param encoding: Encoding of the file
+    :type encoding: str
+    :param quotechar: Character used to quote fields
+    :type quotechar: str
+    :rtype: int
+    """
+    quote = quotechar.encode(encoding)
+    amount, quoted, last = 0, False, b"\n"
+    with open(path, "rb") as fi:
+        for block in iter(lambda: fi.read(1 << 20), b""):
+            # The parts between quote characters alternate between outside and inside of the quoted fields,
+            # escaped quotes are an empty part inside a field
+            parts = block.split(quote)
+            amount += sum(part.count(b"\n") for part in parts[1 if quoted else 0::2])
+            quoted = quoted != (len(parts) % 2 == 0)
+            last = block[-1:]
+    return amount + (last != b"\n")
+
+
+def read_csv(path, encoding="utf-8", **kwargs):
+    """
+    Generator for the rows of a CSV file with a header as dictionaries
+
+    :param path: Path to the file
+    :type path: str
+    :param encoding: Encoding of the file
+    :type encoding: str
+    :param kwargs: Keyword arguments for :class:`csv.DictReader`
+    :rtype: Generator[dict[str, str]]
+    """
+    with open(path, newline="", encoding=encoding) as fi:
+        for row in csv.DictReader(fi, **kwargs):
+            yield row
+
+
+def read_csv_rows(path, encoding="utf-8", **kwargs):
+    """
+    Generator for the rows of a CSV file as lists, starting with the header if any
+
+    :param path: Path to the file
+    :type path: str
+    :param encoding: Encoding of the file
+    :type encoding: str
+    :param kwargs: Keyword arguments for :func:`csv.reader`
+    :rtype: Generator[list[str]]
+    """
+    with open(path, newline="", encoding=encoding) as fi:
+        for row in csv.reader(fi, **kwargs):
+            yield row
+
+
+def read_json_lines(path, encoding="utf-8"):
+    """
+    Generator for the objects in a JSON Lines file, skipping empty lines
+
+    :param path: Path to the file
+    :type path: str
+    :param encoding: Encoding of the file
+    :type encoding: str
+    :rtype: Generator[Any]
+    """
+    with open(path, encoding=encoding) as fi:
+        for line in fi:
+            line = line.strip()
+            if line != "":
+                yield json.loads(line)
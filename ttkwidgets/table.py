@@ -9,10 +9,36 @@ Table made out of a Treeview with possibility to drag rows and columns and to so
 import tkinter as tk
 from tkinter import ttk
 from PIL import ImageTk, Image
-from ttkwidgets.utilities import get_assets_directory, os
+from bisect import bisect_left, insort
+from itertools import groupby, islice
+from ttkwidgets.utilities import get_assets_directory, treeview_insert_many, treeview_column_values, os
+from ttkwidgets.loader import Loader, count_records, read_csv_rows
 
 
 IM_DRAG = os.path.join(get_assets_directory(), "drag.png")
+TYPE_SAMPLE_SIZE = 100  # number of rows used to detect the column types when loading
+
+
+def _sample_type(values):
+    """Return int, float or str, the type all the values can be converted to for sorting."""
+    sample_type = int if values else str
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)) or value == '':
+            return str
+        if isinstance(value, str):
+            try:
+                int(value)
+                continue
+            except ValueError:
+                pass
+            try:
+                float(value)
+            except ValueError:
+                return str
+        elif isinstance(value, int):
+            continue
+        sample_type = float
+    return sample_type
 
 
 class Table(ttk.Treeview):
@@ -26,7 +52,7 @@ class Table(ttk.Treeview):
     _initialized = False  # to kwnow whether class bindings and Table layout have been created yet
 
     def __init__(self, master=None, show='headings', drag_cols=True, drag_rows=True,
-                 sortable=True, class_='Table', **kwargs):
+                 sortable=True, lazy_preview=False, class_='Table', **kwargs):
         """
         Create a Table.
 
@@ -39,8 +65,14 @@ class Table(ttk.Treeview):
         :param sortable: whether columns are sortable by clicking on their
                          headings. The sorting order depends on the type of
                          data (str, float, ...) which can be set with the column
-                         method.
+                         method. Shift-clicking on headings sorts on several
+                         columns.
         :type sortable: bool
+        :param lazy_preview: whether to only copy the rows needed for the drag preview
+                             when a drag starts, instead of copying all changes to the
+                             rows while they happen. This halves the cost of loading
+                             large tables.
+        :type lazy_preview: bool
         :param show: which parts of the treeview to show (same as the Treeview option)
         :type show: str
         :param kwargs: options to be passed on to the :class:`ttk.Treeview` initializer
@@ -56,6 +88,33 @@ class Table(ttk.Treeview):
         self._im_not_draggable = Image.new('RGBA', self._im_draggable.size)
         self._im_drag = ImageTk.PhotoImage(self._im_not_draggable, master=self)
         self._sortable = bool(sortable)
+        self._lazy_preview = bool(lazy_preview)
+
+        # virtual mode
+        self._virtual = None          # data source, None if not in virtual mode
+        self._virtual_size = 0        # number of rows in the data source
+        self._virtual_order = []      # data source indices in display order
+        self._virtual_pool = []       # identifiers of the items displaying the rows
+        self._virtual_pool_index = {}  # item identifier: index in the pool
+        self._virtual_base = 0        # display index of the row shown by the first item of the pool
+        self._virtual_shown = 0       # number of pool items attached
+        self._virtual_top = 0         # display index of the first visible row
+        self._virtual_visible = 1     # number of visible rows
+        self._virtual_yscroll = None  # yscrollcommand set by the user
+        self._virtual_lazy_preview = self._lazy_preview  # lazy_preview set by the user, restored after virtual mode
+
+        # sorting and filtering
+        self._sort_keys = {}       # column: {item (or data index in virtual mode): converted value}
+        self._str_keys = set()     # columns whose cached values could not be converted to the column type
+        self._sort_columns = []    # active sort: [(column, reverse)], most significant first
+        self._rows = None          # all top-level rows in display order, including the hidden ones,
+                                   # while a sort or a filter is active, outside virtual mode
+        self._filter = None        # active filter: predicate or (query, column, match)
+        self._hidden = set()       # rows hidden by the filter
+        self._filter_strings = {}  # column: {item: value as str}
+        self._exact_index = {}     # column: {value: set of items}
+        self._prefix_index = {}    # column: sorted list of (lowercase value, item)
+
         self._config_options()
         self._column_types = {col: str for col in self['columns']}
 
@@ -73,6 +132,7 @@ class Table(ttk.Treeview):
         self.bind("<ButtonPress-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
         self.bind("<Motion>", self._on_motion)
+        self.bind("<Shift-ButtonPress-1>", self._on_shift_press)
 
         self._dx = 0  # distance between cursor and column left border (needed to drag around self._visual_drag)
         self._dy = 0  # distance between cursor and row upper border (needed to drag around self._visual_drag)
@@ -155,14 +215,50 @@ class Table(ttk.Treeview):
             self._dragged_col_index = i2  # update dragged column index
             self._dragged_col_neighbor_widths = (left, right)
 
+    def _preview_rows(self, *items):
+        """Copy rows into the drag preview, in lazy_preview mode."""
+        for item in items:
+            self._visual_drag.insert('', 'end', item, **ttk.Treeview.item(self, item))
+
+    def _clear_preview(self):
+        """Remove all rows from the drag preview, in lazy_preview mode."""
+        self._visual_drag.delete(*self._visual_drag.get_children(''))
+
+    def _visible_rows(self):
+        """Return the rows currently displayed, from top to bottom."""
+        # find the first displayed row below the headings
+        y, item = 0, ''
+        height = self.winfo_height()
+        while item == '' and y < height:
+            item = self.identify_row(y)
+            y += 2
+        rows = []
+        while item != '':
+            bbox = self.bbox(item)
+            if not bbox:
+                break
+            rows.append(item)
+            item = self.next(item)
+        return rows
+
     def _move_dragged_row(self, item):
         """Insert dragged row at item's position."""
-        self.move(self._dragged_row, '', self.index(item))
+        if self._virtual is not None:
+            # move the row in the display order, the items stay in place
+            source = self._virtual_base + self._virtual_pool_index[self._dragged_row]
+            target = self._virtual_base + self._virtual_pool_index[item]
+            self._virtual_order.insert(target, self._virtual_order.pop(source))
+            self._clear_sort()
+            self._virtual_fill()
+            self._dragged_row = self._virtual_pool[target - self._virtual_base]
+        else:
+            self.move(self._dragged_row, '', self.index(item))
         self.see(self._dragged_row)
         bbox = self.bbox(self._dragged_row)
         self._dragged_row_y = bbox[1]
         self._dragged_row_height = bbox[3]
-        self._visual_drag.see(self._dragged_row)
+        if not self._lazy_preview:
+            self._visual_drag.see(self._dragged_row)
 
     def _on_press(self, event):
         """Start dragging column/row on left click."""
@@ -211,6 +307,10 @@ class Table(ttk.Treeview):
                 right = None
             self._dragged_col_neighbor_widths = (left, right)
             self._dx = x - event.x  # distance between cursor and column left border
+            if self._lazy_preview:
+                # only the displayed rows are needed for the preview
+                self._clear_preview()
+                self._preview_rows(*self._visible_rows())
             # configure dragged column preview
             self._visual_drag.column(self._dragged_col, width=w)
             self._visual_drag.configure(displaycolumns=[self._dragged_col])
@@ -222,7 +322,8 @@ class Table(ttk.Treeview):
                                     width=w + 2, relheight=1)
             self._visual_drag.state(('active',))
             self._visual_drag.update_idletasks()
-            self._visual_drag.yview_moveto(self.yview()[0])
+            if not self._lazy_preview:
+                self._visual_drag.yview_moveto(self.yview()[0])
         else:
             self._dragged_col = None
 
@@ -233,6 +334,10 @@ class Table(ttk.Treeview):
         self._dy = bbox[1] - event.y  # distance between cursor and row upper border
         self._dragged_row_y = bbox[1]  # y coordinate of dragged row upper border
         self._dragged_row_height = bbox[3]
+        if self._lazy_preview:
+            # only the dragged row is needed for the preview
+            self._clear_preview()
+            self._preview_rows(self._dragged_row)
         # configure dragged row preview
         self._visual_drag.configure(displaycolumns=self['displaycolumns'],
                                     height=1)
@@ -258,6 +363,8 @@ class Table(ttk.Treeview):
             self._visual_drag.place_forget()
             self._dragged_col = None
             self._dragged_row = None
+            if self._lazy_preview:
+                self._clear_preview()
 
     def _on_motion(self, event):
         """Drag around label if visible."""
@@ -334,16 +441,625 @@ class Table(ttk.Treeview):
         """Sort a column by its values"""
         if tk.DISABLED in self.state():
             return
-        # get list of (value, item) tuple where value is the value in column for the item
-        l = [(self.set(child, column), child) for child in self.get_children('')]
-        # sort list using the column type
-        l.sort(reverse=reverse, key=lambda x: self._column_types[column](x[0]))
-        # reorder items
-        for index, (val, child) in enumerate(l):
-            self.move(child, "", index)
+        if self._sort_columns == [(column, not reverse)]:
+            # already sorted in the other direction: reverse the groups of equal values,
+            # which gives the same order as a stable sort
+            items = self._virtual_order if self._virtual is not None else self._rows
+            keys = self._column_keys(column, items)
+            groups = [list(group) for key, group in groupby(items, keys.__getitem__)]
+            self._sort_columns = [(column, reverse)]
+            self._set_order([item for group in reversed(groups) for item in group])
+        else:
+            self._sort_columns = [(column, reverse)]
+            self._apply_sort()
         # reverse sorting direction for the next time
         self.heading(column, command=lambda: self._sort_column(column, not reverse))
 
+    def _add_sort_column(self, column):
+        """Add a column to the active sort, or reverse its direction if it is already sorted."""
+        if tk.DISABLED in self.state():
+            return
+        for index, (col, reverse) in enumerate(self._sort_columns):
+            if col == column:
+                self._sort_columns[index] = (col, not reverse)
+                break
+        else:
+            self._sort_columns.append((column, False))
+        self._apply_sort()
+
+    def _on_shift_press(self, event):
+        """Add the column to the sort on shift-click on its heading."""
+        if self._sortable and self.identify_region(event.x, event.y) == 'heading':
+            self._add_sort_column(ttk.Treeview.column(self, self.identify_column(event.x), 'id'))
+            return "break"
+
+    def _apply_sort(self):
+        """Sort all rows according to the active sort."""
+        if self._virtual is not None:
+            order = self._virtual_order
+        elif self._rows is not None:
+            order = self._rows
+        else:
+            order = list(ttk.Treeview.get_children(self, ''))
+        # stable sorts from the least significant column to the most significant one
+        for column, reverse in reversed(self._sort_columns):
+            order.sort(key=self._column_keys(column, order).__getitem__, reverse=reverse)
+        self._set_order(order)
+
+    def _set_order(self, order):
+        """Display the rows in order."""
+        if self._virtual is not None:
+            self._virtual_order = order
+            self._virtual_fill()
+        else:
+            self._rows = order
+            self._display_rows()
+
+    def _display_rows(self):
+        """Display the rows which are not hidden by the filter, in order."""
+        rows = [item for item in self._rows if item not in self._hidden] if self._hidden else self._rows
+        if not self._lazy_preview:
+            self._visual_drag.set_children('', *rows)
+        ttk.Treeview.set_children(self, '', *rows)
+
+    def _clear_sort(self):
+        """Stop keeping the rows sorted, because they have been reordered."""
+        self._sort_columns = []
+        if self._filter is None:
+            self._rows = None
+
+    def _sorted_position(self, item, after=True):
+        """Return the index where item belongs in the sorted rows, after (or before) the rows with equal values."""
+        keys = [(self._column_keys(column, (item,)), reverse) for column, reverse in self._sort_columns]
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            other = self._rows[middle]
+            before = not after
+            for values, reverse in keys:
+                if values[item] != values[other]:
+                    before = values[item] > values[other] if reverse else values[item] < values[other]
+                    break
+            if before:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _insert_sorted(self, item):
+        """Move a top-level item to its sorted position while a sort is active."""
+        position = self._sorted_position(item)
+        self._rows.insert(position, item)
+        if item not in self._hidden:
+            self._move_row(item, position)
+
+    def _move_row(self, item, position):
+        """
+        Display a top-level row at its position in all rows, without changing the sort or the filter.
+
+        While rows are hidden, the row is displayed before the first displayed row
+        following it, so that only the hidden rows in between are looked at.
+        """
+        if self._hidden:
+            self._hide_rows((item,))
+            following = next((row for row in islice(self._rows, position + 1, None) if row not in self._hidden), None)
+            index = 'end' if following is None else ttk.Treeview.index(self, following)
+        else:
+            index = position
+        if not self._lazy_preview:
+            self._visual_drag.move(item, '', index)
+        ttk.Treeview.move(self, item, '', index)
+
+    def _place_rows(self, items):
+        """Add consecutive top-level rows to all rows, next to the displayed rows around them."""
+        following = ttk.Treeview.next(self, items[-1])
+        if following == '':
+            self._rows.extend(items)
+        else:
+            index = self._rows.index(following)
+            self._rows[index:index] = items
+
+    def _add_rows(self, items):
+        """Add new top-level rows while a sort or a filter is active."""
+        if not self._sort_columns:
+            self._place_rows(items)
+        elif len(items) == 1:
+            self._insert_sorted(items[0])
+        else:
+            self._rows.extend(items)
+        if self._filter is not None:
+            hidden = self._unmatched(items)
+            if hidden:
+                self._hidden.update(hidden)
+                self._hide_rows(hidden)
+        if self._sort_columns and len(items) > 1:
+            # the sort is fast since the rows before the new ones are already sorted
+            self._apply_sort()
+
+    def _remove_rows(self, items):
+        """
+        Remove rows that are about to be deleted or detached from all rows.
+
+        A single row is removed at its position, found by bisection while the
+        rows are sorted, the rows are only rebuilt once for a batch of rows.
+        """
+        if self._rows is None:
+            return
+        self._hidden.difference_update(items)
+        if len(items) == 1:
+            self._remove_row(items[0])
+        elif items:
+            items = set(items)
+            self._rows = [item for item in self._rows if item not in items]
+
+    def _row_position(self, item):
+        """
+        Return the position of a row in all rows, None if it is not a top-level row.
+
+        While a sort is active, the row is looked for by bisection among the rows
+        with equal values, so the values of the item must not have changed yet.
+        """
+        if not self._sort_columns:
+            try:
+                return self._rows.index(item)
+            except ValueError:
+                return None
+        for position in range(self._sorted_position(item, False), self._sorted_position(item)):
+            if self._rows[position] == item:
+                return position
+        return None
+
+    def _remove_row(self, item):
+        """Remove a row from all rows and return whether it was found, see _row_position."""
+        position = self._row_position(item)
+        if position is None:
+            return False
+        del self._rows[position]
+        return True
+
+    def _take_row(self, item, columns=None):
+        """
+        Remove a row from all rows before its values in columns (all if None) change
+        the sort, and return whether it has to be inserted again with _update_row.
+        """
+        if self._rows is None or not self._sort_columns:
+            return False
+        if columns is not None and all(column not in columns for column, reverse in self._sort_columns):
+            return False
+        return self._remove_row(item)
+
+    def _update_row(self, item, taken=False):
+        """
+        Move a row whose values changed to its sorted position, and hide or show it according to the filter.
+
+        :param taken: whether the row has been removed from all rows by _take_row
+        :type taken: bool
+        """
+        if self._rows is None:
+            return
+        if taken:
+            self._insert_sorted(item)
+        if self._filter is not None:
+            matches = self._matches(item)
+            if matches and item in self._hidden:
+                self._hidden.discard(item)
+                self._move_row(item, self._row_position(item))
+            elif not matches and item not in self._hidden and (taken or self._row_position(item) is not None):
+                self._hidden.add(item)
+                self._hide_rows((item,))
+
+    def sort_by(self, *columns):
+        """
+        Sort the rows on columns and keep them sorted.
+
+        While the rows are sorted, rows inserted at the top-level and rows
+        whose values change are moved to their sorted position. Moving rows,
+        by dragging them for instance, stops keeping the rows sorted.
+
+        :param columns: column identifiers or (column identifier, reverse) tuples,
+                        most significant first. No columns to stop keeping the
+                        rows sorted.
+        :type columns: str or tuple[str, bool]
+        """
+        sort_columns = []
+        for column in columns:
+            column, reverse = (column, False) if isinstance(column, str) else column
+            sort_columns.append((ttk.Treeview.column(self, column, 'id'), bool(reverse)))
+        if not sort_columns:
+            self._clear_sort()
+            return
+        self._sort_columns = sort_columns
+        self._apply_sort()
+
+    @property
+    def sort_columns(self):
+        """Active sort as a list of (column identifier, reverse) tuples, most significant first."""
+        return list(self._sort_columns)
+
+    def filter(self, query=None, column=None, match='substring'):
+        """
+        Only display the top-level rows matching a query.
+
+        The values of the rows are indexed per column, so that typing in a
+        filter box stays fast on large tables: exact and prefix queries are
+        looked up in the indexes, and a substring query that extends the
+        previous one only looks at the rows displayed so far. Sorting and
+        dragging rows work on the displayed rows, the hidden rows keep their
+        place among them. Rows inserted or modified while the filter is
+        active are hidden if they do not match.
+
+        :param query: text to look for in the values of the rows, or function
+                      called with an item identifier and returning whether
+                      the row should be displayed. None to display all rows.
+        :type query: str or callable
+        :param column: identifier of the column to look in, all columns if None
+        :type column: str
+        :param match: how the values are compared to the query: "exact", or
+                      case-insensitive "prefix" or "substring"
+        :type match: str
+        """
+        if query is None:
+            if self._filter is not None:
+                self._filter = None
+                if self._hidden:
+                    self._hidden = set()
+                    self._display_rows()
+                if not self._sort_columns:
+                    self._rows = None
+            return
+        if self._virtual is not None:
+            raise RuntimeError("Rows cannot be filtered in virtual mode")
+        if match not in ('exact', 'prefix', 'substring'):
+            raise ValueError("match argument is not 'exact', 'prefix' or 'substring'")
+        if self._rows is None:
+            self._rows = list(ttk.Treeview.get_children(self, ''))
+        previous = self._filter
+        if callable(query):
+            self._filter = query
+        else:
+            self._filter = (str(query), None if column is None else ttk.Treeview.column(self, column, 'id'), match)
+        matched = self._filter_matches(previous)
+        hide = [item for item in self._rows if item not in self._hidden and item not in matched]
+        show = [item for item in self._hidden if item in matched]
+        self._hidden.difference_update(show)
+        self._hidden.update(hide)
+        if show:
+            self._display_rows()
+        elif hide:
+            self._hide_rows(hide)
+
+    def _filter_matches(self, previous):
+        """Return the set of rows matching the filter, previous being the filter applied before."""
+        if callable(self._filter):
+            return {item for item in self._rows if self._filter(item)}
+        query, column, match = self._filter
+        matched = set()
+        for col in self._filter_columns():
+            if match == 'exact':
+                matched.update(self._exact(col).get(query, ()))
+            elif match == 'prefix':
+                query_lower = query.lower()
+                index = self._prefix(col)
+                start, end = bisect_left(index, (query_lower,)), bisect_left(index, (query_lower + '\U0010ffff',))
+                matched.update(item for value, item in index[start:end])
+            else:
+                query_lower = query.lower()
+                if previous is not None and not callable(previous) and previous[1:] == self._filter[1:] \
+                        and previous[0].lower() in query_lower:
+                    # the query has been extended: only the displayed rows can match
+                    candidates = [item for item in self._rows if item not in self._hidden]
+                else:
+                    candidates = self._rows
+                strings = self._column_strings(col, candidates)
+                matched.update(item for item in candidates if query_lower in strings[item].lower())
+        return matched
+
+    def _filter_columns(self):
+        """Return the columns the filter looks in."""
+        column = self._filter[1]
+        return (column,) if column is not None else self['columns']
+
+    def _matches(self, item):
+        """Return whether a row matches the filter."""
+        if callable(self._filter):
+            return bool(self._filter(item))
+        query, column, match = self._filter
+        query_lower = query.lower()
+        for col in self._filter_columns():
+            value = self._column_strings(col, (item,))[item]
+            if match == 'exact':
+                if value == query:
+                    return True
+            elif match == 'prefix':
+                if value.lower().startswith(query_lower):
+                    return True
+            elif query_lower in value.lower():
+                return True
+        return False
+
+    def _unmatched(self, items):
+        """Return the rows among items which do not match the filter."""
+        if not callable(self._filter):
+            for col in self._filter_columns():
+                self._column_strings(col, items)  # fetch the values of all rows at once
+        return [item for item in items if not self._matches(item)]
+
+    def _hide_rows(self, items):
+        """Detach rows hidden by the filter."""
+        if not self._lazy_preview:
+            self._visual_drag.detach(*items)
+        ttk.Treeview.detach(self, *items)
+
+    def _column_strings(self, column, items):
+        """Return the cached values of the items in column as str, updating the indexes."""
+        strings = self._filter_strings.setdefault(column, {})
+        missing = [item for item in items if item not in strings]
+        if missing:
+            values = dict(zip(missing, map(str, treeview_column_values(self, column, missing))))
+            strings.update(values)
+            exact, prefix = self._exact_index.get(column), self._prefix_index.get(column)
+            for item, value in values.items():
+                if exact is not None:
+                    exact.setdefault(value, set()).add(item)
+                if prefix is not None:
+                    insort(prefix, (value.lower(), item))
+        return strings
+
+    def _exact(self, column):
+        """Return the index of the rows by value in column."""
+        if column not in self._exact_index:
+            index = {}
+            for item, value in self._column_strings(column, self._rows).items():
+                index.setdefault(value, set()).add(item)
+            self._exact_index[column] = index
+        return self._exact_index[column]
+
+    def _prefix(self, column):
+        """Return the sorted list of (lowercase value, item) of the rows in column."""
+        if column not in self._prefix_index:
+            strings = self._column_strings(column, self._rows)
+            self._prefix_index[column] = sorted((value.lower(), item) for item, value in strings.items())
+        return self._prefix_index[column]
+
+    def _column_keys(self, column, items):
+        """
+        Return the cached values of the items in column, converted with the column type.
+
+        If a value cannot be converted, all the values of the column are
+        compared as strings until the cache is emptied.
+        """
+        keys = self._sort_keys.setdefault(column, {})
+        if not keys:
+            self._str_keys.discard(column)
+        missing = [item for item in items if item not in keys]
+        if missing:
+            values = self._column_values(column, missing)
+            try:
+                convert = str if column in self._str_keys else self._column_types[column]
+                keys.update(zip(missing, [convert(value) for value in values]))
+            except (TypeError, ValueError):
+                self._str_keys.add(column)
+                cached = list(keys)
+                keys.update(zip(cached, map(str, self._column_values(column, cached))))
+                keys.update(zip(missing, map(str, values)))
+        return keys
+
+    def _column_values(self, column, items):
+        """Return the values of the items (or data indices in virtual mode) in column."""
+        if self._virtual is not None:
+            index = list(self["columns"]).index(column)
+            return [self._virtual_values(i)[index] for i in items]
+        return treeview_column_values(self, column, items)
+
+    def _forget_values(self, items, column=None):
+        """Remove the items from the caches and indexes of values, because their values changed."""
+        for col, keys in self._sort_keys.items():
+            if column is None or col == column:
+                for item in items:
+                    keys.pop(item, None)
+        for col, strings in self._filter_strings.items():
+            if column is not None and col != column:
+                continue
+            exact, prefix = self._exact_index.get(col), self._prefix_index.get(col)
+            for item in items:
+                value = strings.pop(item, None)
+                if value is None:
+                    continue
+                if exact is not None:
+                    exact.get(value, set()).discard(item)
+                if prefix is not None:
+                    index = bisect_left(prefix, (value.lower(), item))
+                    if index < len(prefix) and prefix[index][1] == item:
+                        del prefix[index]
+
+    def set_data(self, data, size=None):
+        """
+        Display the rows of a data source in virtual mode.
+
+        In virtual mode, only the visible rows and a buffer of rows above
+        and below them exist as items of the Treeview. When scrolling, these
+        items are reused to display other rows, so that tables with millions
+        of rows can be displayed. Sorting and dragging rows change the
+        display order of the rows, the data source itself is not modified.
+        All existing items are deleted and the drag preview only contains
+        the rows needed during a drag, like with the lazy_preview option.
+        The items cannot be inserted, deleted, moved or modified in
+        virtual mode, these methods raise a RuntimeError. The lazy_preview
+        option set by the user is restored when leaving virtual mode.
+
+        The identifiers of the items do not correspond to rows, use
+        :meth:`~Table.data_index` to get the index of the row displayed
+        by an item.
+
+        :param data: sequence of rows, each row being a sequence of values
+                     in the order of the columns, or a function returning
+                     the row for a given index. None to leave virtual mode.
+        :type data: sequence[sequence] or callable
+        :param size: number of rows, required if data is a function
+        :type size: int
+        """
+        if callable(data) and size is None:
+            raise ValueError("size argument is required if data is callable")
+        ttk.Treeview.delete(self, *ttk.Treeview.get_children(self, ''))
+        self._clear_preview()
+        self._virtual_pool, self._virtual_pool_index = [], {}
+        self._virtual_base = self._virtual_top = self._virtual_shown = 0
+        self._sort_keys.clear()
+        self._filter, self._hidden = None, set()
+        self._clear_sort()
+        if data is None:
+            if self._virtual is not None:
+                self._virtual = None
+                self._virtual_order = []
+                ttk.Treeview.configure(self, yscrollcommand=self._virtual_yscroll or '')
+                self._config_lazy_preview(self._virtual_lazy_preview)
+            return
+        if self._virtual is None:
+            # intercept the scrolling of the Treeview to translate it to rows of the data source
+            self._virtual_yscroll = ttk.Treeview.cget(self, 'yscrollcommand') or None
+            ttk.Treeview.configure(self, yscrollcommand=self._virtual_scrolled)
+            self._virtual_lazy_preview = self._lazy_preview
+            self._lazy_preview = True
+        self._virtual = data
+        self._virtual_size = len(data) if size is None else size
+        self._virtual_order = list(range(self._virtual_size))
+        self._virtual_visible = int(ttk.Treeview.cget(self, 'height'))
+        self._virtual_resize(3 * self._virtual_visible)
+
+    def refresh_data(self, size=None):
+        """
+        Update the displayed rows after the data source has changed.
+
+        Rows added at the end of the data source are displayed at the end,
+        rows removed from the end are no longer displayed.
+
+        :param size: new number of rows, if the data source is a function
+        :type size: int
+        """
+        if self._virtual is None:
+            raise RuntimeError("Table is not in virtual mode")
+        size = len(self._virtual) if size is None else size
+        if size > self._virtual_size:
+            self._virtual_order.extend(range(self._virtual_size, size))
+        elif size < self._virtual_size:
+            self._virtual_order = [index for index in self._virtual_order if index < size]
+        self._virtual_size = size
+        self._sort_keys.clear()
+        if self._sort_columns:
+            self._apply_sort()
+        else:
+            self._virtual_fill()
+
+    def data_index(self, item):
+        """
+        Return the index in the data source of the row displayed by an item in virtual mode.
+
+        :param item: item's identifier
+        :type item: str
+        :rtype: int
+        """
+        return self._virtual_order[self._virtual_base + self._virtual_pool_index[item]]
+
+    def _check_not_virtual(self):
+        """Raise a RuntimeError if the items are managed by the data source of the virtual mode."""
+        if self._virtual is not None:
+            raise RuntimeError("Items cannot be modified in virtual mode, "
+                               "change the data source and call refresh_data instead")
+
+    def _virtual_values(self, index):
+        """Return the values of a row of the data source."""
+        return self._virtual(index) if callable(self._virtual) else self._virtual[index]
+
+    def _virtual_resize(self, size):
+        """Create items until the pool contains size items."""
+        while len(self._virtual_pool) < size:
+            item = ttk.Treeview.insert(self, '', 'end')
+            self._virtual_pool_index[item] = len(self._virtual_pool)
+            self._virtual_pool.append(item)
+        self._virtual_recenter(self._virtual_top)
+
+    def _virtual_fill(self):
+        """Display the rows starting at the base of the pool in the items of the pool."""
+        self._virtual_shown = shown = max(min(len(self._virtual_pool), self._virtual_size - self._virtual_base), 0)
+        ttk.Treeview.set_children(self, '', *self._virtual_pool[:shown])
+        for item, display_index in zip(self._virtual_pool, range(self._virtual_base, self._virtual_base + shown)):
+            values = self._virtual_values(self._virtual_order[display_index])
+            ttk.Treeview.item(self, item, values=tuple(values))
+
+    def _virtual_recenter(self, top):
+        """Move the pool so that the visible rows starting at top are in its middle."""
+        pool = self._virtual_pool
+        # keep the selection on the same rows
+        selection = [self._virtual_base + self._virtual_pool_index[item] for item in self.selection()
+                     if item in self._virtual_pool_index]
+        focus = self.focus()
+        focus = self._virtual_base + self._virtual_pool_index[focus] if focus in self._virtual_pool_index else None
+        top = min(max(top, 0), max(self._virtual_size - self._virtual_visible, 0))
+        self._virtual_base = min(max(top - self._virtual_visible, 0), max(self._virtual_size - len(pool), 0))
+        self._virtual_fill()
+        base, shown = self._virtual_base, self._virtual_shown
+        self.selection_set([pool[index - base] for index in selection if base <= index < base + shown])
+        if focus is not None and base <= focus < base + shown:
+            self.focus(pool[focus - base])
+        self._virtual_top = top
+        if shown != 0:
+            ttk.Treeview.yview(self, 'moveto', (top - base) / shown)
+
+    def _virtual_scrolled(self, first, last):
+        """Translate the scrolling of the Treeview to the rows of the data source (yscrollcommand)."""
+        shown = self._virtual_shown
+        first, last = float(first), float(last)
+        self._virtual_top = top = self._virtual_base + int(round(first * shown))
+        self._virtual_visible = visible = max(int(round((last - first) * shown)), 1)
+        if 3 * visible > len(self._virtual_pool) and len(self._virtual_pool) < self._virtual_size:
+            # the Treeview has been enlarged
+            self._virtual_resize(3 * visible)
+            return
+        if (top - self._virtual_base < visible and self._virtual_base > 0) or \
+                (self._virtual_base + shown - top - visible < visible and self._virtual_base + shown < self._virtual_size):
+            # the visible rows are close to the edge of the pool
+            self._virtual_recenter(top)
+            return
+        if self._virtual_yscroll is not None:
+            first, last = self.yview()
+            if callable(self._virtual_yscroll):
+                self._virtual_yscroll(first, last)
+            else:
+                self.tk.call(self._virtual_yscroll, first, last)
+
+    def yview(self, *args):
+        """
+        Query or change the vertical position of the Treeview.
+
+        In virtual mode, the position is relative to all the rows of the data source.
+        """
+        if self._virtual is None:
+            return ttk.Treeview.yview(self, *args)
+        size = self._virtual_size
+        if not args:
+            if size == 0:
+                return 0.0, 1.0
+            return self._virtual_top / size, min((self._virtual_top + self._virtual_visible) / size, 1.0)
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * size)
+        else:  # scroll
+            amount = int(args[1])
+            top = self._virtual_top + amount * (self._virtual_visible if args[2].startswith('page') else 1)
+        top = min(max(top, 0), max(size - self._virtual_visible, 0))
+        base, shown = self._virtual_base, self._virtual_shown
+        if base <= top and top + self._virtual_visible <= base + shown:
+            ttk.Treeview.yview(self, 'moveto', (top - base) / shown)
+        else:
+            self._virtual_recenter(top)
+
+    def yview_moveto(self, fraction):
+        """Adjust the view so that fraction of the total height is off-screen to the top."""
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        """Shift the view by number units or pages."""
+        self.yview('scroll', number, what)
+
     @property
     def _displayed_cols(self):
         displayed_cols = list(self["displaycolumns"])
@@ -367,6 +1083,8 @@ class Table(ttk.Treeview):
             return self._drag_cols
         elif key == 'drag_rows':
             return self._drag_rows
+        elif key == 'lazy_preview':
+            return self._lazy_preview
         else:
             return ttk.Treeview.cget(self, key)
 
@@ -397,6 +1115,9 @@ class Table(ttk.Treeview):
         elif 'type' in kw:
             config = True
             self._column_types[column] = kw.pop('type')
+            self._sort_keys.pop(column, None)
+            if any(col == column for col, reverse in self._sort_columns):
+                self._apply_sort()
         if kw:
             self._visual_drag.column(ttk.Treeview.column(self, column, 'id'), option, **kw)
         if kw or option:
@@ -419,6 +1140,8 @@ class Table(ttk.Treeview):
             return 'drag_rows', self._drag_rows
         elif cnf == 'sortable':
             return 'sortable', self._sortable
+        elif cnf == 'lazy_preview':
+            return 'lazy_preview', self._lazy_preview
 
         if isinstance(cnf, dict):
             kwargs = cnf.copy()
@@ -436,7 +1159,23 @@ class Table(ttk.Treeview):
         if drag_cols != self._drag_cols:
             self._config_drag_cols(drag_cols)
         self._drag_rows = bool(kwargs.pop("drag_rows", self._drag_rows))
+        if "lazy_preview" in kwargs:
+            lazy_preview = bool(kwargs.pop("lazy_preview"))
+            if self._virtual is not None:
+                # applied when leaving virtual mode
+                self._virtual_lazy_preview = lazy_preview
+            elif lazy_preview != self._lazy_preview:
+                self._config_lazy_preview(lazy_preview)
+        if self._virtual is not None and 'yscrollcommand' in kwargs:
+            # the Treeview scrolling is translated to the data source in virtual mode
+            self._virtual_yscroll = kwargs.pop('yscrollcommand') or None
         if 'columns' in kwargs:
+            self.filter(None)
+            self._sort_keys.clear()
+            self._filter_strings.clear()
+            self._exact_index.clear()
+            self._prefix_index.clear()
+            self._clear_sort()
             # update column type dict
             for col in list(self._column_types.keys()):
                 if col not in kwargs['columns']:
@@ -465,6 +1204,19 @@ class Table(ttk.Treeview):
             self.heading(col, command=command)
         self._sortable = sortable
 
+    def _config_lazy_preview(self, lazy_preview):
+        """Configure a new lazy_preview state"""
+        self._lazy_preview = lazy_preview
+        self._clear_preview()
+        if not lazy_preview:
+            # copy all rows to the preview again
+            parents = ['']
+            while parents:
+                parent = parents.pop()
+                for item in ttk.Treeview.get_children(self, parent):
+                    self._visual_drag.insert(parent, 'end', item, **ttk.Treeview.item(self, item))
+                    parents.append(item)
+
     def _config_drag_cols(self, drag_cols):
         """Configure a new drag_cols state"""
         self._drag_cols = drag_cols
@@ -483,8 +1235,12 @@ class Table(ttk.Treeview):
         :param items: list of item identifiers
         :type items: sequence[str]
         """
-        self._visual_drag.delete(*items)
+        self._check_not_virtual()
+        self._remove_rows(items)
+        if not self._lazy_preview:
+            self._visual_drag.delete(*items)
         ttk.Treeview.delete(self, *items)
+        self._forget_values(items)
 
     def detach(self, *items):
         """
@@ -497,8 +1253,12 @@ class Table(ttk.Treeview):
         :param items: list of item identifiers
         :type items: sequence[str]
         """
-        self._visual_drag.detach(*items)
+        self._check_not_virtual()
+        self._remove_rows(items)
+        if not self._lazy_preview:
+            self._visual_drag.detach(*items)
         ttk.Treeview.detach(self, *items)
+        self._forget_values(items)
 
     def heading(self, column, option=None, **kw):
         """
@@ -538,9 +1298,61 @@ class Table(ttk.Treeview):
         
         :return: the item identifier of the newly created item
         :rtype: str
+
+        .. note:: While the rows are kept sorted (see :meth:`~Table.sort_by`),
+                  top-level items are inserted at their sorted position
+                  instead of index. While a filter is active (see
+                  :meth:`~Table.filter`), they are hidden if they do not match.
         """
-        self._visual_drag.insert(parent, index, iid, **kw)
-        return ttk.Treeview.insert(self, parent, index, iid, **kw)
+        self._check_not_virtual()
+        managed = self._rows is not None and parent == ''
+        if managed and self._sort_columns:
+            index = 'end'
+        if not self._lazy_preview:
+            self._visual_drag.insert(parent, index, iid, **kw)
+        iid = ttk.Treeview.insert(self, parent, index, iid, **kw)
+        self._forget_values((iid,))
+        if managed:
+            self._add_rows((iid,))
+        return iid
+
+    def insert_many(self, parent, rows, index='end', iids=None, **kw):
+        """
+        Create many new items at once and return their item identifiers.
+
+        The items are inserted with a single Tcl call (two without lazy_preview),
+        which is much faster than calling :meth:`~Table.insert` for each row.
+
+        :param parent: identifier of the parent item
+        :type parent: str
+        :param rows: values of the new items
+        :type rows: iterable[sequence]
+        :param index: where in the list of parent's children to insert the first item
+        :type index: int or "end"
+        :param iids: item identifiers of the new items, generated if None
+        :type iids: None or sequence[str]
+        :param kw: options of all new items: see :meth:`~Table.item`
+
+        :return: the item identifiers of the new items
+        :rtype: tuple[str]
+
+        .. note:: While the rows are kept sorted (see :meth:`~Table.sort_by`),
+                  top-level items are inserted at their sorted position
+                  instead of index. While a filter is active (see
+                  :meth:`~Table.filter`), they are hidden if they do not match.
+        """
+        self._check_not_virtual()
+        managed = self._rows is not None and parent == ''
+        if managed and self._sort_columns:
+            index = 'end'
+        rows = tuple(tuple(row) for row in rows)
+        iids = treeview_insert_many(self, parent, rows, index, iids, **kw)
+        if not self._lazy_preview:
+            treeview_insert_many(self._visual_drag, parent, rows, index, iids, **kw)
+        self._forget_values(iids)
+        if managed and iids:
+            self._add_rows(iids)
+        return iids
 
     def item(self, item, option=None, **kw):
         """
@@ -562,12 +1374,142 @@ class Table(ttk.Treeview):
         :type tags: sequence[str]
         """
         if kw:
+            self._check_not_virtual()
+        taken = 'values' in kw and self._take_row(item)
+        if kw and not self._lazy_preview:
             self._visual_drag.item(item, option, **kw)
-        return ttk.Treeview.item(self, item, option, **kw)
+        res = ttk.Treeview.item(self, item, option, **kw)
+        if 'values' in kw:
+            self._forget_values((item,))
+            self._update_row(item, taken)
+        return res
 
     def keys(self):
         keys = list(ttk.Treeview.keys(self))
-        return keys + ['sortable', 'drag_cols']
+        return keys + ['sortable', 'drag_cols', 'lazy_preview']
+
+    def load_csv(self, path, encoding='utf-8', chunk_size=1000, detect_types=True,
+                 progress_callback=None, finish_callback=None, **kwargs):
+        """
+        Insert the rows of a CSV file with a header in the background.
+
+        The values are matched to the columns by the names in the header,
+        and the columns are created from the header if the Table has none.
+        See :meth:`~Table.load_iter` for the loading itself.
+
+        :param path: path to the file
+        :type path: str
+        :param encoding: encoding of the file
+        :type encoding: str
+        :param chunk_size: number of rows read at once
+        :type chunk_size: int
+        :param detect_types: whether to set the types of the columns (see
+                             :meth:`~Table.column`) to int, float or str
+                             from the first rows
+        :type detect_types: bool
+        :param progress_callback: function called periodically while loading
+                                  with (loaded rows, total rows)
+        :type progress_callback: function
+        :param finish_callback: function called with the loader when loading
+                                is done, has failed or has been cancelled
+        :type finish_callback: function
+        :param kwargs: keyword arguments for :func:`csv.reader`
+        :return: the running loader, call its cancel method to stop loading
+        :rtype: ~ttkwidgets.loader.Loader
+        """
+        def rows(state):
+            reader = read_csv_rows(path, encoding, **kwargs)
+            header = next(reader, [])
+            if not state['columns']:
+                state['columns'] = tuple(header)
+                return reader
+            indexes = [header.index(column) if column in header else None for column in state['columns']]
+            return (tuple(row[i] if i is not None and i < len(row) else '' for i in indexes) for row in reader)
+
+        return self._load(rows, lambda: max(count_records(path, encoding, kwargs.get('quotechar', '"')) - 1, 0),
+                          chunk_size, detect_types,
+                          progress_callback, finish_callback)
+
+    def load_iter(self, iterable, total=None, chunk_size=1000, detect_types=True,
+                  progress_callback=None, finish_callback=None):
+        """
+        Insert rows from an iterable in the background.
+
+        The iterable is consumed in a worker thread, and the rows are
+        inserted at the end of the Table by :meth:`~Table.insert_many` in
+        ``after`` callbacks of about 8 ms, so the Table stays responsive
+        while loading many rows.
+
+        :param iterable: rows, each row being a sequence of values in the
+                         order of the columns. It is consumed in a worker
+                         thread, so it may not use Tk.
+        :type iterable: iterable[sequence]
+        :param total: number of rows for progress reporting, the length of
+                      iterable if None and it has one
+        :type total: int
+        :param chunk_size: number of rows read at once
+        :type chunk_size: int
+        :param detect_types: whether to set the types of the columns (see
+                             :meth:`~Table.column`) to int, float or str
+                             from the first rows
+        :type detect_types: bool
+        :param progress_callback: function called periodically while loading
+                                  with (loaded rows, total rows or None)
+        :type progress_callback: function
+        :param finish_callback: function called with the loader when loading
+                                is done, has failed or has been cancelled
+        :type finish_callback: function
+        :return: the running loader, call its cancel method to stop loading
+        :rtype: ~ttkwidgets.loader.Loader
+        """
+        if total is None and hasattr(iterable, '__len__'):
+            total = len(iterable)
+        return self._load(lambda state: iterable, total, chunk_size, detect_types,
+                          progress_callback, finish_callback)
+
+    def _load(self, rows, total, chunk_size, detect_types, progress_callback, finish_callback):
+        """Insert the rows returned by rows(state) in the background, see load_iter."""
+        self._check_not_virtual()
+        # state shared with the worker thread, only read on the Tk thread once rows arrived
+        state = {'columns': tuple(self['columns']), 'types': None, 'ready': False}
+
+        def source():
+            iterator = iter(rows(state))
+            sample = list(islice(iterator, TYPE_SAMPLE_SIZE))
+            if detect_types:
+                state['types'] = [_sample_type([row[i] if i < len(row) else '' for row in sample])
+                                  for i in range(len(state['columns']))]
+            for row in sample:
+                yield row
+            for row in iterator:
+                yield row
+
+        def prepare():
+            # set up the columns on the Tk thread before inserting the first rows
+            state['ready'] = True
+            columns = state['columns']
+            if columns != tuple(self['columns']):
+                self.configure(columns=columns)
+                for column in columns:
+                    self.heading(column, text=column)
+                self._config_sortable(self._sortable)
+            for column, column_type in zip(columns, state['types'] or ()):
+                self.column(column, type=column_type)
+
+        def process(items):
+            if not state['ready']:
+                prepare()
+            self.insert_many('', items)
+
+        def finish(loader):
+            if not state['ready'] and loader.error is None and not loader.cancelled:
+                prepare()  # no rows
+            if finish_callback is not None:
+                finish_callback(loader)
+
+        loader = Loader(self, source, process, chunk_size=chunk_size, total=total,
+                        progress_callback=progress_callback, finish_callback=finish)
+        return loader.start()
 
     def move(self, item, parent, index):
         """
@@ -585,8 +1527,17 @@ class Table(ttk.Treeview):
         :param index: where in the list of parent’s children to insert item
         :type index: int of "end"
         """
-        self._visual_drag.move(item, parent, index)
+        self._check_not_virtual()
+        if not self._lazy_preview:
+            self._visual_drag.move(item, parent, index)
         ttk.Treeview.move(self, item, parent, index)
+        if self._rows is not None:
+            # the item is displayed even if it does not match the filter
+            self._hidden.discard(item)
+            self._remove_row(item)
+            if parent == '':
+                self._place_rows((item,))
+        self._clear_sort()
 
     reattach = move
 
@@ -605,9 +1556,18 @@ class Table(ttk.Treeview):
         :type column: str, int or None
         :param value: new value
         """
-        if value is not None:
-            self._visual_drag.set(item, ttk.Treeview.column(self, column, 'id'), value)
-        return ttk.Treeview.set(self, item, column, value)
+        if value is None:
+            return ttk.Treeview.set(self, item, column, value)
+        self._check_not_virtual()
+        column = ttk.Treeview.column(self, column, 'id')
+        taken = self._take_row(item, (column,))
+        if not self._lazy_preview:
+            self._visual_drag.set(item, column, value)
+        res = ttk.Treeview.set(self, item, column, value)
+        self._forget_values((item,), column)
+        if taken or self._filter is not None:
+            self._update_row(item, taken)
+        return res
 
     def set_children(self, item, *newchildren):
         """
@@ -619,5 +1579,10 @@ class Table(ttk.Treeview):
         :param newchildren: new item's children (list of item identifiers)
         :type newchildren: sequence[str]
         """
-        self._visual_drag.set_children(item, *newchildren)
+        self._check_not_virtual()
+        if not self._lazy_preview:
+            self._visual_drag.set_children(item, *newchildren)
         ttk.Treeview.set_children(self, item, *newchildren)
+        if item == '':
+            self._filter, self._hidden = None, set()
+            self._clear_sort()
@@ -5,9 +5,258 @@ Source: This repository
 """
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 from ttkwidgets.utilities import open_icon
+from PIL import Image, ImageTk
 from collections import OrderedDict
 from ttkwidgets import AutoHideScrollbar
+from ttkwidgets.loader import Loader, count_lines, count_records, read_csv, read_json_lines
+from bisect import bisect_left, bisect_right
+import math
+from random import random
+from time import perf_counter
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only used to speed up the overview
+    np = None
+
+
+class _IntervalNode(object):
+    """Node of the treap of an :class:`IntervalIndex`"""
+
+    __slots__ = ("key", "iid", "finish", "max_finish", "priority", "left", "right")
+
+    def __init__(self, key, iid, finish):
+        self.key = key  # (start, sequence number)
+        self.iid = iid
+        self.finish = finish
+        self.max_finish = finish  # Largest finish value in the subtree of this node
+        self.priority = random()
+        self.left = None
+        self.right = None
+
+    def update(self):
+        """Recompute the largest finish value of the subtree"""
+        max_finish = self.finish
+        if self.left is not None and self.left.max_finish > max_finish:
+            max_finish = self.left.max_finish
+        if self.right is not None and self.right.max_finish > max_finish:
+            max_finish = self.right.max_finish
+        self.max_finish = max_finish
+
+
+class IntervalIndex(object):
+    """
+    Storage of (start, finish) intervals, allowing the intervals
+    overlapping a given range to be found quickly
+
+    The intervals are kept in a treap (a randomized balanced binary
+    search tree) ordered by start value, in which each node stores the
+    largest finish value of its subtree. Adding and removing an interval
+    takes logarithmic time and a query takes logarithmic time for each
+    interval found, as subtrees that end before the range are skipped.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._intervals = {}  # iid: (start, finish)
+        self._keys = {}       # iid: key of its node in the treap
+        self._sequence = 0    # Makes the keys of intervals with equal starts unique
+
+    def add(self, iid, start, finish):
+        """Insert an interval, replacing the interval of iid if present"""
+        if iid in self._intervals:
+            self.remove(iid)
+        key = (start, self._sequence)
+        self._sequence += 1
+        left, right = IntervalIndex._split(self._root, key)
+        self._root = IntervalIndex._merge(IntervalIndex._merge(left, _IntervalNode(key, iid, finish)), right)
+        self._intervals[iid] = (start, finish)
+        self._keys[iid] = key
+
+    def remove(self, iid):
+        """Remove the interval of iid"""
+        del self._intervals[iid]
+        start, sequence = key = self._keys.pop(iid)
+        left, right = IntervalIndex._split(self._root, key)
+        _, right = IntervalIndex._split(right, (start, sequence + 1))
+        self._root = IntervalIndex._merge(left, right)
+
+    def find(self, start, finish):
+        """
+        Return the identifiers of the intervals overlapping a range
+
+        Intervals that only touch the range are included as well.
+
+        :return: identifiers sorted by interval start
+        :rtype: list
+        """
+        result = []
+        IntervalIndex._find(self._root, start, finish, result)
+        return result
+
+    def clear(self):
+        """Remove all intervals"""
+        self._root = None
+        self._intervals.clear()
+        self._keys.clear()
+
+    def intervals(self):
+        """
+        Return the (start, finish) tuples of all intervals, unordered
+
+        :rtype: Iterable[tuple[float, float]]
+        """
+        return self._intervals.values()
+
+    def __contains__(self, iid):
+        return iid in self._intervals
+
+    def __len__(self):
+        return len(self._intervals)
+
+    @staticmethod
+    def _split(node, key):
+        """Split a treap into the nodes with keys smaller than key and the others"""
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = IntervalIndex._split(node.right, key)
+            node.update()
+            return node, right
+        left, node.left = IntervalIndex._split(node.left, key)
+        node.update()
+        return left, node
+
+    @staticmethod
+    def _merge(left, right):
+        """Merge two treaps, all keys in left being smaller than those in right"""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = IntervalIndex._merge(left.right, right)
+            left.update()
+            return left
+        right.left = IntervalIndex._merge(left, right.left)
+        right.update()
+        return right
+
+    @staticmethod
+    def _find(node, start, finish, result):
+        """Append the identifiers of the intervals in a treap overlapping a range to result"""
+        while node is not None and node.max_finish >= start:
+            IntervalIndex._find(node.left, start, finish, result)
+            if node.key[0] > finish:
+                return
+            if node.finish >= start:
+                result.append(node.iid)
+            node = node.right
+
+
+class Marker(object):
+    """
+    Compact record of the options of a marker on a :class:`TimeLine`
+
+    Only the options that differ from their defaults are stored, in a
+    dictionary that is only created if there are such options. Options
+    set by tags are not copied, but looked up in a dictionary shared by
+    all markers with the same tags. Options can be retrieved by key like
+    from a dictionary, and a full dictionary of all marker options is
+    created by :meth:`as_dict`.
+    """
+
+    __slots__ = ("iid", "category", "start", "finish", "_text", "tags", "rectangle_id", "text_id", "options",
+                 "defaults")
+
+    TAG_TEXT = object()  # Text of markers that follow the text of their tags
+
+    OPTIONS = ("category", "start", "finish", "text", "font", "iid", "tags", "move", "rectangle_id", "text_id",
+               "allow_overlap", "change_category", "snap_to_ticks") + \
+        tuple(prefix + item for prefix in ["hover_", "active_", ""]
+              for item in ["background", "foreground", "outline", "border"])
+    FIELDS = frozenset(("iid", "category", "start", "finish", "text", "tags", "rectangle_id", "text_id"))
+    DEFAULT_OPTIONS = ("background", "foreground", "outline", "border", "font", "move", "change_category",
+                       "allow_overlap", "snap_to_ticks")
+    STATE_OPTIONS = tuple(prefix + item for prefix in ["hover_", "active_"]
+                          for item in ["background", "foreground", "outline", "border"])
+
+    def __init__(self, iid, category, start, finish, text=None, tags=(), options=None, defaults=None):
+        """
+        :param text: Text of the marker, or :obj:`Marker.TAG_TEXT` to
+            use the text set by the tags of the marker
+        :type text: str
+        :param options: Dictionary of marker options, any keys that are
+            not style or behaviour options are ignored
+        :type options: dict[str, Any]
+        :param defaults: Dictionary of options set by the tags of the
+            marker, which marker options take precedence over
+        :type defaults: dict[str, Any]
+        """
+        self.iid = iid
+        self.category = category
+        self.start = start
+        self.finish = finish
+        self._text = text
+        self.tags = tags
+        self.rectangle_id = None
+        self.text_id = None
+        self.options = None
+        self.defaults = defaults
+        self.set_options(options)
+
+    @property
+    def text(self):
+        if self._text is not Marker.TAG_TEXT:
+            return self._text
+        return self.defaults.get("text", None) if self.defaults is not None else None
+
+    @text.setter
+    def text(self, text):
+        self._text = text
+
+    def set_options(self, options):
+        """
+        Replace the marker specific options
+
+        :param options: Dictionary of marker options, any keys that are
+            not style or behaviour options are ignored
+        :type options: dict[str, Any]
+        """
+        self.options = None
+        if not options:
+            return
+        # Options with the "default" value and state options equal to the normal state are implicit, unless a tag
+        # sets them to another value
+        defaults = self.defaults if self.defaults is not None else {}
+        values = {key: options[key] for key in Marker.DEFAULT_OPTIONS
+                  if key in options and (options[key] != "default" or key in defaults)}
+        self.options = values  # Required to look up the normal state options below
+        for key in Marker.STATE_OPTIONS:
+            if key in options and (options[key] != self[key.split("_", 1)[1]] or key in defaults):
+                values[key] = options[key]
+        self.options = values if len(values) != 0 else None
+
+    def __getitem__(self, key):
+        if key in Marker.FIELDS:
+            return getattr(self, key)
+        if self.options is not None and key in self.options:
+            return self.options[key]
+        if self.defaults is not None and key in self.defaults:
+            return self.defaults[key]
+        if key in Marker.STATE_OPTIONS:
+            # State options are equal to the normal state options by default
+            return self[key.split("_", 1)[1]]
+        return "default"
+
+    def as_dict(self):
+        """
+        Create a dictionary of all marker options
+
+        :rtype: dict[str, Any]
+        """
+        return {key: self[key] for key in Marker.OPTIONS}
 
 
 class TimeLine(ttk.Frame):
@@ -71,6 +320,10 @@ class TimeLine(ttk.Frame):
          be fixed by the user by modifying the "TimeLine.T(Widget)" style.
     """
 
+    TEXT_CACHE_SIZE = 4096  # Maximum amount of entries in each of the text caches
+    OVERVIEW_HEIGHT = 30  # Height of the overview strip in pixels
+    RECTANGLE_COLORS = (("background", "fill"), ("outline", "outline"), ("border", "width"))  # Canvas options
+
     def __init__(self, master=None, **kwargs):
         """
         Create a TimeLine widget
@@ -132,6 +385,51 @@ class TimeLine(ttk.Frame):
         :param autohidescrollbars: whether to use :class:`~ttkwidgets.AutoHideScrollbar`
             or :class:`ttk.Scrollbar` for the scrollbars
         :type autohidescrollbars: bool
+        :param virtual: Whether to only create Canvas items for the
+            markers that are in the visible part of the timeline. Items
+            are created and recycled as the timeline is scrolled, which
+            keeps the amount of Canvas items low for large numbers of
+            markers.
+        :type virtual: bool
+        :param virtual_margin: Amount of pixels around the visible part
+            of the timeline for which markers are also drawn in
+            virtual mode
+        :type virtual_margin: int
+        :param lod_threshold: Width in pixels below which markers are
+            not drawn individually, but merged with the other narrow
+            markers close to it in the same category into summary bars.
+            Markers are drawn individually again when zooming in makes
+            them wide enough. Disabled if zero.
+        :type lod_threshold: int
+        :param follow: Whether to scroll the TimeLine to keep the latest
+            marker appended with :meth:`append_marker` in view
+        :type follow: bool
+        :param retention: Amount of time before the latest finish of the
+            markers appended with :meth:`append_marker` after which
+            markers are deleted. Disabled if zero.
+        :type retention: float
+        :param max_update_rate: Maximum amount of times per second a
+            dragged marker is moved. Motion events that arrive in
+            between are coalesced, only the latest one is processed.
+        :type max_update_rate: int
+        :param canvas_labels: Whether to draw the category labels as
+            Canvas text instead of creating a Label widget for every
+            category. Only the labels of the visible rows are drawn,
+            which keeps the TimeLine fast with many categories. Of the
+            category options, only text, font and foreground are
+            supported in this mode.
+        :type canvas_labels: bool
+        :param overview: Whether to show an overview strip underneath
+            the ticks with the density of the markers in each category
+            over the whole time range. The visible part of the TimeLine
+            is indicated by a rectangle, which may be dragged to scroll.
+        :type overview: bool
+        :param playback_speed: Amount of time the time marker advances
+            per second during playback
+        :type playback_speed: float
+        :param playback_loop: Whether playback restarts at the start of
+            the TimeLine once it reaches the finish
+        :type playback_loop: bool
 
         **Marker Default Options**
 
@@ -181,6 +479,16 @@ class TimeLine(ttk.Frame):
         self._snap_margin = kwargs.pop("snap_margin", 10)
         self._menu = kwargs.pop("menu", None)
         self._autohidescrollbars = kwargs.pop("autohidescrollbars", False)
+        self._virtual = kwargs.pop("virtual", False)
+        self._virtual_margin = kwargs.pop("virtual_margin", 100)
+        self._lod_threshold = kwargs.pop("lod_threshold", 0)
+        self._follow = kwargs.pop("follow", False)
+        self._retention = kwargs.pop("retention", 0.0)
+        self._max_update_rate = kwargs.pop("max_update_rate", 60)
+        self._canvas_labels = kwargs.pop("canvas_labels", False)
+        self._overview = kwargs.pop("overview", False)
+        self._playback_speed = kwargs.pop("playback_speed", 1.0)
+        self._playback_loop = kwargs.pop("playback_loop", False)
         kwargs["style"] = self._style
         self._marker_font = kwargs.pop("marker_font", ("default", 10))
         self._marker_background = kwargs.pop("marker_background", "lightblue")
@@ -211,10 +519,47 @@ class TimeLine(ttk.Frame):
         self._canvas_markers = {}  # Canvas ID: (category, marker_iid)
         self._iid = 0
         self._tags = {}
+        self._tag_markers = {}  # tag: set of marker iids
+        self._tag_options = {}  # tuple of tags: options set by the tags, shared by the markers
+        self._canvas_tags = {}  # tuple of tags: Canvas tags of the rectangles and texts of the markers
+        self._tag_callbacks = {}  # tuple of tags: {callback type: list of callbacks}
         self._rows = {}
         self._after_id = None
         self._active = None
-        self._ticks = ()
+        self._drag_iid = None  # Marker pressed with the left mouse button
+        self._motion_event = None  # Latest motion event not processed yet
+        self._motion_after_id = None
+        self._move_origin = None  # (start, finish) of the dragged marker at the last move_callback
+        self._tick_count = 0  # Amount of ticks on the TimeLine, the ticks are computed from their index
+        self._tick_range = (0, 0)  # Range of tick indices with Canvas items
+        self._category_sizes = OrderedDict()  # category: (width, height) of the label, if canvas_labels
+        self._category_range = (0, 0)  # Slice of the rows with a Canvas label, if canvas_labels
+        self._linespaces = {}  # font: line height in pixels
+        self._overview_bands = {}  # category: row of the overview
+        self._overview_deltas = None  # Per row, the differences in marker count between consecutive pixels
+        self._overview_counts = None  # Per row, the marker count of every pixel when the strip was last drawn
+        self._overview_changed = None  # (first, last) pixels with differences that are not drawn yet
+        self._overview_peak = 1  # Marker count drawn in the darkest color
+        self._overview_image = None
+        self._overview_after_id = None
+        self._play_after_id = None
+        self._play_origin = None  # (clock, time) at the start of playback, frames are timed relative to it
+        self._play_frame = 0  # Amount of frames since the start of playback
+        self._play_time = None  # Time of the last playback frame
+        self._play_markers = set()  # Markers the time marker is in during playback
+        self._tick_labels = OrderedDict()  # LRU cache of (time, unit): time string
+        self._row_tops = []  # Sorted y-coordinates of the tops of the rows
+        self._row_categories = []  # Categories in the same order as _row_tops
+        self._pool_rectangles = []  # Hidden rectangle Canvas IDs available for re-use
+        self._pool_texts = []  # Hidden text Canvas IDs available for re-use
+        self._drawn = set()  # Identifiers of markers that have Canvas items
+        self._shortened = set()  # Identifiers of drawn markers with shortened text
+        self._fonts = {}  # font tuple: tkfont.Font
+        self._text_widths = OrderedDict()  # (font, text): width in pixels
+        self._text_fits = OrderedDict()  # (font, text, width): shortened text
+        self._index = {}  # category: IntervalIndex
+        self._summaries = {}  # category: list of [start, finish, Canvas ID] of the summary bars, sorted
+        self._stream_time = None  # Latest finish time of the markers appended with append_marker
 
         # Time pop-up frame
         self._time_label = None
@@ -228,6 +573,11 @@ class TimeLine(ttk.Frame):
             self, background=self._background, height=self._height, borderwidth=0)
         self._canvas_ticks = tk.Canvas(
             self, background=self._background, width=self._width, height=30, borderwidth=0)
+        self._canvas_overview = tk.Canvas(
+            self, background=self._background, width=self._width, height=TimeLine.OVERVIEW_HEIGHT, borderwidth=0,
+            highlightthickness=0)
+        self._overview_image_id = self._canvas_overview.create_image((0, 0), anchor=tk.NW)
+        self._overview_viewport = self._canvas_overview.create_rectangle((0, 0, 0, 0), outline="#016dc9", width=2)
         self._frame_zoom = ttk.Frame(self, style=self._style)
         self._frame_categories = ttk.Frame(self._canvas_categories, style=self._style)
 
@@ -274,12 +624,13 @@ class TimeLine(ttk.Frame):
         cases.
         """
         # Categories
-        for index, label in enumerate(self._category_labels.values()):
-            label.grid(column=0, row=index, padx=5, sticky="nw", pady=(1, 0) if index == 0 else 0)
+        self._grid_categories()
         # Canvas widgets
         self._canvas_scroll.grid(column=1, row=0, padx=(0, 5), pady=5, sticky="nswe")
         self._canvas_ticks.grid(column=1, row=1, padx=(0, 5), pady=(0, 5), sticky="nswe")
-        self._scrollbar_timeline.grid(column=1, row=2, padx=(0, 5), pady=(0, 5), sticky="we")
+        if self._overview:
+            self._canvas_overview.grid(column=1, row=2, padx=(0, 5), pady=(0, 5), sticky="we")
+        self._scrollbar_timeline.grid(column=1, row=3, padx=(0, 5), pady=(0, 5), sticky="we")
         # Zoom widgets
         self._button_zoom_in.grid(row=0, column=0, pady=5, sticky="nswe")
         self._button_zoom_out.grid(row=1, column=0, pady=(0, 5), sticky="nswe")
@@ -289,6 +640,11 @@ class TimeLine(ttk.Frame):
         self._scrollbar_vertical.grid(column=2, row=0, pady=5, padx=(0, 5), sticky="ns")
         self._frame_zoom.grid(column=3, row=0, rowspan=2, padx=(0, 5), pady=5, sticky="nswe")
 
+    def _grid_categories(self):
+        """Configure the category labels using the grid geometry manager"""
+        for index, label in enumerate(self._category_labels.values()):
+            label.grid(column=0, row=index, padx=5, sticky="nw", pady=(1, 0) if index == 0 else 0)
+
     def _setup_bindings(self):
         """
         Setup the event bindings for the widgets:
@@ -296,16 +652,20 @@ class TimeLine(ttk.Frame):
         Horizontal and Vertical scrolling for all widgets
         """
         self._timeline.bind("<Configure>", self.__configure_timeline)
+        self._canvas_scroll.bind("<Configure>", self._configure_viewport)
         for widget in [self, self._canvas_scroll, self._timeline, self._canvas_categories]:
             widget.bind("<MouseWheel>", self._mouse_scroll_v)
             widget.bind("<Shift-MouseWheel>", self._mouse_scroll_h)
         # Callback bindings
         self._timeline.bind("<ButtonPress-1>", self._left_click)
         self._timeline.bind("<B1-Motion>", self._left_motion)
+        self._timeline.bind("<ButtonRelease-1>", self._left_release)
         self._timeline.bind("<ButtonPress-3>", self._right_click)
         self._timeline.tag_bind("marker", "<Enter>", self._enter_handler)
         self._timeline.tag_bind("marker", "<Leave>", self._leave_handler)
         self._canvas_ticks.bind("<B1-Motion>", self._time_marker_move)
+        self._canvas_overview.bind("<ButtonPress-1>", self._overview_scroll)
+        self._canvas_overview.bind("<B1-Motion>", self._overview_scroll)
         self._canvas_ticks.bind("<ButtonRelease-1>", self._time_marker_release)
 
     def draw_timeline(self):
@@ -322,6 +682,7 @@ class TimeLine(ttk.Frame):
         # Create the ticks in the _canvas_ticks
         self.draw_ticks()
         self.draw_time_marker()
+        self.draw_overview()
 
     def draw_time_marker(self):
         """Draw the time marker on the TimeLine Canvas"""
@@ -332,31 +693,99 @@ class TimeLine(ttk.Frame):
         self._timeline.tag_lower("marker")
 
     def draw_categories(self):
-        """Draw the category labels on the Canvas"""
+        """
+        Draw the category labels on the Canvas
+
+        If canvas_labels is set, only the sizes of the labels are
+        computed, from cached font metrics, and the labels are drawn by
+        :meth:`draw_separators` once the rows are known.
+        """
         for label in self._category_labels.values():
             label.destroy()
         self._category_labels.clear()
+        self._category_sizes.clear()
+        self._canvas_categories.delete(tk.ALL)
         canvas_width = 0
         for category in (sorted(self._categories.keys() if isinstance(self._categories, dict) else self._categories)
                          if not isinstance(self._categories, OrderedDict)
                          else self._categories):
-            kwargs = self._categories[category] if isinstance(self._categories, dict) else {"text": category}
+            kwargs = self._category_options(category)
             kwargs["background"] = kwargs.get("background", self._background)
             kwargs["justify"] = kwargs.get("justify", tk.LEFT)
-            label = ttk.Label(self._frame_categories, **kwargs)
-            width = label.winfo_reqwidth()
+            if self._canvas_labels:
+                font = kwargs.get("font", "TkDefaultFont")
+                width = self._measure_text(font, str(kwargs.get("text", category)))
+                self._category_sizes[category] = (width, self._linespace(font) + 2)
+            else:
+                label = ttk.Label(self._frame_categories, **kwargs)
+                width = label.winfo_reqwidth()
+                self._category_labels[category] = label
             canvas_width = width if width > canvas_width else canvas_width
-            self._category_labels[category] = label
-        self._canvas_categories.create_window(0, 0, window=self._frame_categories, anchor=tk.NW)
+        if not self._canvas_labels:
+            self._canvas_categories.create_window(0, 0, window=self._frame_categories, anchor=tk.NW)
         self._canvas_categories.config(width=canvas_width + 5, height=self._height)
 
+    def _category_options(self, category):
+        """Return the label options of a category"""
+        return self._categories[category] if isinstance(self._categories, dict) else {"text": category}
+
+    def _category_rows(self):
+        """
+        Generator for the categories in order with the size of their
+        labels
+
+        :rtype: Generator[tuple[Any, int, int]]
+        """
+        if self._canvas_labels:
+            for category, (width, height) in self._category_sizes.items():
+                yield category, width, height
+            return
+        for category, label in self._category_labels.items():
+            yield category, label.winfo_reqwidth(), label.winfo_reqheight()
+
+    def _linespace(self, font):
+        """Return the height of a line of text in a font, cached by font"""
+        linespace = self._linespaces.get(font, None)
+        if linespace is None:
+            if font not in self._fonts:
+                self._fonts[font] = tkfont.Font(self, font=font)
+            linespace = self._linespaces[font] = self._fonts[font].metrics("linespace")
+        return linespace
+
+    def _update_visible_categories(self):
+        """
+        Draw the category labels of the visible rows as Canvas text
+
+        Like the ticks, the labels are drawn for the visible rows
+        extended with the height of the view on both sides. Only has an
+        effect if canvas_labels is set.
+        """
+        if not self._canvas_labels:
+            return
+        height = self._canvas_categories.winfo_height()
+        height = height if height > 1 else self._height
+        top = self._canvas_categories.canvasy(0)
+        first = max(bisect_right(self._row_tops, top) - 1, 0)
+        last = bisect_right(self._row_tops, top + height)
+        if self._category_range[0] <= first and last <= self._category_range[1]:
+            return
+        first = max(bisect_right(self._row_tops, top - height) - 1, 0)
+        last = bisect_right(self._row_tops, top + 2 * height)
+        self._canvas_categories.delete("category")
+        for category in self._row_categories[first:last]:
+            kwargs = self._category_options(category)
+            y1, y2 = self._rows[category]
+            self._canvas_categories.create_text(
+                (5, (y1 + y2) / 2), text=kwargs.get("text", category), anchor=tk.W, tags=("category",),
+                font=kwargs.get("font", "TkDefaultFont"), fill=kwargs.get("foreground", "black"))
+        self._category_range = (first, last)
+
     def create_scroll_region(self):
         """Setup the scroll region on the Canvas"""
         canvas_width = 0
         canvas_height = 0
-        for label in self._category_labels.values():
-            width = label.winfo_reqwidth()
-            canvas_height += label.winfo_reqheight()
+        for _, width, height in self._category_rows():
+            canvas_height += height
             canvas_width = width if width > canvas_width else canvas_width
         self._canvas_categories.config(scrollregion="0 0 {0} {1}".format(canvas_width, canvas_height))
 
@@ -369,37 +798,537 @@ class TimeLine(ttk.Frame):
         """
         self._timeline.delete(tk.ALL)
         self._canvas_ticks.delete(tk.ALL)
+        del self._pool_rectangles[:]
+        del self._pool_texts[:]
+        self._summaries.clear()
 
     def draw_ticks(self):
-        """Draw the time tick markers on the TimeLine Canvas"""
+        """
+        Draw the time tick markers on the TimeLine Canvas
+
+        Only the ticks in the visible range are drawn, the other ticks
+        are drawn when they are scrolled into view.
+        """
         self._canvas_ticks.create_line((0, 10, self.pixel_width, 10), fill="black")
-        self._ticks = list(TimeLine.range(self._start, self._finish, self._tick_resolution / self._zoom_factor))
-        for tick in self._ticks:
-            string = TimeLine.get_time_string(tick, self._unit)
-            x = self.get_time_position(tick)
-            x_tick = x + 1 if x == 0 else (x - 1 if x == self.pixel_width else x)
-            x_text = x + 15 if x - 15 <= 0 else (x - 15 if x + 15 >= self.pixel_width else x)
-            self._canvas_ticks.create_text((x_text, 20), text=string, fill="black", font=("default", 10))
-            self._canvas_ticks.create_line((x_tick, 5, x_tick, 15), fill="black")
+        # Small margin for the rounding errors of the division
+        self._tick_count = int((self._finish - self._start) / self._tick_step + 1e-9) + 1
+        self._tick_range = (0, 0)
+        self._update_visible_ticks()
         self._canvas_ticks.config(scrollregion="0 0 {0} {1}".format(self.pixel_width, 30))
 
+    def _update_visible_ticks(self):
+        """
+        Draw the ticks in the visible range of the ticks Canvas
+
+        The ticks are drawn for the visible range extended with its
+        width on both sides, so they only have to be redrawn once the
+        TimeLine is scrolled beyond that.
+        """
+        width = self._canvas_ticks.winfo_width()
+        width = width if width > 1 else self._width
+        left = self._canvas_ticks.canvasx(0)
+        first, last = self._tick_indices(left, left + width)
+        if self._tick_range[0] <= first and last <= self._tick_range[1]:
+            return
+        first, last = self._tick_indices(left - width, left + 2 * width)
+        self._canvas_ticks.delete("tick")
+        pixel_width = self.pixel_width
+        for index in range(first, last):
+            tick = min(self._start + index * self._tick_step, self._finish)
+            x = self.get_time_position(tick)
+            x_tick = x + 1 if x == 0 else (x - 1 if x == pixel_width else x)
+            x_text = x + 15 if x - 15 <= 0 else (x - 15 if x + 15 >= pixel_width else x)
+            self._canvas_ticks.create_text(
+                (x_text, 20), text=self._time_string(tick), fill="black", font=("default", 10), tags=("tick",))
+            self._canvas_ticks.create_line((x_tick, 5, x_tick, 15), fill="black", tags=("tick",))
+        # Keep the time marker on top
+        self._canvas_ticks.tag_lower("tick")
+        self._tick_range = (first, last)
+
+    @property
+    def _tick_step(self):
+        """Amount of time between two ticks at the current zoom level"""
+        return self._tick_resolution / self._zoom_factor
+
+    def _tick_indices(self, x1, x2):
+        """Return the range of indices of the ticks between two x-coordinates"""
+        spacing = self._tick_step * self._zoom_factor / self._resolution  # pixels between ticks
+        first = min(max(int(math.ceil(x1 / spacing)), 0), self._tick_count)
+        last = min(max(int(math.floor(x2 / spacing)) + 1, first), self._tick_count)
+        return first, last
+
+    def _nearest_tick(self, x):
+        """Return the x-coordinate of the tick closest to x"""
+        if self._tick_count == 0:
+            return None
+        spacing = self._tick_step * self._zoom_factor / self._resolution
+        return min(max(round(x / spacing), 0), self._tick_count - 1) * spacing
+
+    def draw_overview(self):
+        """
+        Count the markers for the overview strip and draw it
+
+        The time range is divided into one bin per pixel of the strip,
+        and every category is assigned a row of the strip (categories
+        share rows if there are more categories than pixels in height).
+        For each row, the differences in the amount of markers between
+        consecutive bins are kept, so adding or removing a marker only
+        changes two values. The counts are only summed when the strip is
+        drawn, which happens once the Tk main loop is idle, and only the
+        bins that changed since the strip was last drawn are summed and
+        drawn again.
+        """
+        self._overview_counts = None
+        if not self._overview:
+            self._overview_deltas = None
+            return
+        categories = self._row_categories
+        bands = max(min(len(categories), TimeLine.OVERVIEW_HEIGHT), 1)
+        self._overview_bands = {category: index * bands // len(categories)
+                                for index, category in enumerate(categories)}
+        width = self._width
+        if np is not None:
+            self._overview_deltas = np.zeros((bands, width + 1), dtype=np.int64)
+            scale = width / (self._finish - self._start)
+            for category, index in self._index.items():
+                if category not in self._overview_bands or len(index) == 0:
+                    continue
+                intervals = np.array(list(index.intervals()), dtype=np.float64)
+                bins = np.clip(((intervals - self._start) * scale).astype(np.int64), 0, width - 1)
+                deltas = self._overview_deltas[self._overview_bands[category]]
+                np.add.at(deltas, bins[:, 0], 1)
+                np.add.at(deltas, bins[:, 1] + 1, -1)
+        else:
+            self._overview_deltas = [[0] * (width + 1) for _ in range(bands)]
+            for category, index in self._index.items():
+                for start, finish in index.intervals():
+                    self._overview_count(category, start, finish, 1, schedule=False)
+        self._schedule_overview()
+
+    def _overview_bin(self, time):
+        """Return the overview bin of a time"""
+        index = int((time - self._start) / (self._finish - self._start) * self._width)
+        return min(max(index, 0), self._width - 1)
+
+    def _overview_count(self, category, start, finish, amount, schedule=True):
+        """Add amount markers in a time range to the overview counts"""
+        if self._overview_deltas is None or category not in self._overview_bands:
+            return
+        deltas = self._overview_deltas[self._overview_bands[category]]
+        first, last = self._overview_bin(start), self._overview_bin(finish)
+        deltas[first] += amount
+        deltas[last + 1] -= amount
+        if self._overview_changed is not None:
+            first, last = min(first, self._overview_changed[0]), max(last, self._overview_changed[1])
+        self._overview_changed = (first, last)
+        if schedule:
+            self._schedule_overview()
+
+    def _schedule_overview(self):
+        """Draw the overview strip once the Tk main loop is idle"""
+        if self._overview_after_id is None:
+            self._overview_after_id = self.after_idle(self._render_overview)
+
+    def _render_overview(self):
+        """
+        Draw the overview strip as a single image
+
+        The differences of the changed bins are added to the counts of
+        the last drawn strip, and only the pixels of those bins are put
+        into the image, unless the highest count changed.
+        """
+        self._overview_after_id = None
+        if self._overview_deltas is None:
+            return
+        if self._overview_counts is None:
+            first, last = 0, self._width - 1
+        elif self._overview_changed is not None:
+            first, last = self._overview_changed
+        else:
+            return
+        self._overview_changed = None
+        if np is not None:
+            deltas = self._overview_deltas[:, first:last + 2]
+            if self._overview_counts is None:
+                self._overview_counts = np.cumsum(deltas[:, :-1], axis=1)
+            else:
+                self._overview_counts[:, first:last + 1] += np.cumsum(deltas[:, :-1], axis=1)
+            deltas[:] = 0
+            peak = max(int(self._overview_counts.max()), 1)
+        else:
+            if self._overview_counts is None:
+                self._overview_counts = [[0] * self._width for _ in self._overview_deltas]
+            for deltas, counts in zip(self._overview_deltas, self._overview_counts):
+                total = 0
+                for index in range(first, last + 1):
+                    total += deltas[index]
+                    counts[index] += total
+                    deltas[index] = 0
+                deltas[last + 1] = 0
+            peak = max(max(max(counts) for counts in self._overview_counts), 1)
+        if self._overview_image is None or peak != self._overview_peak or (first, last) == (0, self._width - 1):
+            # All pixels are drawn in other colors
+            self._overview_peak = peak
+            self._overview_image = ImageTk.PhotoImage(self._overview_pixels(0, self._width - 1))
+            self._canvas_overview.itemconfigure(self._overview_image_id, image=self._overview_image)
+            self._update_overview_viewport()
+            return
+        image = self._overview_pixels(first, last)
+        width, pixels = last - first + 1, image.tobytes()
+        colors = ["#{0:02x}{0:02x}{0:02x}".format(value) for value in range(256)]
+        data = " ".join("{" + " ".join(colors[value] for value in pixels[y * width:(y + 1) * width]) + "}"
+                        for y in range(TimeLine.OVERVIEW_HEIGHT))
+        self._canvas_overview.tk.call(str(self._overview_image), "put", data, "-to", first, 0)
+
+    def _overview_pixels(self, first, last):
+        """Return the image of the overview bins from first up to and including last"""
+        width, bands = last - first + 1, len(self._overview_counts)
+        if np is not None:
+            counts = self._overview_counts[:, first:last + 1]
+            image = Image.fromarray((255 - counts * 200 // self._overview_peak).astype(np.uint8))
+        else:
+            image = Image.frombytes("L", (width, bands), bytes(
+                255 - count * 200 // self._overview_peak for counts in self._overview_counts
+                for count in counts[first:last + 1]))
+        return image.resize((width, TimeLine.OVERVIEW_HEIGHT), Image.NEAREST)
+
+    def _update_overview_viewport(self):
+        """Move the rectangle indicating the visible part in the overview strip"""
+        if not self._overview:
+            return
+        width = self._canvas_scroll.winfo_width()
+        width = width if width > 1 else self._width
+        left = self._canvas_scroll.canvasx(0)
+        scale = self._width / self.pixel_width
+        x1, x2 = left * scale, min(left + width, self.pixel_width) * scale
+        self._canvas_overview.coords(self._overview_viewport, x1 + 1, 1, max(x2 - 1, x1 + 2),
+                                     TimeLine.OVERVIEW_HEIGHT - 1)
+
+    def _overview_scroll(self, event):
+        """Scroll so that the view is centered on the clicked position of the overview strip"""
+        x1, _, x2, _ = self._canvas_overview.coords(self._overview_viewport)
+        fraction = (event.x - (x2 - x1) / 2) / self._width
+        self._set_scroll("moveto", min(max(fraction, 0.0), 1.0))
+
+    def _time_string(self, time):
+        """Return the formatted string of a time, cached by time and unit"""
+        key = (time, self._unit)
+        string = self._tick_labels.get(key, None)
+        if string is not None:
+            self._tick_labels.move_to_end(key)
+            return string
+        string = TimeLine.get_time_string(time, self._unit)
+        self._tick_labels[key] = string
+        if len(self._tick_labels) > TimeLine.TEXT_CACHE_SIZE:
+            self._tick_labels.popitem(last=False)
+        return string
+
     def draw_separators(self):
         """Draw the lines separating the categories on the Canvas"""
         total = 1
-        self._timeline.create_line((0, 1, self.pixel_width, 1))
-        for index, (category, label) in enumerate(self._category_labels.items()):
-            height = label.winfo_reqheight()
+        self._timeline.create_line((0, 1, self.pixel_width, 1), tags=("separator",))
+        self._row_tops, self._row_categories = [], []
+        for category, _, height in self._category_rows():
             self._rows[category] = (total, total + height)
+            self._row_tops.append(total)
+            self._row_categories.append(category)
             total += height
-            self._timeline.create_line((0, total, self.pixel_width, total))
+            self._timeline.create_line((0, total, self.pixel_width, total), tags=("separator",))
         pixel_height = total
         self._timeline.config(height=pixel_height)
+        self._category_range = (0, 0)
+        self._update_visible_categories()
 
     def draw_markers(self):
-        """Draw all created markers on the TimeLine Canvas"""
+        """
+        Draw all created markers on the TimeLine Canvas
+
+        In virtual mode, only the markers in the visible part of the
+        timeline are drawn. Markers narrower than the lod_threshold are
+        drawn as summary bars.
+        """
         self._canvas_markers.clear()
+        self._drawn.clear()
+        self._shortened.clear()
         for marker in self._markers.values():
-            self.create_marker(marker["category"], marker["start"], marker["finish"], marker)
+            marker.rectangle_id, marker.text_id = None, None
+        self._update_drawn_markers()
+
+    def _draw_marker(self, iid):
+        """Create (or recycle) the Canvas items for an existing marker"""
+        marker = self._markers[iid]
+        background, outline, border = marker["background"], marker["outline"], marker["border"]
+        font, foreground = marker["font"], marker["foreground"]
+        coords = self._marker_coords(marker)
+        rectangle_tags, text_tags = self._item_tags(marker.tags)
+        options = {
+            "fill": background if background != "default" else self._marker_background,
+            "outline": outline if outline != "default" else self._marker_outline,
+            "width": border if border != "default" else self._marker_border,
+            "tags": rectangle_tags
+        }
+        if len(self._pool_rectangles) != 0:
+            rectangle_id = self._pool_rectangles.pop()
+            self._timeline.coords(rectangle_id, *coords)
+            self._timeline.itemconfigure(rectangle_id, state=tk.NORMAL, **options)
+        else:
+            rectangle_id = self._timeline.create_rectangle(coords, **options)
+        text_id = None
+        if marker.text is not None:
+            text_id = self._pool_texts.pop() if len(self._pool_texts) != 0 else None
+            text_id, text = self._draw_text(coords, marker.text, foreground, font, text_id, text_tags)
+            if text != marker.text:
+                self._shortened.add(iid)
+        marker.rectangle_id, marker.text_id = rectangle_id, text_id
+        self._drawn.add(iid)
+        self._canvas_markers[rectangle_id] = iid
+        if text_id is not None:
+            self._canvas_markers[text_id] = iid
+
+    def _item_tags(self, tags):
+        """
+        Return the Canvas tags of the rectangle and the text of markers
+        with a combination of tags
+
+        Each combination of tags gets its own Canvas tags, so the items
+        of all the markers that share it can be configured at once when
+        the options of a tag change.
+
+        :rtype: tuple[tuple[str], tuple[str]]
+        """
+        if len(tags) == 0:
+            return ("marker",), ("marker",)
+        names = self._canvas_tags.get(tags, None)
+        if names is None:
+            index = len(self._canvas_tags)
+            names = ("marker", "rectangle{}".format(index)), ("marker", "text{}".format(index))
+            self._canvas_tags[tags] = names
+        return names
+
+    def _release_marker(self, iid):
+        """Hide the Canvas items of a marker and keep them for re-use"""
+        marker = self._markers[iid]
+        rectangle_id, text_id = marker.rectangle_id, marker.text_id
+        if rectangle_id is None:
+            return
+        self._canvas_markers.pop(rectangle_id, None)
+        self._timeline.itemconfigure(rectangle_id, state=tk.HIDDEN)
+        self._pool_rectangles.append(rectangle_id)
+        if text_id is not None:
+            self._canvas_markers.pop(text_id, None)
+            self._timeline.itemconfigure(text_id, state=tk.HIDDEN)
+            self._pool_texts.append(text_id)
+        marker.rectangle_id, marker.text_id = None, None
+        self._drawn.discard(iid)
+        self._shortened.discard(iid)
+
+    def _marker_coords(self, marker):
+        """Calculate the rectangle coordinates of a marker"""
+        y1, y2 = self._rows[marker.category]
+        return (marker.start / self._resolution * self._zoom_factor, y1,
+                marker.finish / self._resolution * self._zoom_factor, y2)
+
+    def _visible_region(self):
+        """
+        Return the part of the TimeLine Canvas visible in the scrolling
+        container, extended with the virtual_margin on every side
+
+        :return: (x1, y1, x2, y2) in TimeLine Canvas coordinates
+        :rtype: tuple[float]
+        """
+        width = self._canvas_scroll.winfo_width()
+        height = self._canvas_scroll.winfo_height()
+        width = width if width > 1 else self._width
+        height = height if height > 1 else self._height
+        x1, y1 = self._canvas_scroll.canvasx(0), self._canvas_scroll.canvasy(0)
+        margin = self._virtual_margin
+        return x1 - margin, y1 - margin, x1 + width + margin, y1 + height + margin
+
+    def _marker_in_region(self, marker, region):
+        """Return whether the rectangle of a marker intersects a region"""
+        x1, y1, x2, y2 = self._marker_coords(marker)
+        return x2 >= region[0] and x1 <= region[2] and y2 >= region[1] and y1 <= region[3]
+
+    def _region_categories(self, region):
+        """
+        Return the categories with rows intersecting a region and the
+        time range covered by the region
+
+        :param region: (x1, y1, x2, y2) region, or None for the whole
+            TimeLine
+        :return: list of categories, start time, finish time
+        :rtype: tuple[list, float, float]
+        """
+        if region is None:
+            return [category for category in self._rows if category in self._index], float("-inf"), float("inf")
+        x1, y1, x2, y2 = region
+        categories = [category for category, (row_y1, row_y2) in self._rows.items()
+                      if row_y2 >= y1 and row_y1 <= y2 and category in self._index]
+        return categories, x1 * self._resolution / self._zoom_factor, x2 * self._resolution / self._zoom_factor
+
+    def _find_region_markers(self, region):
+        """Return a set of the iids of the markers intersecting a region"""
+        categories, start, finish = self._region_categories(region)
+        iids = set()
+        for category in categories:
+            iids.update(self._index[category].find(start, finish))
+        return iids
+
+    def _is_detailed(self, marker):
+        """Return whether a marker is wide enough to be drawn individually"""
+        if self._lod_threshold == 0:
+            return True
+        return (marker.finish - marker.start) / self._resolution * self._zoom_factor >= self._lod_threshold
+
+    def _update_visible_markers(self):
+        """
+        Create the Canvas items of markers that scrolled into view and
+        recycle those of markers that scrolled out of view
+
+        Only has an effect in virtual mode.
+        """
+        if self._virtual:
+            self._update_drawn_markers()
+
+    def _update_drawn_markers(self):
+        """
+        Make sure exactly the markers that are visible (in virtual mode)
+        and wide enough (with lod_threshold) have Canvas items, and
+        redraw the summary bars
+        """
+        visible = self._find_region_markers(self._visible_region() if self._virtual else None)
+        if self._lod_threshold != 0:
+            visible = {iid for iid in visible if self._is_detailed(self._markers[iid])}
+        for iid in self._drawn - visible:
+            if iid != self._active:
+                self._release_marker(iid)
+        new = visible - self._drawn
+        for iid in new:
+            self._draw_marker(iid)
+        if len(new) != 0:
+            self._timeline.tag_lower("marker")
+        self._draw_summaries()
+
+    def _draw_summaries(self, categories=None):
+        """
+        Draw the summary bars for the markers narrower than the
+        lod_threshold
+
+        Narrow markers in a category are merged into a single bar as
+        long as the gap between them is smaller than the lod_threshold,
+        so the amount of bars is bounded by the width of the TimeLine in
+        pixels rather than by the amount of markers.
+
+        :param categories: Categories to redraw the bars of, all
+            categories if None
+        :type categories: Iterable
+        """
+        if self._lod_threshold == 0:
+            return
+        if categories is None:
+            categories = list(self._summaries.keys()) + list(self._index.keys())
+        for category in set(categories):
+            items = [bar[2] for bar in self._summaries.pop(category, [])]
+            if len(items) != 0:
+                self._timeline.delete(*items)
+        region = self._visible_region() if self._virtual else None
+        region_categories, start, finish = self._region_categories(region)
+        for category in set(categories).intersection(region_categories):
+            self._summaries[category] = self._create_summaries(category, start, finish)
+        self._timeline.tag_lower("summary")
+
+    def _update_summaries(self, category, start, finish):
+        """
+        Redraw only the summary bars of a category that are affected by
+        a change of the markers in a time range
+
+        The bars closer than the lod_threshold to the range may merge
+        with or split from the markers in it, so these bars are redrawn
+        from the markers they cover. The other bars are not affected.
+        """
+        if self._lod_threshold == 0:
+            return
+        region = self._visible_region() if self._virtual else None
+        region_categories, region_start, region_finish = self._region_categories(region)
+        if category not in region_categories:
+            return
+        limit = self._lod_threshold * self._resolution / self._zoom_factor
+        bars = self._summaries.setdefault(category, [])
+        # Bars are disjoint, so sorted by both start and finish
+        first = max(bisect_left(bars, [start - limit]) - 1, 0)
+        while first < len(bars) and bars[first][1] <= start - limit:
+            first += 1
+        last = bisect_left(bars, [finish + limit], first)
+        if first < last:
+            start, finish = min(start, bars[first][0]), max(finish, bars[last - 1][1])
+            self._timeline.delete(*(bar[2] for bar in bars[first:last]))
+        bars[first:last] = self._create_summaries(category, max(start, region_start), min(finish, region_finish))
+        self._timeline.tag_lower("summary")
+
+    def _create_summaries(self, category, start, finish):
+        """
+        Create the summary bars for the markers of a category narrower
+        than the lod_threshold that overlap with a time range
+
+        :return: list of [start, finish, Canvas ID] of the bars
+        :rtype: list[list]
+        """
+        scale = self._zoom_factor / self._resolution  # pixels per unit of time
+        limit = self._lod_threshold / scale
+        bars = []
+        for iid in self._index[category].find(start, finish):
+            marker = self._markers[iid]
+            if marker.finish - marker.start >= limit:
+                continue
+            if len(bars) != 0 and marker.start - bars[-1][1] < limit:
+                bars[-1][1] = max(bars[-1][1], marker.finish)
+            else:
+                bars.append([marker.start, marker.finish])
+        y1, y2 = self._rows[category]
+        options = {"fill": self._marker_background, "outline": self._marker_outline, "width": self._marker_border}
+        for bar in bars:
+            x1, x2 = bar[0] * scale, bar[1] * scale
+            bar.append(self._timeline.create_rectangle((x1, y1, max(x2, x1 + 1), y2), tags=("summary",), **options))
+        return bars
+
+    def _index_add(self, iid):
+        """Add a marker to the interval index of its category"""
+        marker = self._markers[iid]
+        category = marker.category
+        if category not in self._index:
+            self._index[category] = IntervalIndex()
+        self._index[category].add(iid, marker.start, marker.finish)
+        self._overview_count(category, marker.start, marker.finish, 1)
+
+    def _index_remove(self, iid):
+        """Remove a marker from the interval index of its category"""
+        marker = self._markers[iid]
+        self._index[marker.category].remove(iid)
+        self._overview_count(marker.category, marker.start, marker.finish, -1)
+
+    def find_markers(self, category, start, finish):
+        """
+        Find the markers in a category that overlap with a time range
+
+        Markers that only touch the range are included as well. Takes
+        logarithmic time with respect to the number of markers in the
+        category for each marker found.
+
+        :param category: Category identifier
+        :type category: Any
+        :param start: Start time of the range
+        :type start: float
+        :param finish: Finish time of the range
+        :type finish: float
+        :return: identifiers of the markers, sorted by start time
+        :rtype: list[str]
+        :raises: ValueError
+        """
+        if category not in self._categories:
+            raise ValueError("category argument not a valid category: {}".format(category))
+        if category not in self._index:
+            return []
+        return self._index[category].find(start, finish)
 
     def __configure_timeline(self, *args):
         """Function from ScrolledFrame, adapted for the _timeline"""
@@ -407,6 +1336,13 @@ class TimeLine(ttk.Frame):
         (size_x, size_y) = (self._timeline.winfo_reqwidth(), self._timeline.winfo_reqheight())
         self._canvas_scroll.config(scrollregion="0 0 {0} {1}".format(size_x, size_y - 5))
 
+    def _configure_viewport(self, *args):
+        """Callback for <Configure> of the scrolling container"""
+        self._update_visible_markers()
+        self._update_visible_ticks()
+        self._update_visible_categories()
+        self._update_overview_viewport()
+
     def create_marker(self, category, start, finish, marker=None, **kwargs):
         """
         Create a new marker in the TimeLine with the specified options
@@ -468,86 +1404,280 @@ class TimeLine(ttk.Frame):
         :raise ValueError: One of the specified arguments is invalid
         """
         kwargs = kwargs if marker is None else marker
+        self._check_marker(category, start, finish, kwargs)
+        iid = self._store_marker(category, start, finish, kwargs)
+        # Create the Canvas items, only if visible in virtual mode
+        if not self._is_detailed(self._markers[iid]):
+            self._update_summaries(category, start, finish)
+        elif not self._virtual or self._marker_in_region(self._markers[iid], self._visible_region()):
+            self._draw_marker(iid)
+            self._timeline.tag_lower("marker")
+        return iid
+
+    def create_markers(self, markers):
+        """
+        Create multiple markers in the TimeLine at once
+
+        All markers are validated before any of them is created, and the
+        Canvas stacking order is only updated once, which makes this
+        considerably faster than calling :meth:`create_marker` for each
+        marker when loading many markers.
+
+        :param markers: Iterable of marker dictionaries, which contain
+            the category, start and finish keys in addition to the
+            marker options supported by :meth:`create_marker`. The
+            values of the :obj:`markers` property may be used.
+        :type markers: Iterable[dict[str, Any]]
+        :return: identifiers of the created markers, in order
+        :rtype: list[str]
+        :raise ValueError: One of the markers is invalid
+        """
+        markers = [marker.copy() for marker in markers]
+        iids = set()
+        for marker in markers:
+            if "category" not in marker or "start" not in marker or "finish" not in marker:
+                raise ValueError("marker dictionary without category, start and finish: {}".format(marker))
+            self._check_marker(marker["category"], marker["start"], marker["finish"], marker)
+            if "iid" in marker:
+                if marker["iid"] in self._markers or marker["iid"] in iids:
+                    raise ValueError("iid argument already used by another marker: {}".format(marker["iid"]))
+                iids.add(marker["iid"])
+        # Generate the missing iids up front, so they cannot collide with the iids of later markers
+        iid = self._iid
+        for marker in markers:
+            if "iid" not in marker:
+                while str(iid) in self._markers or str(iid) in iids:
+                    iid += 1
+                marker["iid"] = str(iid)
+                iid += 1
+        return self._insert_markers(markers)
+
+    def _insert_markers(self, markers):
+        """
+        Create markers from checked marker dictionaries, which are
+        modified in the process
+
+        :return: identifiers of the created markers, in order
+        :rtype: list[str]
+        """
+        region = self._visible_region() if self._virtual else None
+        iids, categories, drawn = [], set(), False
+        for marker in markers:
+            iid = self._store_marker(marker.pop("category"), marker.pop("start"), marker.pop("finish"), marker)
+            iids.append(iid)
+            if not self._is_detailed(self._markers[iid]):
+                categories.add(self._markers[iid].category)
+            elif region is None or self._marker_in_region(self._markers[iid], region):
+                self._draw_marker(iid)
+                drawn = True
+        if drawn:
+            self._timeline.tag_lower("marker")
+        if len(categories) != 0:
+            self._draw_summaries(categories)
+        return iids
+
+    def load_markers(self, path, file_format=None, chunk_size=1000, progress_callback=None, finish_callback=None):
+        """
+        Load markers from a file in the background
+
+        The file is read, and the markers are validated, in a worker
+        thread. The markers are created in chunks by ``after`` callbacks,
+        so the TimeLine stays responsive while loading large files.
+        Loading stops at the first invalid marker, which is available as
+        the ``error`` attribute of the returned loader.
+
+        CSV files must have a header with the category, start and finish
+        columns, other columns may be any marker option. Empty cells are
+        ignored, tags are separated by spaces and boolean options are
+        given as ``true`` or ``false``. JSON Lines files contain a marker
+        dictionary as accepted by :meth:`create_markers` on each line.
+
+        :param path: Path to the file to load
+        :type path: str
+        :param file_format: "csv" or "jsonl", determined by the extension of
+            the file if not given
+        :type file_format: str
+        :param chunk_size: Amount of markers read at once
+        :type chunk_size: int
+        :param progress_callback: Callback called periodically while
+            loading. Arguments to callback:
+            ``(loaded: int, total: int or None)``
+        :type progress_callback: callable
+        :param finish_callback: Callback called when loading is done,
+            has failed or has been cancelled. Arguments to callback:
+            ``(loader: Loader)``
+        :type finish_callback: callable
+        :return: the running loader, which can be cancelled with its
+            ``cancel`` method
+        :rtype: ~ttkwidgets.loader.Loader
+        """
+        if file_format is None:
+            file_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        if file_format not in ("csv", "jsonl"):
+            raise ValueError("file_format argument is not 'csv' or 'jsonl': {}".format(file_format))
+        reader = read_csv if file_format == "csv" else read_json_lines
+        count = (lambda: max(count_records(path) - 1, 0)) if file_format == "csv" else (lambda: count_lines(path))
+        # Values read from a file are strings, so categories are also matched by their string value
+        categories = {str(category): category for category in self._categories}
+
+        def source():
+            return (self._normalize_marker(marker, categories) for marker in reader(path))
+
+        loader = Loader(self, source, self._insert_markers, chunk_size=chunk_size,
+                        total=count, progress_callback=progress_callback,
+                        finish_callback=finish_callback)
+        return loader.start()
+
+    def _normalize_marker(self, marker, categories):
+        """
+        Convert a marker read from a file to a checked marker dictionary
+
+        Called in the worker thread of :meth:`load_markers`, so may not
+        use the Tk interpreter.
+
+        :param marker: Dictionary of marker options read from a file
+        :type marker: dict[str, Any]
+        :param categories: Categories by their string value
+        :type categories: dict[str, Any]
+        :rtype: dict[str, Any]
+        :raises: TypeError, ValueError
+        """
+        if not isinstance(marker, dict):
+            raise TypeError("marker is not a dictionary: {}".format(marker))
+        marker = {key: value for key, value in marker.items() if value is not None and value != ""}
+        if "category" not in marker or "start" not in marker or "finish" not in marker:
+            raise ValueError("marker dictionary without category, start and finish: {}".format(marker))
+        category = marker["category"]
+        if category not in self._categories:
+            marker["category"] = categories.get(str(category), category)
+        marker["start"], marker["finish"] = float(marker["start"]), float(marker["finish"])
+        for key, value in marker.items():
+            if not isinstance(value, (str, list)):
+                continue
+            if key.endswith("border"):
+                marker[key] = int(value)
+            elif key in ("move", "change_category", "allow_overlap", "snap_to_ticks") and isinstance(value, str):
+                if value.lower() not in ("true", "false"):
+                    raise ValueError("{} argument is not true or false".format(key))
+                marker[key] = value.lower() == "true"
+            elif key == "tags":
+                marker[key] = tuple(value.split() if isinstance(value, str) else value)
+            elif key == "font" and isinstance(value, list):
+                marker[key] = tuple(value)
+        self._check_marker(marker["category"], marker["start"], marker["finish"], marker)
+        return marker
+
+    def _check_marker(self, category, start, finish, kwargs):
+        """Check the arguments of a marker to be created"""
         if category not in self._categories:
             raise ValueError("category argument not a valid category: {}".format(category))
         if start < self._start or finish > self._finish:
             raise ValueError("time out of bounds")
         self.check_marker_kwargs(kwargs)
-        # Update the options based on the tags. The last tag always takes precedence over the ones before it, and the
-        # marker specific options take precedence over tag options
+
+    def _store_marker(self, category, start, finish, kwargs):
+        """
+        Save the options of a checked marker without drawing it
+
+        :return: identifier of the marker
+        :rtype: str
+        """
+        # The marker specific options take precedence over the options of the tags
         tags = kwargs.get("tags", ())
-        options = kwargs.copy()
-        # Check the tags
-        for tag in tags:
-            # Update the options
-            kwargs.update(self._tags[tag])
-        # Update with the specific marker options
-        kwargs.update(options)
-        # Process the other options
+        defaults = self._resolve_tags(tags)
         iid = kwargs.pop("iid", str(self._iid))
-        background = kwargs.get("background", "default")
-        foreground = kwargs.get("foreground", "default")
-        outline = kwargs.get("outline", "default")
-        font = kwargs.get("font", "default")
-        border = kwargs.get("border", "default")
-        move = kwargs.get("move", "default")
-        change_category = kwargs.get("change_category", "default")
-        allow_overlap = kwargs.get("allow_overlap", "default")
-        snap_to_ticks = kwargs.get("snap_to_ticks", "default")
-        # Calculate pixel positions
-        x1 = start / self._resolution * self._zoom_factor
-        x2 = finish / self._resolution * self._zoom_factor
-        y1, y2 = self._rows[category]
-        # Create the rectangle
-        rectangle_id = self._timeline.create_rectangle(
-            (x1, y1, x2, y2),
-            fill=background if background != "default" else self._marker_background,
-            outline=outline if outline != "default" else self._marker_outline,
-            tags=("marker",),
-            width=border if border != "default" else self._marker_border
-        )
-        # Create the text
-        text = kwargs.get("text", None)
-        text_id = self._draw_text((x1, y1, x2, y2), text, foreground, font) if text is not None else None
-        # Save the marker
-        locals_ = locals()
-        self._markers[iid] = {
-            key: (
-                locals_[key.replace("hover_", "").replace("active_", "")] if key in (
-                    prefix + color for prefix in ["", "hover_", "active_"]
-                    for color in ["background", "foreground", "outline", "border"]
-                ) and key not in kwargs else (locals_[key] if key in locals_ else kwargs[key])
-            ) for key in self.marker_options
-        }
-        # Save the marker's Canvas IDs
-        self._canvas_markers[rectangle_id] = iid
-        self._canvas_markers[text_id] = iid
-        self._timeline.tag_lower("marker")
+        if iid in self._markers:
+            raise ValueError("iid argument already used by another marker: {}".format(iid))
+        text = kwargs.get("text", Marker.TAG_TEXT)
+        self._markers[iid] = Marker(iid, category, start, finish, text, tags, kwargs, defaults)
+        self._index_add(iid)
+        for tag in tags:
+            self._tag_markers.setdefault(tag, set()).add(iid)
         # Attempt to prevent duplicate iids
-        while str(self._iid) in self.markers:
+        while str(self._iid) in self._markers:
             self._iid += 1
         return iid
 
-    def _draw_text(self, coords, text, foreground, font):
-        """Draw the text and shorten it if required"""
+    def _draw_text(self, coords, text, foreground, font, text_id=None, tags=("marker",)):
+        """
+        Draw the text and shorten it if required, re-using text_id if given
+
+        :return: Canvas ID of the text and the text that was drawn
+        :rtype: tuple[int, str]
+        """
         if text is None:
-            return None
+            return None, None
         x1_r, _, x2_r, _ = coords
-        while True:
-            text_id = self._timeline.create_text(
-                (0, 0), text=text,
-                fill=foreground if foreground != "default" else self._marker_foreground,
-                font=font if font != "default" else self._marker_font,
-                tags=("marker",)
-            )
-            x1_t, _, x2_t, _ = self._timeline.bbox(text_id)
-            if (x2_t - x1_t) < (x2_r - x1_r):
-                break
-            self._timeline.delete(text_id)
-            text = text[:-4] + "..."
+        font = font if font != "default" else self._marker_font
+        text = self._fit_text(text, font, x2_r - x1_r)
         x, y = TimeLine.calculate_text_coords(coords)
-        self._timeline.coords(text_id, (x, y))
-        return text_id
+        options = {
+            "text": text,
+            "fill": foreground if foreground != "default" else self._marker_foreground,
+            "font": font,
+            "tags": tags
+        }
+        if text_id is None:
+            text_id = self._timeline.create_text((x, y), **options)
+        else:
+            self._timeline.coords(text_id, x, y)
+            self._timeline.itemconfigure(text_id, state=tk.NORMAL, **options)
+        return text_id, text
+
+    def _measure_text(self, font, text):
+        """Return the width of a text in pixels, cached by font and text"""
+        key = (font, text)
+        width = self._text_widths.get(key, None)
+        if width is not None:
+            self._text_widths.move_to_end(key)
+            return width
+        if font not in self._fonts:
+            self._fonts[font] = tkfont.Font(self, font=font)
+        width = self._fonts[font].measure(text)
+        self._text_widths[key] = width
+        if len(self._text_widths) > self.TEXT_CACHE_SIZE:
+            self._text_widths.popitem(last=False)
+        return width
+
+    def _fit_text(self, text, font, width):
+        """
+        Shorten a text so that it fits in a given width
+
+        The text is shortened to the longest prefix of the text that
+        still fits when "..." is appended to it, which is found with a
+        binary search. The results are cached by font, text and width.
+
+        :param text: Text to fit
+        :type text: str
+        :param font: Font tuple to draw the text with
+        :type font: tuple
+        :param width: Available width in pixels
+        :type width: float
+        :return: The text, shortened if required
+        :rtype: str
+        """
+        width = int(width)
+        key = (font, text, width)
+        fitted = self._text_fits.get(key, None)
+        if fitted is not None:
+            self._text_fits.move_to_end(key)
+            return fitted
+        if self._measure_text(font, text) < width:
+            fitted = text
+        else:
+            # Longest prefix that fits, "..." is used if none fits
+            lower, upper = 0, max(len(text) - 4, 0)
+            while lower < upper:
+                middle = (lower + upper + 1) // 2
+                if self._measure_text(font, text[:middle] + "...") < width:
+                    lower = middle
+                else:
+                    upper = middle - 1
+            fitted = text[:lower] + "..."
+        self._text_fits[key] = fitted
+        if len(self._text_fits) > self.TEXT_CACHE_SIZE:
+            self._text_fits.popitem(last=False)
+        return fitted
 
     def update_marker(self, iid, **kwargs):
         """
@@ -562,28 +1692,257 @@ class TimeLine(ttk.Frame):
         if iid not in self._markers:
             raise ValueError("Unknown iid passed as argument: {}".format(iid))
         self.check_kwargs(kwargs)
+        if kwargs.get("iid", iid) != iid:
+            # Changing the identifier requires a new marker
+            old = self._markers[iid]
+            # Only copy the marker specific options, so the marker keeps following its tags
+            marker = dict(old.options or {}, category=old.category, start=old.start, finish=old.finish,
+                          tags=old.tags)
+            if old._text is not Marker.TAG_TEXT:
+                marker["text"] = old.text
+            marker.update(kwargs)
+            self.delete_marker(iid)
+            return self.create_marker(marker["category"], marker["start"], marker["finish"], marker)
+        self._check_update(iid, kwargs)
+        summaries, created = self._update_marker(iid, kwargs)
+        if created:
+            self._timeline.tag_lower("marker")
+        for category, start, finish in summaries:
+            self._update_summaries(category, start, finish)
+        return iid
+
+    def update_markers(self, markers):
+        """
+        Change the options of multiple markers at once
+
+        All updates are validated before any of them is applied, and
+        the Canvas stacking order and level-of-detail summaries are only
+        updated once. Use this method to apply a refresh of the data
+        shown in the TimeLine.
+
+        :param markers: Dictionary of marker identifiers with the
+            dictionaries of options to update for that marker
+        :type markers: dict[str, dict[str, Any]]
+        :raises: ValueError
+        """
+        for iid, kwargs in markers.items():
+            if iid not in self._markers:
+                raise ValueError("Unknown iid passed as argument: {}".format(iid))
+            if kwargs.get("iid", iid) != iid:
+                raise ValueError("iid option cannot be changed in update_markers")
+            self._check_update(iid, kwargs)
+        categories, created = set(), False
+        for iid, kwargs in markers.items():
+            summaries, drawn = self._update_marker(iid, kwargs)
+            categories.update(category for category, start, finish in summaries)
+            created = created or drawn
+        if created:
+            self._timeline.tag_lower("marker")
+        if len(categories) != 0:
+            self._draw_summaries(categories)
+
+    def _check_update(self, iid, kwargs):
+        """Check the options to update for a marker"""
+        marker = self._markers[iid]
+        category = kwargs.get("category", marker.category)
+        start, finish = kwargs.get("start", marker.start), kwargs.get("finish", marker.finish)
+        self._check_marker(category, start, finish, kwargs)
+
+    def _update_marker(self, iid, kwargs):
+        """
+        Update a checked marker in place
+
+        Only the Canvas operations required for the changed options are
+        performed: style changes are a configuration of the items, time
+        and category changes move the items and text changes only fit
+        the text of this marker.
+
+        :return: (category, start, finish) ranges of which the summaries
+            must be redrawn and whether new Canvas items were created
+        :rtype: tuple[list[tuple], bool]
+        """
         marker = self._markers[iid]
-        marker.update(kwargs)
-        self.delete_marker(iid)
-        return self.create_marker(marker["category"], marker["start"], marker["finish"], marker)
+        summaries = [] if self._is_detailed(marker) else [(marker.category, marker.start, marker.finish)]
+        state = "active" if iid == self._active else "normal"
+        colors, font, text = self._state_colors(marker, state), marker["font"], marker.text
+        # Position
+        moved, duration = False, marker.finish - marker.start
+        for key in ("category", "start", "finish"):
+            if key in kwargs and kwargs[key] != getattr(marker, key):
+                moved = True
+        if moved:
+            self._index_remove(iid)
+            marker.category = kwargs.get("category", marker.category)
+            marker.start, marker.finish = kwargs.get("start", marker.start), kwargs.get("finish", marker.finish)
+            self._index_add(iid)
+        # Options
+        tags = kwargs.get("tags", marker.tags)
+        restyled = retagged = tags != marker.tags
+        if retagged:
+            for tag in marker.tags:
+                self._tag_markers[tag].discard(iid)
+            for tag in tags:
+                self._tag_markers.setdefault(tag, set()).add(iid)
+            marker.tags = tags
+            marker.defaults = self._resolve_tags(tags)
+        options = {key: value for key, value in kwargs.items()
+                   if key in Marker.DEFAULT_OPTIONS or key in Marker.STATE_OPTIONS}
+        if len(options) != 0:
+            marker.set_options(dict(marker.options or {}, **options))
+            restyled = True
+        if "text" in kwargs:
+            marker.text = kwargs["text"]
+        retext = marker.text != text
+        # Canvas items
+        if not self._is_detailed(marker):
+            summaries.append((marker.category, marker.start, marker.finish))
+        created = False
+        if marker.rectangle_id is None:
+            if self._is_detailed(marker) and \
+                    (not self._virtual or self._marker_in_region(marker, self._visible_region())):
+                self._draw_marker(iid)
+                created = True
+        elif not self._is_detailed(marker) or \
+                (self._virtual and not self._marker_in_region(marker, self._visible_region())):
+            self._release_marker(iid)
+        else:
+            coords = self._marker_coords(marker)
+            if moved:
+                self._timeline.coords(marker.rectangle_id, *coords)
+            new = self._state_colors(marker, state) if restyled else colors
+            if retext or marker["font"] != font or marker.finish - marker.start != duration:
+                self._update_text(iid, coords, new["foreground"])
+            elif marker.text_id is not None:
+                if moved:
+                    self._timeline.coords(marker.text_id, *TimeLine.calculate_text_coords(coords))
+                options = {"fill": new["foreground"]} if new["foreground"] != colors["foreground"] else {}
+                if retagged:
+                    options["tags"] = self._item_tags(tags)[1]
+                if len(options) != 0:
+                    self._timeline.itemconfigure(marker.text_id, **options)
+            options = {option: new[key] for key, option in TimeLine.RECTANGLE_COLORS if new[key] != colors[key]}
+            if retagged:
+                options["tags"] = self._item_tags(tags)[0]
+            if len(options) != 0:
+                self._timeline.itemconfigure(marker.rectangle_id, **options)
+        return summaries, created
+
+    def _update_text(self, iid, coords, foreground=None):
+        """Fit the text of a drawn marker to its rectangle coordinates"""
+        marker = self._markers[iid]
+        text_id = marker.text_id
+        if marker.text is None:
+            if text_id is not None:
+                self._canvas_markers.pop(text_id, None)
+                self._timeline.itemconfigure(text_id, state=tk.HIDDEN)
+                self._pool_texts.append(text_id)
+                marker.text_id = None
+            self._shortened.discard(iid)
+            return
+        if text_id is None and len(self._pool_texts) != 0:
+            text_id = self._pool_texts.pop()
+        foreground = marker["foreground"] if foreground is None else foreground
+        text_id, text = self._draw_text(
+            coords, marker.text, foreground, marker["font"], text_id, self._item_tags(marker.tags)[1])
+        if marker.text_id is None:
+            self._timeline.tag_raise(text_id, marker.rectangle_id)
+            self._canvas_markers[text_id] = iid
+        marker.text_id = text_id
+        if text != marker.text:
+            self._shortened.add(iid)
+        else:
+            self._shortened.discard(iid)
 
     def delete_marker(self, iid):
         """
         Delete a marker from the TimeLine
 
-        :param iid: marker identifier
+        :param iid: marker identifier, or tk.ALL to delete all markers
         :type iid: str
         """
         if iid == tk.ALL:
-            for iid in self.markers.keys():
-                self.delete_marker(iid)
+            self.clear_markers()
             return
-        options = self._markers[iid]
-        rectangle_id, text_id = options["rectangle_id"], options["text_id"]
-        del self._canvas_markers[rectangle_id]
-        del self._canvas_markers[text_id]
+        marker = self._remove_marker(iid)
+        if marker.rectangle_id is not None:
+            self._timeline.delete(marker.rectangle_id, marker.text_id)
+        elif not self._is_detailed(marker):
+            self._update_summaries(marker.category, marker.start, marker.finish)
+
+    def delete_markers(self, iids):
+        """
+        Delete multiple markers from the TimeLine at once
+
+        The Canvas items of the markers are deleted in a single
+        operation, and the summaries are only redrawn once.
+
+        :param iids: marker identifiers
+        :type iids: Iterable[str]
+        :raises: ValueError
+        """
+        iids = set(iids)
+        for iid in iids:
+            if iid not in self._markers:
+                raise ValueError("Unknown iid passed as argument: {}".format(iid))
+        if len(iids) == len(self._markers):
+            self.clear_markers()
+            return
+        items, categories = [], set()
+        for iid in iids:
+            marker = self._remove_marker(iid)
+            if marker.rectangle_id is not None:
+                items.append(marker.rectangle_id)
+                if marker.text_id is not None:
+                    items.append(marker.text_id)
+            elif not self._is_detailed(marker):
+                categories.add(marker.category)
+        if len(items) != 0:
+            self._timeline.delete(*items)
+        if len(categories) != 0:
+            self._draw_summaries(categories)
+
+    def clear_markers(self):
+        """
+        Delete all markers from the TimeLine
+
+        All marker Canvas items are deleted by their tag in a single
+        operation, and the marker indexes are reset at once.
+        """
+        self._timeline.delete("marker", "summary")
+        del self._pool_rectangles[:]
+        del self._pool_texts[:]
+        self._summaries.clear()
+        self._markers.clear()
+        self._canvas_markers.clear()
+        self._drawn.clear()
+        self._shortened.clear()
+        self._index.clear()
+        for iids in self._tag_markers.values():
+            iids.clear()
+        self._active = None
+        self._drag_iid = None
+        self.draw_overview()
+
+    def _remove_marker(self, iid):
+        """
+        Remove a marker from the internal structures, without deleting
+        its Canvas items
+
+        :return: the removed marker
+        :rtype: Marker
+        """
+        marker = self._markers[iid]
+        self._canvas_markers.pop(marker.rectangle_id, None)
+        self._canvas_markers.pop(marker.text_id, None)
+        self._drawn.discard(iid)
+        self._shortened.discard(iid)
+        self._index_remove(iid)
+        for tag in marker.tags:
+            self._tag_markers[tag].discard(iid)
         del self._markers[iid]
-        self._timeline.delete(rectangle_id, text_id)
+        if self._active == iid:
+            self._active = None
+        return marker
 
     def zoom_in(self):
         """Increase zoom factor and redraw TimeLine"""
@@ -591,11 +1950,12 @@ class TimeLine(ttk.Frame):
         if index + 1 == len(self._zoom_factors):
             # Already zoomed in all the way
             return
+        previous = self._zoom_factor
         self._zoom_factor = self._zoom_factors[index + 1]
         if self._zoom_factors.index(self.zoom_factor) + 1 == len(self._zoom_factors):
             self._button_zoom_in.config(state=tk.DISABLED)
         self._button_zoom_out.config(state=tk.NORMAL)
-        self.draw_timeline()
+        self._rescale(previous)
 
     def zoom_out(self):
         """Decrease zoom factor and redraw TimeLine"""
@@ -603,14 +1963,16 @@ class TimeLine(ttk.Frame):
         if index == 0:
             # Already zoomed out all the way
             return
+        previous = self._zoom_factor
         self._zoom_factor = self._zoom_factors[index - 1]
         if self._zoom_factors.index(self._zoom_factor) == 0:
             self._button_zoom_out.config(state=tk.DISABLED)
         self._button_zoom_in.config(state=tk.NORMAL)
-        self.draw_timeline()
+        self._rescale(previous)
 
     def zoom_reset(self):
         """Reset the zoom factor to default and redraw TimeLine"""
+        previous = self._zoom_factor
         self._zoom_factor = self._zoom_factors[0] if self._zoom_default == 0 else self._zoom_default
         if self._zoom_factors.index(self._zoom_factor) == 0:
             self._button_zoom_out.config(state=tk.DISABLED)
@@ -618,7 +1980,7 @@ class TimeLine(ttk.Frame):
         elif self._zoom_factors.index(self.zoom_factor) + 1 == len(self._zoom_factors):
             self._button_zoom_out.config(state=tk.NORMAL)
             self._button_zoom_in.config(state=tk.DISABLED)
-        self.draw_timeline()
+        self._rescale(previous)
 
     def set_zoom_factor(self, factor):
         """
@@ -627,8 +1989,127 @@ class TimeLine(ttk.Frame):
         :param factor: Custom zoom factor
         :type factor: float
         """
+        previous = self._zoom_factor
         self._zoom_factor = factor
-        self.draw_timeline()
+        self._rescale(previous)
+
+    def _rescale(self, previous):
+        """
+        Apply a changed zoom factor to the drawn TimeLine
+
+        Instead of redrawing the whole TimeLine, the items on the
+        TimeLine Canvas are scaled horizontally in place. Only the texts
+        of the markers that may have to be shortened or lengthened are
+        fitted again, and only the ticks are drawn again.
+
+        :param previous: Zoom factor the TimeLine was drawn with
+        :type previous: float
+        """
+        if self._time_marker_line is None:
+            # Not drawn yet, draw_timeline is called by __init__
+            return
+        ratio = self._zoom_factor / previous
+        self._timeline.scale(tk.ALL, 0, 0, ratio, 1.0)
+        self._timeline.config(width=self.pixel_width)
+        # Zooming in only changes texts that did not fit before
+        iids = self._drawn if ratio < 1.0 else self._shortened.copy()
+        for iid in iids:
+            marker = self._markers[iid]
+            if marker.text_id is None:
+                continue
+            _, text = self._draw_text(
+                self._marker_coords(marker), marker.text, marker["foreground"], marker["font"], marker.text_id,
+                self._item_tags(marker.tags)[1])
+            if text != marker.text:
+                self._shortened.add(iid)
+            else:
+                self._shortened.discard(iid)
+        self._redraw_ticks(ratio)
+        if self._virtual or self._lod_threshold != 0:
+            self._update_drawn_markers()
+        self._update_overview_viewport()
+
+    def _redraw_ticks(self, ratio=1.0):
+        """
+        Redraw the ticks and the time marker on the ticks Canvas
+
+        :param ratio: Ratio to scale the time marker position with
+        :type ratio: float
+        """
+        x, y = self._canvas_ticks.coords(self._time_marker_image)
+        self._canvas_ticks.delete(tk.ALL)
+        self.draw_ticks()
+        self._time_marker_image = self._canvas_ticks.create_image((x * ratio, y), image=self._time_marker)
+
+    def append_marker(self, category, start, finish, **kwargs):
+        """
+        Append a marker to a live TimeLine
+
+        Intended for feeding the TimeLine from a live source of events.
+        If the marker finishes after the end of the TimeLine, the time
+        range is extended without redrawing the whole TimeLine. The
+        range is extended by at least a tenth of its length, so that
+        appending many markers does not extend it each time.
+
+        If the follow option is set, the TimeLine is scrolled to keep the
+        latest finish time in view. If the retention option is set,
+        markers that finished longer than retention before the latest
+        finish time are deleted.
+
+        Supports the same arguments as :meth:`create_marker`.
+
+        :return: identifier of the created marker
+        :rtype: str
+        :raise ValueError: One of the specified arguments is invalid
+        """
+        if finish > self._finish:
+            self._extend_timeline(max(finish, self._finish + (self._finish - self._start) * 0.1))
+        iid = self.create_marker(category, start, finish, **kwargs)
+        self._stream_time = finish if self._stream_time is None else max(self._stream_time, finish)
+        if self._retention > 0.0:
+            self._evict_markers(self._stream_time - self._retention)
+        if self._follow:
+            self.see_time(self._stream_time)
+        return iid
+
+    def _extend_timeline(self, finish):
+        """Move the end of the TimeLine to finish without a full redraw"""
+        previous = self.pixel_width
+        self._finish = finish
+        if self._time_marker_line is None:
+            # Not drawn yet, draw_timeline is called by __init__
+            return
+        self._timeline.scale("separator", 0, 0, self.pixel_width / previous, 1.0)
+        self._timeline.config(width=self.pixel_width)
+        self.__configure_timeline()
+        self._redraw_ticks()
+        self.draw_overview()
+
+    def _evict_markers(self, time):
+        """Delete all markers that finished before a certain time"""
+        iids = []
+        for index in self._index.values():
+            iids.extend(iid for iid in index.find(float("-inf"), time) if self._markers[iid].finish < time)
+        if len(iids) != 0:
+            self.delete_markers(iids)
+
+    def see_time(self, time):
+        """
+        Scroll the TimeLine horizontally so that a time is in view
+
+        Does nothing if the time is already in view, otherwise the
+        TimeLine is scrolled so that the time is at the right edge.
+
+        :param time: Time to bring into view
+        :type time: float
+        """
+        x = self.get_time_position(min(max(time, self._start), self._finish))
+        width = self._canvas_scroll.winfo_width()
+        width = width if width > 1 else self._width
+        left = self._canvas_scroll.canvasx(0)
+        if left <= x <= left + width:
+            return
+        self._set_scroll("moveto", max(x - width, 0) / self.pixel_width)
 
     def set_time(self, time):
         """
@@ -637,7 +2118,11 @@ class TimeLine(ttk.Frame):
         :param time: Time to set for the time marker on the TimeLine
         :type time: float
         """
-        x = self.get_time_position(time)
+        self._place_time_marker(self.get_time_position(time))
+        self._seek_playback(time)
+
+    def _place_time_marker(self, x):
+        """Move the time marker to an x-coordinate"""
         _, y = self._canvas_ticks.coords(self._time_marker_image)
         self._canvas_ticks.coords(self._time_marker_image, x, y)
         self._timeline.coords(self._time_marker_line, x, 0, x, self._timeline.winfo_height())
@@ -647,11 +2132,126 @@ class TimeLine(ttk.Frame):
         limit = self.pixel_width
         x = self._canvas_ticks.canvasx(event.x)
         x = min(max(x, 0), limit)
-        _, y = self._canvas_ticks.coords(self._time_marker_image)
-        self._canvas_ticks.coords(self._time_marker_image, x, y)
-        self._timeline.coords(self._time_marker_line, x, 0, x, self._timeline.winfo_height())
+        self._place_time_marker(x)
+        self._seek_playback(self.get_position_time(x))
         self._time_show()
 
+    @property
+    def playing(self):
+        """
+        Whether the time marker is being played back
+
+        :rtype: bool
+        """
+        return self._play_after_id is not None
+
+    def play(self, speed=None):
+        """
+        Start moving the time marker forward in real time
+
+        The time marker is moved at most max_update_rate times per
+        second, and the TimeLine is scrolled to keep it in view. Frames
+        are timed relative to the start of playback, so delays in the
+        main loop do not accumulate. The enter_callback and
+        exit_callback of the tags of markers are called as the time
+        marker enters and exits the markers.
+
+        :param speed: Amount of time to advance per second, changes the
+            playback_speed option if given
+        :type speed: float
+        """
+        if speed is not None:
+            if not isinstance(speed, float):
+                raise TypeError("speed argument is not of float type")
+            if not speed > 0.0:
+                raise ValueError("speed argument is not larger than zero")
+            self._playback_speed = speed
+        if self.playing:
+            self.pause()
+        time = self.time
+        if time >= self._finish:
+            time = self._start
+            self._place_time_marker(self.get_time_position(time))
+        self._play_origin = (perf_counter(), time)
+        self._play_frame = 0
+        self._update_playback(time, False)
+        self._play_after_id = self.after(self._update_interval, self._play_step)
+
+    def pause(self):
+        """Stop moving the time marker"""
+        if self._play_after_id is None:
+            return
+        self.after_cancel(self._play_after_id)
+        self._play_after_id = None
+
+    def _play_step(self):
+        """Move the time marker for a single frame of playback"""
+        clock, start = self._play_origin
+        now = perf_counter()
+        current = start + (now - clock) * self._playback_speed
+        self._play_frame += 1
+        if current >= self._finish:
+            if not self._playback_loop:
+                self._play_after_id = None
+                self._place_time_marker(self.pixel_width)
+                self._update_playback(self._finish, True)
+                return
+            self._update_playback(self._finish, True)
+            current = self._start
+            self._play_origin, self._play_frame = (now, current), 0
+            self._update_playback(current, False)
+        else:
+            self._update_playback(current, True)
+        x = self.get_time_position(current)
+        self._place_time_marker(x)
+        # Keep the time marker in view, scrolling a whole page at once
+        width = self._canvas_scroll.winfo_width()
+        width = width if width > 1 else self._width
+        left = self._canvas_scroll.canvasx(0)
+        if not left <= x <= left + width:
+            self._set_scroll("moveto", x / self.pixel_width)
+        # Schedule the next frame relative to the start of playback to compensate for drift
+        clock, _ = self._play_origin
+        delay = clock + (self._play_frame + 1) * self._update_interval / 1000 - perf_counter()
+        self._play_after_id = self.after(max(int(delay * 1000), 1), self._play_step)
+
+    def _seek_playback(self, time):
+        """Continue playback from a time the time marker was moved to"""
+        if not self.playing:
+            return
+        self._play_origin, self._play_frame = (perf_counter(), time), 0
+        self._update_playback(time, False)
+
+    def _update_playback(self, time, passed):
+        """
+        Call the enter and exit callbacks for the markers the time
+        marker entered or exited
+
+        The markers are found through the interval indexes, so the cost
+        only depends on the amount of markers around the time marker.
+
+        :param time: New time of the time marker
+        :type time: float
+        :param passed: Whether the time marker moved continuously from
+            the previous time, in which case the markers it passed
+            completely are entered and exited as well
+        :type passed: bool
+        """
+        current, between = set(), set()
+        for index in self._index.values():
+            current.update(index.find(time, time))
+            if passed and self._play_time is not None:
+                between.update(index.find(min(self._play_time, time), max(self._play_time, time)))
+        skipped = between - current - self._play_markers
+        entered = (current - self._play_markers) | skipped
+        exited = (self._play_markers - current) | skipped
+        self._play_markers, self._play_time = current, time
+        for iid in sorted(entered, key=lambda iid: self._markers[iid].start):
+            self.call_callbacks(iid, "enter_callback", (iid, time))
+        for iid in sorted(exited, key=lambda iid: self._markers[iid].start if iid in self._markers else time):
+            if iid in self._markers:
+                self.call_callbacks(iid, "exit_callback", (iid, time))
+
     def _time_marker_release(self, event):
         """Callback for <B1-Release> Event: Hide time marker window"""
         if not self._time_visible:
@@ -700,28 +2300,114 @@ class TimeLine(ttk.Frame):
             a marker. Arguments to callback:
             ``(iid: str, x_coord: int, y_coord: int)``
         :type right_callback: callable
+        :param enter_callback: Callback to be called when the time
+            marker enters a marker during playback. Arguments to
+            callback: ``(iid: str, time: float)``
+        :type enter_callback: callable
+        :param exit_callback: Callback to be called when the time
+            marker exits a marker during playback. Arguments to
+            callback: ``(iid: str, time: float)``
+        :type exit_callback: callable
         :param menu: A Menu widget to show upon right click. Can be
             used with the right_callback option simultaneously.
         :type menu: tk.Menu
 
-        In addition, supports all options supported by markers. Note
-        that tag options are applied to markers upon marker creation,
-        and thus is a tag is updated, the markers are not automatically
-        updated as well.
+        In addition, supports all options supported by markers. Markers
+        with the tag follow the options of the tag, and if a tag is
+        updated, the markers with the tag are restyled as well. Options
+        set for a specific marker take precedence over tag options.
         """
         callbacks = [
             kwargs.get("move_callback", None),
             kwargs.get("left_callback", None),
-            kwargs.get("right_callback", None)
+            kwargs.get("right_callback", None),
+            kwargs.get("enter_callback", None),
+            kwargs.get("exit_callback", None)
         ]
         for callback in callbacks:
             if callback is not None and not callable(callback):
                 raise ValueError("One or more callbacks is not a callable object")
+        # Update the shared options and callbacks in place, so the markers see the changes without being touched
+        changed = {tags: dict(options) for tags, options in self._tag_options.items() if tag_name in tags}
         self._tags[tag_name] = kwargs
+        for tags, options in changed.items():
+            self._resolve_tags(tags, update=True)
+            changed[tags] = {key for key in set(options) | set(self._tag_options[tags])
+                             if options.get(key, "default") != self._tag_options[tags].get(key, "default")}
+        self._restyle_markers(tag_name, changed)
+
+    def _resolve_tags(self, tags, update=False):
+        """
+        Get the options set by a combination of tags
+
+        The options and the callbacks of a combination of tags are
+        computed once and shared by all the markers with those tags.
+        The last tag always takes precedence over the ones before it.
+
+        :param tags: tags of a marker
+        :type tags: tuple[str]
+        :param update: Recompute the options and callbacks in place
+        :type update: bool
+        :rtype: dict[str, Any]
+        """
+        options = self._tag_options.get(tags, None)
+        if options is not None and not update:
+            return options
+        options = self._tag_options.setdefault(tags, {})
+        callbacks = self._tag_callbacks.setdefault(tags, {})
+        options.clear()
+        callbacks.clear()
+        for tag in tags:
+            for key, value in self._tags[tag].items():
+                if key.endswith("_callback"):
+                    if value is not None:
+                        callbacks.setdefault(key, []).append(value)
+                elif key == "text" or key in Marker.DEFAULT_OPTIONS or key in Marker.STATE_OPTIONS:
+                    options[key] = value
+        return options
+
+    def _restyle_markers(self, tag_name, changed):
+        """
+        Apply changed tag options to the drawn markers with a tag
+
+        The colors are configured with a single call for each Canvas tag
+        of a combination of tags. Only the markers that override the
+        changed colors, the active marker and the markers of which the
+        text must be fitted again are updated one by one.
+
+        :param tag_name: Identifier of the changed tag
+        :type tag_name: str
+        :param changed: Names of the changed options for each
+            combination of tags that includes the tag
+        :type changed: dict[tuple[str], set[str]]
+        """
+        for tags, keys in changed.items():
+            if len(keys) == 0 or tags not in self._canvas_tags:
+                continue
+            (_, rectangle_tag), (_, text_tag) = self._canvas_tags[tags]
+            options = self._tag_options[tags]
+            colors = {key: options.get(key, "default") for key in ("background", "foreground", "outline", "border")}
+            colors = {key: getattr(self, "_marker_" + key) if value == "default" else value
+                      for key, value in colors.items()}
+            rectangle = {option: colors[key] for key, option in TimeLine.RECTANGLE_COLORS if key in keys}
+            if len(rectangle) != 0:
+                self._timeline.itemconfigure(rectangle_tag, **rectangle)
+            if "foreground" in keys:
+                self._timeline.itemconfigure(text_tag, fill=colors["foreground"])
+        for iid in self._tag_markers.get(tag_name, ()):
+            marker = self._markers[iid]
+            keys = changed.get(marker.tags, ())
+            if iid not in self._drawn or len(keys) == 0:
+                continue
+            state = "active" if iid == self._active else "normal"
+            if "font" in keys or ("text" in keys and marker._text is Marker.TAG_TEXT):
+                self._update_text(iid, self._marker_coords(marker), self._state_colors(marker, state)["foreground"])
+            if state == "active" or (marker.options is not None and not keys.isdisjoint(marker.options)):
+                self.update_state(iid, state)
 
     def marker_tags(self, iid):
         """Generator for all the tags of a certain marker"""
-        tags = self._markers[iid]["tags"]
+        tags = self._markers[iid].tags
         for tag in tags:
             yield tag
 
@@ -729,23 +2415,33 @@ class TimeLine(ttk.Frame):
         """Scroll both categories Canvas and scrolling container"""
         self._canvas_categories.yview(*args)
         self._canvas_scroll.yview(*args)
+        self._update_visible_markers()
+        self._update_visible_categories()
 
     def _mouse_scroll_h(self, event):
         """Callback <Shift-MouseWheel> event for horizontal scrolling"""
         args = (int(-1 * (event.delta / 120)), "units")
         self._canvas_scroll.xview_scroll(*args)
         self._canvas_ticks.xview_scroll(*args)
+        self._update_visible_markers()
+        self._update_visible_ticks()
+        self._update_overview_viewport()
 
     def _mouse_scroll_v(self, event):
         """Callback for <MouseWheel> event for vertical scrolling"""
         args = (int(-1 * (event.delta / 120)), "units")
         self._canvas_scroll.yview_scroll(*args)
         self._canvas_categories.yview_scroll(*args)
+        self._update_visible_markers()
+        self._update_visible_categories()
 
     def _set_scroll(self, *args):
         """Set horizontal scroll of scroll container and ticks Canvas"""
         self._canvas_scroll.xview(*args)
         self._canvas_ticks.xview(*args)
+        self._update_visible_markers()
+        self._update_visible_ticks()
+        self._update_overview_viewport()
 
     def get_time_position(self, time):
         """
@@ -814,20 +2510,64 @@ class TimeLine(ttk.Frame):
         """Function bound to left click event for marker canvas"""
         self.update_active()
         iid = self.current_iid
+        self._drag_iid = iid
         if iid is None:
             return
         args = (iid, event.x_root, event.y_root)
         self.call_callbacks(iid, "left_callback", args)
 
     def _left_motion(self, event):
-        """Function bound to move event for marker canvas"""
-        iid = self.current_iid
-        if iid is None:
+        """
+        Function bound to move event for marker canvas
+
+        Motion events are coalesced: only the latest event is processed,
+        at most max_update_rate times per second.
+        """
+        self._motion_event = event
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after(self._update_interval, self._process_motion)
+
+    def _process_motion(self):
+        """Move the dragged marker for the latest motion event"""
+        self._motion_after_id = None
+        event, self._motion_event = self._motion_event, None
+        if event is not None:
+            self._move_marker(event)
+
+    def _left_release(self, event):
+        """Function bound to left release event for marker canvas"""
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._process_motion()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._settle_move()
+        self._drag_iid = None
+
+    def _settle_move(self):
+        """Call the move callbacks once the dragged marker has settled"""
+        self._after_id = None
+        iid = self._drag_iid
+        origin, self._move_origin = self._move_origin, None
+        if iid is None or origin is None or iid not in self._markers:
+            return
+        marker = self._markers[iid]
+        self._after_handler(iid, "move_callback", (iid, origin, (marker.start, marker.finish)))
+
+    @property
+    def _update_interval(self):
+        """Minimum amount of milliseconds between processed motion events"""
+        return max(int(1000 / self._max_update_rate), 1)
+
+    def _move_marker(self, event):
+        """Move the dragged marker to the position of a motion event"""
+        iid = self._drag_iid
+        if iid is None or iid not in self._markers:
             return
         marker = self._markers[iid]
         if marker["move"] is False:
             return
-        delta = marker["finish"] - marker["start"]
+        delta = marker.finish - marker.start
         # Limit x to 0
         x = max(self._timeline.canvasx(event.x), 0)
         # Check if the timeline needs to be extended
@@ -835,65 +2575,89 @@ class TimeLine(ttk.Frame):
         if self._extend is False:
             x = min(x, limit)
         elif x > limit:  # self._extend is True
-            self.configure(finish=(self.get_position_time(x) + (marker["finish"] - marker["start"])) * 1.1)
+            self._extend_timeline((self.get_position_time(x) + (marker.finish - marker.start)) * 1.1)
         # Get the new start value
         start = self.get_position_time(x)
-        finish = start + (marker["finish"] - marker["start"])
-        rectangle_id, text_id = marker["rectangle_id"], marker["text_id"]
-        if rectangle_id not in self._timeline.find_all():
+        finish = start + (marker.finish - marker.start)
+        rectangle_id, text_id = marker.rectangle_id, marker.text_id
+        if rectangle_id is None:
             return
         x1, y1, x2, y2 = self._timeline.coords(rectangle_id)
         # Overlap protection
         allow_overlap = marker["allow_overlap"]
         allow_overlap = self._marker_allow_overlap if allow_overlap == "default" else allow_overlap
         if allow_overlap is False:
-            for marker_dict in self.markers.values():
+            for other in self.find_markers(marker.category, start, finish):
+                marker_dict = self._markers[other]
                 if marker_dict["allow_overlap"] is True:
                     continue
-                if marker["iid"] != marker_dict["iid"] and marker["category"] == marker_dict["category"]:
-                    if marker_dict["start"] < start < marker_dict["finish"]:
-                        start = marker_dict["finish"] if start < marker_dict["finish"] else marker_dict["start"]
-                        finish = start + (marker["finish"] - marker["start"])
+                if marker.iid != marker_dict.iid:
+                    if marker_dict.start < start < marker_dict.finish:
+                        start = marker_dict.finish if start < marker_dict.finish else marker_dict.start
+                        finish = start + (marker.finish - marker.start)
                         x = self.get_time_position(start)
                         break
-                    if marker_dict["start"] < finish < marker_dict["finish"]:
-                        finish = marker_dict["finish"] if finish > marker_dict["finish"] else marker_dict["start"]
-                        start = finish - (marker_dict["finish"] - marker_dict["start"])
+                    if marker_dict.start < finish < marker_dict.finish:
+                        finish = marker_dict.finish if finish > marker_dict.finish else marker_dict.start
+                        start = finish - (marker_dict.finish - marker_dict.start)
                         x = self.get_time_position(start)
                         break
+        self._index_remove(iid)
         # Vertical movement
         if marker["change_category"] is True or \
                 (marker["change_category"] == "default" and self._marker_change_category):
             y = max(self._timeline.canvasy(event.y), 0)
-            category = min(self._rows.keys(), key=lambda category: abs(self._rows[category][0] - y))
-            marker["category"] = category
-            y1, y2 = self._rows[category]
+            category = self._nearest_row(y)
+            if category is not None:
+                marker.category = category
+                y1, y2 = self._rows[category]
         # Snapping to ticks
         if marker["snap_to_ticks"] is True or (marker["snap_to_ticks"] == "default" and self._marker_snap_to_ticks):
             # Start is prioritized over finish
-            for tick in self._ticks:
-                tick = self.get_time_position(tick)
-                # Start
-                if abs(x - tick) < self._snap_margin:
-                    x = tick
-                    break
-                # Finish
-                x_finish = x + delta
-                if abs(x_finish - tick) < self._snap_margin:
-                    delta = self.get_time_position(marker["finish"] - marker["start"])
-                    x = tick - delta
-                    break
+            width = delta / self._resolution * self._zoom_factor
+            tick = self._nearest_tick(x)
+            if tick is not None and abs(x - tick) < self._snap_margin:
+                x = tick
+            else:
+                tick = self._nearest_tick(x + width)
+                if tick is not None and abs(x + width - tick) < self._snap_margin:
+                    x = tick - width
+            start = self.get_position_time(x)
+            finish = start + delta
         rectangle_coords = (x, y1, x2 + (x - x1), y2)
         self._timeline.coords(rectangle_id, *rectangle_coords)
         if text_id is not None:
             text_x, text_y = TimeLine.calculate_text_coords(rectangle_coords)
             self._timeline.coords(text_id, text_x, text_y)
+        if self._move_origin is None:
+            self._move_origin = (marker.start, marker.finish)
         if self._after_id is not None:
             self.after_cancel(self._after_id)
-        args = (iid, (marker["start"], marker["finish"]), (start, finish))
-        self._after_id = self.after(10, self._after_handler(iid, "move_callback", args))
-        marker["start"] = start
-        marker["finish"] = finish
+        self._after_id = self.after(self._update_interval, self._settle_move)
+        marker.start = start
+        marker.finish = finish
+        self._index_add(iid)
+
+    def _nearest_row(self, y):
+        """Return the category of the row with its top closest to y"""
+        index = TimeLine._nearest_index(self._row_tops, y)
+        return self._row_categories[index] if index is not None else None
+
+    @staticmethod
+    def _nearest_index(values, value):
+        """Return the index of the item in a sorted list closest to value"""
+        if len(values) == 0:
+            return None
+        index = bisect_left(values, value)
+        if index == len(values) or (index > 0 and value - values[index - 1] <= values[index] - value):
+            return index - 1
+        return index
+
+    @staticmethod
+    def _nearest(values, value):
+        """Return the item in a sorted list closest to value"""
+        index = TimeLine._nearest_index(values, value)
+        return values[index] if index is not None else None
 
     def _enter_handler(self, event):
         """Callback for :obj:`<Enter>` event on marker, to set hover options"""
@@ -921,16 +2685,25 @@ class TimeLine(ttk.Frame):
         if state not in ["normal", "hover", "active"]:
             raise ValueError("Invalid state: {}".format(state))
         marker = self._markers[iid]
-        rectangle_id, text_id = marker["rectangle_id"], marker["text_id"]
+        rectangle_id, text_id = marker.rectangle_id, marker.text_id
+        if rectangle_id is None:
+            # Marker is not drawn in virtual mode
+            return
+        colors = self._state_colors(marker, state)
+        self._timeline.itemconfigure(rectangle_id, fill=colors["background"], width=colors["border"],
+                                     outline=colors["outline"])
+        if text_id is not None:
+            self._timeline.itemconfigure(text_id, fill=colors["foreground"])
+
+    def _state_colors(self, marker, state):
+        """Return the colors of a marker in a state with the defaults resolved"""
         state = "" if state == "normal" else state + "_"
         colors = {}
         for color_type in ["background", "foreground", "outline", "border"]:
             value = marker[state + color_type]
             attribute = "_marker_{}".format(color_type)
             colors[color_type] = getattr(self, attribute) if value == "default" else value
-        self._timeline.itemconfigure(rectangle_id, fill=colors["background"], width=colors["border"],
-                                     outline=colors["outline"])
-        self._timeline.itemconfigure(text_id, fill=colors["foreground"])
+        return colors
 
     def update_active(self):
         """Update the active marker on the marker Canvas"""
@@ -962,13 +2735,13 @@ class TimeLine(ttk.Frame):
         :return: amount of callbacks called
         :rtype: int
         """
-        amount = 0
-        for tag in self.marker_tags(iid):
-            callback = self._tags[tag].get(type, None)
-            if callback is not None:
-                amount += 1
-                callback(*args)
-        return amount
+        tags = self._markers[iid].tags
+        if tags not in self._tag_callbacks:
+            self._resolve_tags(tags)
+        callbacks = self._tag_callbacks[tags].get(type, ())
+        for callback in callbacks:
+            callback(*args)
+        return len(callbacks)
 
     @property
     def time(self):
@@ -1014,11 +2787,15 @@ class TimeLine(ttk.Frame):
     @property
     def markers(self):
         """
-        Return a dictionary with categories as keys
+        Return a dictionary with the marker identifiers as keys and
+        dictionaries of the marker options as values
+
+        The dictionaries are created upon each call, so modifying them
+        does not affect the markers.
 
         :rtype: dict[str, dict[str, Any]]
         """
-        return self._markers
+        return {iid: marker.as_dict() for iid, marker in self._markers.items()}
 
     @property
     def zoom_factor(self):
@@ -1045,6 +2822,8 @@ class TimeLine(ttk.Frame):
             # TimeLine options
             "width", "height", "extend", "start", "finish", "resolution", "tick_resolution", "unit", "zoom_enabled",
             "categories", "background", "style", "zoom_factors", "zoom_default", "extend", "menu", "autohidescrollbars", "snap_margin",
+            "virtual", "virtual_margin", "lod_threshold", "follow", "retention", "max_update_rate", "canvas_labels", "overview",
+            "playback_speed", "playback_loop",
             # Marker options
             "marker_font", "marker_background", "marker_foreground", "marker_outline", "marker_border", "marker_move",
             "marker_change_category", "marker_allow_overlap", "marker_snap_to_ticks"
@@ -1053,16 +2832,14 @@ class TimeLine(ttk.Frame):
     @property
     def marker_options(self):
         """List of available options to create_marker"""
-        return ["category", "start", "finish", "text", "font", "iid", "tags", "move", "rectangle_id", "text_id",
-                "allow_overlap", "change_category", "snap_to_ticks"] + \
-               [prefix + item for prefix in ["hover_", "active_", ""]
-                for item in ["background", "foreground", "outline", "border"]]
+        return list(Marker.OPTIONS)
 
     def configure(self, cnf={}, **kwargs):
         """Update options of the TimeLine widget"""
         kwargs.update(cnf)
         TimeLine.check_kwargs(kwargs)
         scrollbars = 'autohidescrollbars' in kwargs
+        labels = "canvas_labels" in kwargs and kwargs["canvas_labels"] != self._canvas_labels
         for option in self.options:
             attribute = "_" + option
             setattr(self, attribute, kwargs.pop(option, getattr(self, attribute)))
@@ -1078,8 +2855,15 @@ class TimeLine(ttk.Frame):
             self._canvas_scroll.config(xscrollcommand=self._scrollbar_timeline.set,
                                        yscrollcommand=self._scrollbar_vertical.set)
             self._canvas_categories.config(yscrollcommand=self._scrollbar_vertical.set)
-            self._scrollbar_timeline.grid(column=1, row=2, padx=(0, 5), pady=(0, 5), sticky="we")
+            self._scrollbar_timeline.grid(column=1, row=3, padx=(0, 5), pady=(0, 5), sticky="we")
             self._scrollbar_vertical.grid(column=2, row=0, pady=5, padx=(0, 5), sticky="ns")
+        if self._overview:
+            self._canvas_overview.grid(column=1, row=2, padx=(0, 5), pady=(0, 5), sticky="we")
+        else:
+            self._canvas_overview.grid_remove()
+        if labels:
+            self.draw_categories()
+            self._grid_categories()
         ttk.Frame.configure(self, **kwargs)
         self.draw_timeline()
 
@@ -1103,10 +2887,10 @@ class TimeLine(ttk.Frame):
         items drawn on the timeline Canvas. All modifications are
         overwritten when the TimeLine is redrawn.
         """
-        rectangle_id, text_id = self._markers[iid]["rectangle_id"], self._markers[iid]["text_id"]
-        if len(rectangle_options) != 0:
+        rectangle_id, text_id = self._markers[iid].rectangle_id, self._markers[iid].text_id
+        if len(rectangle_options) != 0 and rectangle_id is not None:
             self._timeline.itemconfigure(rectangle_id, **rectangle_options)
-        if len(text_options) != 0:
+        if len(text_options) != 0 and text_id is not None:
             self._timeline.itemconfigure(text_id, **text_options)
 
     @staticmethod
@@ -1196,6 +2980,46 @@ class TimeLine(ttk.Frame):
         autohidescrollbars = kwargs.get("autohidescrollbars", False)
         if not isinstance(autohidescrollbars, bool):
             raise TypeError("autohidescrollbars argument is not of bool type")
+        virtual = kwargs.get("virtual", False)
+        if not isinstance(virtual, bool):
+            raise TypeError("virtual argument is not of bool type")
+        virtual_margin = kwargs.get("virtual_margin", 100)
+        if not isinstance(virtual_margin, int):
+            raise TypeError("virtual_margin argument is not of int type")
+        if not virtual_margin >= 0:
+            raise ValueError("virtual_margin argument is smaller than zero")
+        lod_threshold = kwargs.get("lod_threshold", 0)
+        if not isinstance(lod_threshold, int):
+            raise TypeError("lod_threshold argument is not of int type")
+        if not lod_threshold >= 0:
+            raise ValueError("lod_threshold argument is smaller than zero")
+        follow = kwargs.get("follow", False)
+        if not isinstance(follow, bool):
+            raise TypeError("follow argument is not of bool type")
+        retention = kwargs.get("retention", 0.0)
+        if not isinstance(retention, float):
+            raise TypeError("retention argument is not of float type")
+        if not retention >= 0.0:
+            raise ValueError("retention argument is smaller than zero")
+        playback_speed = kwargs.get("playback_speed", 1.0)
+        if not isinstance(playback_speed, float):
+            raise TypeError("playback_speed argument is not of float type")
+        if not playback_speed > 0.0:
+            raise ValueError("playback_speed argument is not larger than zero")
+        playback_loop = kwargs.get("playback_loop", False)
+        if not isinstance(playback_loop, bool):
+            raise TypeError("playback_loop argument is not of bool type")
+        overview = kwargs.get("overview", False)
+        if not isinstance(overview, bool):
+            raise TypeError("overview argument is not of bool type")
+        canvas_labels = kwargs.get("canvas_labels", False)
+        if not isinstance(canvas_labels, bool):
+            raise TypeError("canvas_labels argument is not of bool type")
+        max_update_rate = kwargs.get("max_update_rate", 60)
+        if not isinstance(max_update_rate, int):
+            raise TypeError("max_update_rate argument is not of int type")
+        if not max_update_rate > 0:
+            raise ValueError("max_update_rate argument is not larger than zero")
         # marker options
         marker_font = kwargs.get("marker_font", ("default", 10))
         marker_background = kwargs.get("marker_background", "lightblue")
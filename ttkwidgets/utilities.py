@@ -55,3 +55,86 @@ def parse_geometry_string(string):
     e = e[1].split("+")
     h, x, y = map(int, e)
     return x, y, w, h
+
+
+_TREEVIEW_PROCS = """
+namespace eval ::ttkwidgets {}
+proc ::ttkwidgets::insert_many {w parent index rows options ids} {
+    set result {}
+    if {[llength $ids] == 0} {
+        foreach values $rows {
+            lappend result [$w insert $parent $index -values $values {*}$options]
+            if {$index ne "end"} {incr index}
+        }
+    } else {
+        foreach values $rows id $ids {
+            lappend result [$w insert $parent $index -id $id -values $values {*}$options]
+            if {$index ne "end"} {incr index}
+        }
+    }
+    return $result
+}
+proc ::ttkwidgets::column_values {w column items} {
+    set result {}
+    foreach id $items {
+        lappend result [$w set $id $column]
+    }
+    return $result
+}
+"""
+
+
+def _define_treeview_procs(tree):
+    """Define the Tcl procedures used by the treeview_* functions if needed"""
+    if not tree.tk.call("info", "commands", "::ttkwidgets::insert_many"):
+        tree.tk.eval(_TREEVIEW_PROCS)
+
+
+def treeview_insert_many(tree, parent, rows, index="end", iids=None, **kw):
+    """
+    Insert many items in a :class:`ttk.Treeview` with a single Tcl call
+
+    The items are inserted by a Tcl procedure, so there is a single
+    round-trip between Python and Tcl and the Treeview is only redrawn
+    once, when Tk is idle again.
+
+    :param tree: Treeview to insert the items in
+    :type tree: ttk.Treeview
+    :param parent: identifier of the parent item
+    :type parent: str
+    :param rows: values of the items
+    :type rows: iterable[sequence]
+    :param index: where in the list of parent's children to insert the first item
+    :type index: int or "end"
+    :param iids: item identifiers, generated by the Treeview if None
+    :type iids: sequence[str]
+    :param kw: options of all items, see :meth:`ttk.Treeview.insert`
+    :return: the item identifiers of the new items
+    :rtype: tuple[str]
+    """
+    _define_treeview_procs(tree)
+    rows = tuple(tuple(row) for row in rows)
+    if iids is not None and len(iids) != len(rows):
+        raise ValueError("iids argument does not have the same length as rows")
+    options = []
+    for key, value in kw.items():
+        options.extend(("-" + key, value))
+    result = tree.tk.call("::ttkwidgets::insert_many", tree, parent, index, rows, tuple(options), tuple(iids or ()))
+    return tree.tk.splitlist(result)
+
+
+def treeview_column_values(tree, column, items):
+    """
+    Return the values of many items in a column of a :class:`ttk.Treeview` with a single Tcl call
+
+    :param tree: Treeview containing the items
+    :type tree: ttk.Treeview
+    :param column: column's identifier
+    :type column: str
+    :param items: item identifiers
+    :type items: sequence[str]
+    :return: the values of the items in column
+    :rtype: tuple
+    """
+    _define_treeview_procs(tree)
+    return tree.tk.splitlist(tree.tk.call("::ttkwidgets::column_values", tree, column, tuple(items)))